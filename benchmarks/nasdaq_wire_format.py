@@ -0,0 +1,99 @@
+"""
+Compare the 'json' and 'csv' wire formats of the Nasdaq readers on long series.
+
+Every response body is downloaded once, then replayed from memory, so only
+the parse path of the readers is measured. Timings and peak memory come from
+separate passes, as tracemalloc's allocation hooks slow down the many small
+objects of the json path much more than the csv path.
+
+Usage
+-----
+NASDAQ_API_KEY=abc123 python benchmarks/nasdaq_wire_format.py
+"""
+import io
+import os
+import tracemalloc
+from time import perf_counter
+
+import requests
+
+from fi_pye.readers.nasdaq.lbma import LBMA
+from fi_pye.readers.nasdaq.us_treasury import USTreasury
+
+REPEATS = 5
+
+
+def request_key(url, kwargs):
+    """ """
+    return url, tuple(sorted((kwargs.get("params") or {}).items()))
+
+
+class RecordingSession(requests.Session):
+    """Session keeping the body of every response, by request."""
+
+    def __init__(self):
+        super().__init__()
+        self.bodies = {}
+
+    def get(self, url, **kwargs):
+        kwargs.pop("stream", None)
+        response = super().get(url, **kwargs)
+        self.bodies[request_key(url, kwargs)] = response.content
+        response.raw = io.BytesIO(response.content)
+        return response
+
+
+class ReplaySession(requests.Session):
+    """Session answering every request with a recorded body, without touching the network."""
+
+    def __init__(self, bodies):
+        super().__init__()
+        self.bodies = bodies
+
+    def get(self, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = self.bodies[request_key(url, kwargs)]
+        response.raw = io.BytesIO(response._content)
+        return response
+
+
+def read(reader_cls, method, wire_format, session):
+    """ """
+    reader = reader_cls(apikey=os.environ["NASDAQ_API_KEY"], format=wire_format, session=session)
+    return getattr(reader, method)(limit=None)
+
+
+def time_read(reader_cls, method, wire_format):
+    """Return the best parse time and the peak traced memory of a full-history read."""
+    recorder = RecordingSession()
+    data = read(reader_cls, method, wire_format, recorder)
+    session = ReplaySession(recorder.bodies)
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = perf_counter()
+        read(reader_cls, method, wire_format, session)
+        best = min(best, perf_counter() - start)
+
+    tracemalloc.start()
+    read(reader_cls, method, wire_format, session)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return best, peak, len(data)
+
+
+def main():
+    for reader_cls, method in [(LBMA, "gold_price"), (LBMA, "silver_price"), (USTreasury, "yield_curve")]:
+        for wire_format in ["json", "csv"]:
+            seconds, peak, rows = time_read(reader_cls, method, wire_format)
+            print(
+                f"{reader_cls.__name__}.{method:<12} {wire_format:<5} rows={rows:<7} "
+                f"best={seconds:.3f}s peak={peak / 2 ** 20:.1f}MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
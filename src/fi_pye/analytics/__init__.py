@@ -0,0 +1,8 @@
+from .quote_history import QuoteHistory
+from .yield_curve import (
+    CurveFitter,
+    breakeven_inflation,
+    interpolate_curves,
+    nelson_siegel_parameters,
+    tenor_to_years,
+)
@@ -0,0 +1,293 @@
+import re
+import numpy as np
+import pandas as pd
+
+VALID_CURVE_METHODS = ["linear", "pchip", "nelson_siegel"]
+
+# Decay times (in years) searched when fitting Nelson-Siegel curves.
+NELSON_SIEGEL_TAUS = np.linspace(0.25, 10.0, 40)
+
+_TENOR_UNITS = {"MO": 1 / 12, "MONTH": 1 / 12, "WK": 1 / 52, "WEEK": 1 / 52, "YR": 1.0, "YEAR": 1.0}
+
+
+def tenor_to_years(tenor: str) -> float:
+    """
+    Convert a Nasdaq / US Treasury tenor column name (Ex. '1 MO', '10 YR')
+    to a maturity in years.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([A-Za-z]+?)S?\s*", str(tenor).upper())
+    if match is None or match.group(2) not in _TENOR_UNITS:
+        raise ValueError(f"Invalid tenor: {tenor}. Tenors look like '1 MO', '6 MO' or '10 YR'. ")
+
+    return float(match.group(1)) * _TENOR_UNITS[match.group(2)]
+
+
+def _as_wide(curves):
+    """
+    Normalize a USTreasury curve DataFrame (either format) into a float
+    DataFrame indexed by date (ascending), with maturities in years as columns.
+    """
+    if not isinstance(curves, pd.DataFrame):
+        raise TypeError(f"Invalid curves type: {type(curves)}. curves must be of type pandas.DataFrame. ")
+
+    if not isinstance(curves.index, pd.DatetimeIndex):
+        curves = curves.set_index(pd.DatetimeIndex(curves[curves.columns[0]], name=curves.columns[0]))
+        curves = curves.drop(columns=curves.index.name)
+
+    out = curves.astype(float)
+    out.columns = [tenor_to_years(c) if not isinstance(c, (int, float)) else float(c) for c in out.columns]
+
+    return out.sort_index(axis=0).sort_index(axis=1)
+
+
+def _validate_method(value):
+    """ """
+    if value not in VALID_CURVE_METHODS:
+        raise ValueError(f"Invalid method: {value}. Valid curve methods include: {VALID_CURVE_METHODS}. ")
+
+    return value
+
+
+def _pchip_slopes(x, y):
+    """Fritsch-Carlson (monotone cubic) knot slopes for every row of 'y' at once."""
+    h = np.diff(x)
+    delta = np.diff(y, axis=1) / h
+
+    if len(x) == 2:
+        return np.repeat(delta, 2, axis=1)
+
+    slopes = np.zeros_like(y)
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    same_sign = delta[:, :-1] * delta[:, 1:] > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        harmonic = (w1 + w2) / (w1 / delta[:, :-1] + w2 / delta[:, 1:])
+    slopes[:, 1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    for end, (h0, h1, d0, d1) in {
+        0: (h[0], h[1], delta[:, 0], delta[:, 1]),
+        -1: (h[-1], h[-2], delta[:, -1], delta[:, -2]),
+    }.items():
+        edge = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+        edge = np.where(np.sign(edge) != np.sign(d0), 0.0, edge)
+        edge = np.where((np.sign(d0) != np.sign(d1)) & (np.abs(edge) > np.abs(3 * d0)), 3 * d0, edge)
+        slopes[:, end] = edge
+
+    return slopes
+
+
+def _interpolate_block(x, y, maturities, method):
+    """Interpolate every row of 'y' (knots 'x', no missing values) at 'maturities'."""
+    out = np.full((y.shape[0], len(maturities)), np.nan)
+    if len(x) < 2:
+        return out
+
+    inside = (maturities >= x[0]) & (maturities <= x[-1])
+    t = maturities[inside]
+    i = np.clip(np.searchsorted(x, t, side="right") - 1, 0, len(x) - 2)
+    h = x[i + 1] - x[i]
+    s = t - x[i]
+    delta = (y[:, i + 1] - y[:, i]) / h
+
+    if method == "linear":
+        out[:, inside] = y[:, i] + s * delta
+    else:
+        slopes = _pchip_slopes(x, y)
+        c2 = (3 * delta - 2 * slopes[:, i] - slopes[:, i + 1]) / h
+        c3 = (slopes[:, i] + slopes[:, i + 1] - 2 * delta) / h ** 2
+        out[:, inside] = y[:, i] + s * (slopes[:, i] + s * (c2 + s * c3))
+
+    return out
+
+
+def _nelson_siegel_loadings(maturities, tau):
+    """Nelson-Siegel factor loadings (level, slope, curvature) at the given maturities."""
+    m = np.asarray(maturities, dtype=float) / tau
+    slope = (1 - np.exp(-m)) / m
+    return np.column_stack([np.ones_like(m), slope, slope - np.exp(-m)])
+
+
+def _nelson_siegel_block(x, y, taus):
+    """
+    Fit Nelson-Siegel parameters to every row of 'y' (knots 'x', no missing
+    values) at once: for each candidate tau, the betas of all rows are a
+    single least squares solve, and each row keeps its best tau.
+    """
+    params = np.full((y.shape[0], 4), np.nan)
+    if len(x) < 3:
+        return params
+
+    best_sse = np.full(y.shape[0], np.inf)
+    for tau in taus:
+        loadings = _nelson_siegel_loadings(x, tau)
+        betas = np.linalg.lstsq(loadings, y.T, rcond=None)[0]
+        sse = ((loadings @ betas - y.T) ** 2).sum(axis=0)
+        better = sse < best_sse
+        best_sse[better] = sse[better]
+        params[better, :3] = betas.T[better]
+        params[better, 3] = tau
+
+    return params
+
+
+def _by_missing_pattern(wide):
+    """
+    Yield (row positions, knot mask) for each distinct pattern of available
+    tenors. Tenors were added / suspended over the years, so a history has
+    few distinct patterns and each one can be fitted as a single block.
+    """
+    valid = wide.notna().to_numpy()
+    patterns, inverse = np.unique(valid, axis=0, return_inverse=True)
+    for p, pattern in enumerate(patterns):
+        yield np.flatnonzero(inverse.ravel() == p), pattern
+
+
+def nelson_siegel_parameters(curves, taus=None):
+    """Fit Nelson-Siegel curves to a whole yield curve history.
+
+    Parameters
+    ----------
+    curves :
+        Wide DataFrame of yields by date and tenor (Ex. USTreasury.yield_curve)
+    taus : default = NELSON_SIEGEL_TAUS
+        Candidate decay times (in years) searched for each date.
+
+    Return
+    -------
+    object : pandas.DataFrame
+        'beta0' (level), 'beta1' (slope), 'beta2' (curvature) and 'tau' by date.
+    """
+    wide = _as_wide(curves)
+    taus = NELSON_SIEGEL_TAUS if taus is None else np.asarray(taus, dtype=float)
+    x, y = wide.columns.to_numpy(dtype=float), wide.to_numpy()
+
+    params = np.full((len(wide), 4), np.nan)
+    for rows, pattern in _by_missing_pattern(wide):
+        params[rows] = _nelson_siegel_block(x[pattern], y[np.ix_(rows, pattern)], taus)
+
+    return pd.DataFrame(params, index=wide.index, columns=["beta0", "beta1", "beta2", "tau"])
+
+
+def interpolate_curves(curves, maturities=None, method: str = "linear", taus=None):
+    """Interpolate a whole yield curve history at once.
+
+    Parameters
+    ----------
+    curves :
+        Wide DataFrame of yields by date and tenor (Ex. USTreasury.yield_curve)
+    maturities : default = None
+        Maturities (in years) to evaluate the curves at. Defaults to the tenors of 'curves'.
+    method : default = 'linear'
+        'linear', 'pchip' (monotone cubic) or 'nelson_siegel'.
+    taus : default = None
+        Candidate Nelson-Siegel decay times (only used by 'nelson_siegel').
+
+    Return
+    -------
+    object : pandas.DataFrame
+        Yields by date (index) and maturity in years (columns). Linear and pchip
+        curves are not extrapolated, so maturities outside a date's tenors are NaN.
+    """
+    method = _validate_method(method)
+    wide = _as_wide(curves)
+    maturities = wide.columns.to_numpy(dtype=float) if maturities is None else np.sort(np.asarray(maturities, dtype=float))
+
+    if method == "nelson_siegel":
+        params = nelson_siegel_parameters(wide, taus=taus).to_numpy()
+        out = np.full((len(wide), len(maturities)), np.nan)
+        for tau in np.unique(params[~np.isnan(params[:, 3]), 3]):
+            rows = params[:, 3] == tau
+            out[rows] = params[rows, :3] @ _nelson_siegel_loadings(maturities, tau).T
+    else:
+        x, y = wide.columns.to_numpy(dtype=float), wide.to_numpy()
+        out = np.full((len(wide), len(maturities)), np.nan)
+        for rows, pattern in _by_missing_pattern(wide):
+            out[rows] = _interpolate_block(x[pattern], y[np.ix_(rows, pattern)], maturities, method)
+
+    return pd.DataFrame(out, index=wide.index, columns=maturities)
+
+
+def breakeven_inflation(nominal, real, method: str = "linear"):
+    """Breakeven inflation implied by the nominal and real yield curves.
+
+    The nominal curves are interpolated at the real curve tenors, and the
+    real yields are subtracted from them on the dates both curves share.
+
+    Parameters
+    ----------
+    nominal :
+        Wide DataFrame of nominal yields (Ex. USTreasury.yield_curve)
+    real :
+        Wide DataFrame of real yields (Ex. USTreasury.real_yield_curve)
+    method : default = 'linear'
+        Curve method used to interpolate the nominal curves.
+
+    Return
+    -------
+    object : pandas.DataFrame
+        Breakeven inflation by date (index) and maturity in years (columns).
+    """
+    real = _as_wide(real)
+    nominal = interpolate_curves(nominal, maturities=real.columns, method=method)
+    dates = nominal.index.intersection(real.index)
+
+    return nominal.loc[dates] - real.loc[dates]
+
+
+class CurveFitter:
+    """
+    Incrementally fit a yield curve history.
+
+    Curves for dates before today never change, so once fitted they are
+    cached and later calls to 'fit' only fit the dates not seen before
+    (Ex. the latest rows of a daily USTreasury.yield_curve refresh).
+
+    Examples
+    --------
+    >>> fitter = CurveFitter(method="pchip", maturities=[0.25, 2, 5, 10, 30])
+    >>> history = fitter.fit(us_treasury.yield_curve(limit=None))
+    >>> history = fitter.fit(us_treasury.yield_curve(limit=5)) # Only new dates are fitted.
+    """
+    __slots__ = "method", "maturities", "taus", "_cache"
+
+    def __init__(self, method: str = "linear", maturities=None, taus=None):
+        """
+        Parameters
+        ----------
+        method : default = 'linear'
+            'linear', 'pchip' (monotone cubic) or 'nelson_siegel'.
+        maturities : default = None
+            Maturities (in years) to evaluate the curves at. Defaults to the tenors of the first fit.
+        taus : default = None
+            Candidate Nelson-Siegel decay times (only used by 'nelson_siegel').
+        """
+        self.method = _validate_method(method)
+        self.maturities = None if maturities is None else np.sort(np.asarray(maturities, dtype=float))
+        self.taus = taus
+        self._cache = None
+
+    def fit(self, curves):
+        """Fit the curves of every date in 'curves', reusing cached past dates.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            Yields by date (index) and maturity in years (columns).
+        """
+        wide = _as_wide(curves)
+        if self.maturities is None:
+            self.maturities = wide.columns.to_numpy(dtype=float)
+
+        if self._cache is None:
+            cached = pd.DataFrame(columns=self.maturities, index=pd.DatetimeIndex([]), dtype=float)
+        else:
+            cached = self._cache.loc[self._cache.index.isin(wide.index)]
+
+        pending = wide.loc[~wide.index.isin(cached.index)]
+        fitted = interpolate_curves(pending, maturities=self.maturities, method=self.method, taus=self.taus)
+
+        settled = fitted.loc[fitted.index < pd.Timestamp.today().normalize()]
+        if len(settled) > 0:
+            self._cache = settled if self._cache is None else pd.concat([self._cache, settled]).sort_index()
+
+        return pd.concat([cached, fitted]).sort_index() if len(cached) > 0 else fitted
@@ -0,0 +1,126 @@
+import time
+
+import aiohttp
+
+from typing import Union
+
+from fi_pye.readers.timeouts import (
+    CONNECTION_TIMEOUT,
+    DEFAULT_TIMEOUTS,
+    READ_TIMEOUT,
+)
+
+
+def create_session(max_connections: int = 10) -> aiohttp.ClientSession:
+    """
+    Create the aiohttp session shared by async readers.
+
+    Every async reader given this session draws its connections from the
+    same pool, and 'max_connections' caps the number of requests that are
+    in flight at once across all of them. Must be called from a running
+    event loop.
+
+    Parameters
+    ----------
+    max_connections : default = 10
+        Maximum number of concurrent connections.
+
+    Return
+    -------
+    object : aiohttp.ClientSession
+        aiohttp.ClientSession
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=max_connections),
+        timeout=aiohttp.ClientTimeout(connect=CONNECTION_TIMEOUT, sock_read=READ_TIMEOUT),
+    )
+
+
+def _init_async_session(session=None):
+    """Initialize aiohttp session. """
+    if session is None:
+        session = create_session()
+    else:
+        if not isinstance(session, aiohttp.ClientSession):
+            raise TypeError("session must be an aiohttp.ClientSession")
+
+    return session
+
+
+def _clean_params(params: dict[str, Union[str, int, None]] | None):
+    """aiohttp only accepts str / int / float params, so drop unset (None) ones and stringify the rest."""
+    if params is None:
+        return None
+
+    return {
+        key: str(value).lower() if isinstance(value, bool) else value
+        for key, value in params.items()
+        if value is not None
+    }
+
+
+class ResponseStatusError(IOError):
+    """Raised when an async request gets a response that isn't an okay code."""
+
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+
+async def _get_bytes(session, url, params=None, headers=None, timeout=None) -> bytes:
+    """ """
+    if timeout is not None:
+        connect, read = timeout
+        timeout = aiohttp.ClientTimeout(connect=connect, sock_read=read)
+
+    async with session.get(
+        url, params=_clean_params(params), headers=headers, timeout=timeout
+    ) as response:
+        if response.status != 200:
+            raise ResponseStatusError(
+                f"Response: {response.status} {response.reason} isn't an okay code. Request url: {url} .",
+                status=response.status,
+            )
+
+        return await response.read()
+
+
+class AsyncReaderMixin:
+    """Plumbing shared by the asyncio readers (session lifetime and guarded requests)."""
+    __slots__ = ()
+
+    def close(self):
+        """The shared aiohttp session outlives requests; use 'aclose' to close it."""
+        ...
+
+    async def aclose(self):
+        """Close aiohttp session."""
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _fetch(self, url, params=None, headers=None) -> bytes:
+        """
+        Request the body of a url with the reader's timeout policy, through
+        its circuit breaker if it has one.
+        """
+        prefix = self._endpoint_prefix(url, params)
+        timeouts = getattr(self, "timeouts", None) or DEFAULT_TIMEOUTS
+
+        async def timed_request():
+            start = time.perf_counter()
+            content = await _get_bytes(
+                self.session, url, params, headers, timeouts.timeout(self.provider, prefix)
+            )
+            timeouts.observe(self.provider, prefix, time.perf_counter() - start)
+            return content
+
+        circuit_breaker = getattr(self, "circuit_breaker", None)
+        if circuit_breaker is None:
+            return await timed_request()
+
+        return await circuit_breaker.acall(self.provider, prefix, timed_request)
@@ -1,5 +1,9 @@
+import time
+
 from abc import ABC, abstractmethod
 
+from fi_pye.readers.timeouts import DEFAULT_TIMEOUTS
+
 
 class BaseReader(ABC):
     """Base 'Reader' to establish child class interface and instantiation."""
@@ -16,3 +20,35 @@ class BaseReader(ABC):
     def data(self, *args, **kwargs):
         """ """
         ...
+
+    def _send(self, url, params, request, hedge: bool = False):
+        """
+        Send a request (a callable taking the (connect, read) timeout and
+        returning a response) with the reader's timeout policy, through its
+        circuit breaker if it has one. With 'hedge', idempotent requests are
+        hedged by the reader's hedging policy, if it has one.
+        """
+        prefix = self._endpoint_prefix(url, params)
+        timeouts = getattr(self, "timeouts", None) or DEFAULT_TIMEOUTS
+        hedging = getattr(self, "hedging", None) if hedge else None
+
+        def timed_request():
+            start = time.perf_counter()
+            timeout = timeouts.timeout(self.provider, prefix)
+            if hedging is None:
+                response = request(timeout)
+            else:
+                response = hedging.send(self.provider, prefix, lambda: request(timeout))
+
+            timeouts.observe(self.provider, prefix, time.perf_counter() - start)
+            return response
+
+        circuit_breaker = getattr(self, "circuit_breaker", None)
+        if circuit_breaker is None:
+            return timed_request()
+
+        return circuit_breaker.call(self.provider, prefix, timed_request)
+
+    def _endpoint_prefix(self, url, params):
+        """Endpoint prefix timeouts and circuit breakers track a request under."""
+        return url
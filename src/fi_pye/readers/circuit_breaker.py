@@ -0,0 +1,203 @@
+import logging
+import threading
+import time
+import pandas as pd
+
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(IOError):
+    """Raised instead of sending a request to an endpoint whose circuit is open."""
+
+
+class _Circuit:
+    """State of the circuit of one (provider, endpoint prefix)."""
+    __slots__ = "outcomes", "state", "opened_at", "probing"
+
+    def __init__(self, window):
+        self.outcomes = deque(maxlen=window)
+        self.state = CLOSED
+        self.opened_at = None
+        self.probing = False
+
+
+def _is_failure(response=None, error=None) -> bool:
+    """
+    Server errors (5xx), rate limiting (429), timeouts and connection errors
+    count as failures; other client errors (Ex. 403 for free api keys) are
+    the caller's fault and don't.
+    """
+    status = getattr(error if error is not None else response, "status_code", None)
+    if status is None:
+        status = getattr(error if error is not None else response, "status", None)
+
+    if status is None:
+        return error is not None
+
+    return status >= 500 or status == 429
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by readers, tracked per provider and endpoint prefix.
+
+    Once at least 'min_calls' of the last 'window' requests to an endpoint
+    prefix (Ex. FMP 'quote', Nasdaq 'datasets/ML') were sent, and the share
+    of them that failed reaches 'failure_rate', the circuit opens: requests
+    to that prefix raise CircuitOpenError at once instead of waiting on
+    timeouts. After 'reset_timeout' seconds the circuit half-opens and lets
+    a single probe request through; its outcome closes or re-opens it.
+
+    Examples
+    --------
+    >>> breaker = CircuitBreaker(failure_rate=0.5, reset_timeout=30)
+    >>> price = Price(apikey="abc123", circuit_breaker=breaker)
+    >>> us_treasury = USTreasury(apikey="abc123", circuit_breaker=breaker)
+    >>> breaker.states()
+    """
+    __slots__ = "failure_rate", "window", "min_calls", "reset_timeout", "on_state_change", "_circuits", "_lock"
+
+    def __init__(
+            self,
+            failure_rate: float = 0.5,
+            window: int = 20,
+            min_calls: int = 5,
+            reset_timeout: float = 30.0,
+            on_state_change=None,
+    ):
+        """
+        Parameters
+        ----------
+        failure_rate : default = 0.5
+            Share of failed requests (0-1] that opens a circuit.
+        window : default = 20
+            Number of most recent requests the failure rate is computed on.
+        min_calls : default = 5
+            Minimum number of requests in the window before a circuit can open.
+        reset_timeout : default = 30.0
+            Seconds an open circuit waits before half-opening.
+        on_state_change : default = None
+            Callable called with (provider, prefix, old state, new state) on transitions.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError(f"Invalid failure_rate: {failure_rate}. failure_rate must be in (0, 1]. ")
+
+        if not isinstance(window, int) or not isinstance(min_calls, int) or not 1 <= min_calls <= window:
+            raise ValueError(f"Invalid window: {window} / min_calls: {min_calls}. Need 1 <= min_calls <= window. ")
+
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self._circuits: dict[tuple[str, str], _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def call(self, provider: str, prefix: str, request):
+        """Send a request (a callable returning a response) through the circuit of (provider, prefix)."""
+        self._before(provider, prefix)
+        try:
+            response = request()
+        except Exception as e:
+            self._after(provider, prefix, _is_failure(error=e))
+            raise
+
+        self._after(provider, prefix, _is_failure(response=response))
+        return response
+
+    async def acall(self, provider: str, prefix: str, request):
+        """Await a request (a callable returning an awaitable) through the circuit of (provider, prefix)."""
+        self._before(provider, prefix)
+        try:
+            response = await request()
+        except Exception as e:
+            self._after(provider, prefix, _is_failure(error=e))
+            raise
+
+        self._after(provider, prefix, _is_failure(response=response))
+        return response
+
+    def state(self, provider: str, prefix: str) -> str:
+        """State ('closed', 'open' or 'half_open') of the circuit of (provider, prefix)."""
+        with self._lock:
+            circuit = self._circuits.get((provider, prefix))
+            return CLOSED if circuit is None else circuit.state
+
+    def states(self) -> pd.DataFrame:
+        """
+        Return the state of every circuit, along with the number of requests
+        and failures in its window and when it last opened.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        with self._lock:
+            rows = [
+                {
+                    "provider": provider,
+                    "prefix": prefix,
+                    "state": circuit.state,
+                    "calls": len(circuit.outcomes),
+                    "failures": sum(circuit.outcomes),
+                    "opened_at": pd.Timestamp.fromtimestamp(circuit.opened_at) if circuit.opened_at else None,
+                }
+                for (provider, prefix), circuit in self._circuits.items()
+            ]
+
+        return pd.DataFrame(rows, columns=["provider", "prefix", "state", "calls", "failures", "opened_at"])
+
+    def reset(self):
+        """Close every circuit and forget its history."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _before(self, provider, prefix):
+        """ """
+        with self._lock:
+            circuit = self._circuits.setdefault((provider, prefix), _Circuit(self.window))
+
+            if circuit.state == OPEN and time.time() - circuit.opened_at >= self.reset_timeout:
+                self._transition(provider, prefix, circuit, HALF_OPEN)
+
+            if circuit.state == OPEN or (circuit.state == HALF_OPEN and circuit.probing):
+                raise CircuitOpenError(
+                    f"Circuit for {provider} endpoint: {prefix} is {circuit.state}; "
+                    f"failing fast until the endpoint recovers. "
+                )
+
+            if circuit.state == HALF_OPEN:
+                circuit.probing = True
+
+    def _after(self, provider, prefix, failed):
+        """ """
+        with self._lock:
+            circuit = self._circuits[(provider, prefix)]
+
+            if circuit.state == HALF_OPEN:
+                circuit.probing = False
+                circuit.outcomes.clear()
+                self._transition(provider, prefix, circuit, OPEN if failed else CLOSED)
+                return
+
+            circuit.outcomes.append(failed)
+            calls = len(circuit.outcomes)
+            if circuit.state == CLOSED and calls >= self.min_calls and sum(circuit.outcomes) / calls >= self.failure_rate:
+                self._transition(provider, prefix, circuit, OPEN)
+
+    def _transition(self, provider, prefix, circuit, state):
+        """ """
+        old, circuit.state = circuit.state, state
+        if state == OPEN:
+            circuit.opened_at = time.time()
+
+        log = logging.warning if state == OPEN else logging.info
+        log(f"Circuit for {provider} endpoint: {prefix} went from {old} to {state}. ")
+
+        if self.on_state_change is not None:
+            self.on_state_change(provider, prefix, old, state)
@@ -1,6 +1,8 @@
 from .analysts import Analysts
 from .calendars import Calendars
+from .cik_index import CikIndex
 from .company_info import CompanyInformation
+from .dated_cache import FmpDatedCache
 from .etfs import ExchangeTradedFunds
 from .filings import Filings
 from .fundamental_analysis import FundamentalAnalysis
@@ -9,10 +11,12 @@ from .holders import Holders
 from .indexes import Indexes
 from .insiders import Insiders
 from .institutions import Institutions
+from .list_cache import FmpListCache
 from .mutual_funds import MutualFunds
 from .news import News
 from .ownership import Ownership
 from .performance import Performance
+from .poller import QuoteDelta, QuotePoller
 from .price import Price
 from .private_companies import PrivateCompanies
 from .quote import Quotes
@@ -20,4 +24,6 @@ from .rss import RSS
 from .senators import Senators
 from .sentiment import Sentiment
 from .sic import SIC
+from .symbol_index import SymbolIndex
 from .symbols import Symbols
+from .universe import SymbolUniverse
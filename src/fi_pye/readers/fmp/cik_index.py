@@ -0,0 +1,238 @@
+import requests
+import threading
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+from fi_pye.readers.circuit_breaker import CircuitOpenError
+from fi_pye.readers.fmp.company_info import CompanyInformation
+from fi_pye.readers.fmp.institutions import Institutions
+from fi_pye.readers.fmp.list_cache import FmpListCache
+from fi_pye.readers.fmp.utils import SYMBOL_LISTS, _format_multiple_symbols
+
+PROFILES_LIST = "cik_profiles"  # Name of the (symbol, cik, name) rows of resolved profiles in the cache.
+PROFILE_BATCH_SIZE = 100
+
+
+def _normalize_cik(cik: Union[str, int]) -> str:
+    """CIKs are compared as 10 digit, zero padded strings (Ex. 320193 -> '0000320193')."""
+    digits = "".join(c for c in str(cik) if c.isdigit())
+    if not digits:
+        raise ValueError(f"Invalid cik: {cik}. A CIK is a number of up to 10 digits. ")
+
+    return digits.zfill(10)
+
+
+def _normalize_name(name: str) -> str:
+    """ """
+    return " ".join(str(name).casefold().split())
+
+
+class CikIndex:
+    """
+    In-memory CIK <-> symbol <-> name lookup index.
+
+    Institutions (institution_list) give CIK <-> name, company profiles
+    give symbol <-> CIK <-> name and the Symbols lists give symbol <-> name.
+    The lists are kept in a FmpListCache, so the index persists between
+    processes; refreshing only re-indexes lists whose content changed, and
+    'resolve' fetches (in batches, concurrently) and stores the profiles
+    of the symbols not resolved yet. Every lookup is a dict access.
+
+    Examples
+    --------
+    >>> index = CikIndex(
+    ...     institutions=Institutions(apikey="abc123"),
+    ...     company_information=CompanyInformation(apikey="abc123"),
+    ... )
+    >>> index.resolve(["AAPL", "MSFT"])
+    >>> index.cik("AAPL")
+    '0000320193'
+    >>> index.symbol("320193")
+    'AAPL'
+    >>> index.cik("berkshire hathaway inc")
+    '0001067983'
+    """
+    __slots__ = (
+        "institutions", "company_information", "cache", "_digests", "_profiles",
+        "_cik_by_symbol", "_symbol_by_cik", "_name_by_cik", "_name_by_symbol", "_cik_by_name", "_lock",
+    )
+
+    def __init__(
+            self,
+            institutions: Institutions | None = None,
+            company_information: CompanyInformation | None = None,
+            cache: FmpListCache | None = None,
+            refresh: bool = True,
+    ):
+        """
+        Parameters
+        ----------
+        institutions : default = None
+            Institutions reader used to fetch the (missing or stale) institution list.
+        company_information : default = None
+            CompanyInformation reader used to fetch the profiles of unresolved symbols.
+        cache : default = None
+            Cache of the lists; defaults to FmpListCache().
+        refresh : default = True
+            Build the index right away.
+        """
+        self.institutions = institutions
+        self.company_information = company_information
+        self.cache = cache or FmpListCache()
+        self._digests: dict[str, str] = {}
+        self._profiles = pd.DataFrame(columns=["symbol", "cik", "name"])
+        self._cik_by_symbol: dict[str, str] = {}
+        self._symbol_by_cik: dict[str, str] = {}
+        self._name_by_cik: dict[str, str] = {}
+        self._name_by_symbol: dict[str, str] = {}
+        self._cik_by_name: dict[str, str] = {}
+        self._lock = threading.Lock()
+        if refresh:
+            self.refresh()
+
+    def __len__(self):
+        return len(self._name_by_cik)
+
+    def refresh(self) -> list[str]:
+        """
+        Reload the institution list (fetching it if it's missing or stale),
+        the cached Symbols lists and the stored profiles, and re-index the
+        ones that changed, which are returned.
+        """
+        sources = {"institution_list": None, **{name: None for name in SYMBOL_LISTS}, PROFILES_LIST: None}
+        if self.institutions is not None:
+            sources["institution_list"] = lambda: self.institutions.institution_list
+
+        changed = []
+        for name, fetch in sources.items():
+            if fetch is not None:
+                records, digest = self.cache.load(name, fetch)
+            else:
+                cached = self.cache.get(name, ttl=float("inf"))
+                if cached is None:
+                    continue
+
+                records, digest = cached
+
+            if self._digests.get(name) != digest:
+                self._index(name, records)
+                self._digests[name] = digest
+                changed.append(name)
+
+        return changed
+
+    def resolve(self, symbols: list[str], max_workers: int = 4) -> pd.DataFrame:
+        """
+        Resolve the CIK and name of 'symbols', fetching (and storing) the
+        profiles of the ones not resolved yet.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe of the symbols' symbol, cik and name.
+        """
+        symbols = _format_multiple_symbols(symbols).split(",")
+        # Symbols FMP has no profile for stay missing (and are asked for again next time).
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in self._cik_by_symbol]
+        if missing:
+            if self.company_information is None:
+                raise ValueError(
+                    f"Unresolved symbols: {missing}. A CompanyInformation reader is needed to fetch their profiles. "
+                )
+
+            batches = [missing[i:i + PROFILE_BATCH_SIZE] for i in range(0, len(missing), PROFILE_BATCH_SIZE)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                profiles = list(executor.map(self._fetch_profiles, batches))
+
+            self.add_profiles(pd.concat(profiles, ignore_index=True))
+
+        return pd.DataFrame({
+            "symbol": symbols,
+            "cik": [self._cik_by_symbol.get(symbol) for symbol in symbols],
+            "name": [self._name_by_symbol.get(symbol) for symbol in symbols],
+        })
+
+    def add_profiles(self, profiles: pd.DataFrame):
+        """Index and store company profiles (with 'symbol', 'cik' and 'companyName' columns)."""
+        profiles = profiles.astype(object).where(profiles.notna(), None)
+        rows = pd.DataFrame({
+            "symbol": profiles["symbol"].astype(str).str.upper(),
+            "cik": profiles["cik"],
+            "name": profiles["companyName"] if "companyName" in profiles else profiles.get("name"),
+        })  # Profiles without a CIK (Ex. most ETFs) are kept, so they aren't fetched again.
+
+        with self._lock:
+            self._profiles = pd.concat([self._profiles, rows], ignore_index=True).drop_duplicates(
+                "symbol", keep="last", ignore_index=True
+            )
+            self._digests[PROFILES_LIST] = self.cache.set(PROFILES_LIST, self._profiles)
+
+        self._index_rows(rows["symbol"], rows["cik"], rows["name"])
+
+    def cik(self, symbol_or_name: str) -> str | None:
+        """CIK of a symbol, or of an exact (case-insensitive) company / institution name."""
+        return self._cik_by_symbol.get(symbol_or_name.upper()) or self._cik_by_name.get(_normalize_name(symbol_or_name))
+
+    def symbol(self, cik: Union[str, int]) -> str | None:
+        """Symbol of a CIK (if the company is listed and resolved)."""
+        return self._symbol_by_cik.get(_normalize_cik(cik))
+
+    def name(self, cik_or_symbol: Union[str, int]) -> str | None:
+        """Company / institution name of a CIK or symbol."""
+        if isinstance(cik_or_symbol, str) and not cik_or_symbol.isdigit():
+            return self._name_by_symbol.get(cik_or_symbol.upper())
+
+        return self._name_by_cik.get(_normalize_cik(cik_or_symbol))
+
+    def _fetch_profiles(self, symbols):
+        """ """
+        try:
+            return self.company_information.data(
+                url_version="v3",
+                path=f"profile/{','.join(symbols)}",
+                params=None,
+            )
+        except (requests.RequestException, CircuitOpenError):
+            raise
+
+        except IOError:
+            return pd.DataFrame(columns=["symbol", "cik", "companyName"])  # None of the symbols has a profile.
+
+    def _index(self, name, records):
+        """ """
+        if records.empty:
+            return
+
+        if name == "institution_list":
+            records = records.dropna(subset=["cik"])
+            self._index_rows(None, records["cik"], records["name"])
+        elif name == PROFILES_LIST:
+            with self._lock:
+                self._profiles = records
+            self._index_rows(records["symbol"], records["cik"], records["name"])
+        elif "name" in records:
+            names = records["name"].where(records["name"].notna(), None)
+            with self._lock:
+                for symbol, company in zip(records["symbol"].astype(str).str.upper(), names):
+                    if company:
+                        self._name_by_symbol.setdefault(symbol, company)
+
+    def _index_rows(self, symbols, ciks, names):
+        """ """
+        ciks = [None if cik is None or pd.isna(cik) else _normalize_cik(cik) for cik in ciks]
+        names = [None if company is None or pd.isna(company) else company for company in names]
+        with self._lock:
+            for cik, company in zip(ciks, names):
+                if cik is not None and company:
+                    self._name_by_cik[cik] = company
+                    self._cik_by_name[_normalize_name(company)] = cik
+
+            if symbols is not None:
+                for symbol, cik, company in zip(symbols, ciks, names):
+                    self._cik_by_symbol[symbol] = cik
+                    if cik is not None:
+                        self._symbol_by_cik.setdefault(cik, symbol)
+                    if company:
+                        self._name_by_symbol[symbol] = company
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import pandas as pd
+
+from typing import Union
+
+DEFAULT_SETTLE_DAYS = 90
+
+
+def _request_key(url: str, params: dict[str, Union[str, int]]) -> str:
+    """Key a request by its url and params, without the 'apikey' (so keys can be rotated)."""
+    params = {k: v for k, v in params.items() if k != "apikey"}
+    return hashlib.sha256(json.dumps([url, params], sort_keys=True, default=str).encode()).hexdigest()
+
+
+class FmpDatedCache:
+    """
+    Permanent cache of FMP responses for past report dates (Ex. ETF and
+    mutual fund holdings, institutional portfolios and ownership).
+
+    Once a report date is older than 'settle_days' (the time filings of a
+    period take to come in), its responses never change, so they are
+    stored without expiry, and so is the lack of a response (a request
+    that returned no data). Bodies are stored zlib compressed in a SQLite
+    database and addressed by the digest of their content: requests
+    answered by the same body (Ex. the same portfolio under its symbol and
+    its CIK) share one copy.
+
+    Examples
+    --------
+    >>> cache = FmpDatedCache()
+    >>> etfs = ExchangeTradedFunds(apikey="abc123", dated_cache=cache)
+    >>>
+    >>> holdings = etfs.portfolio_holdings("SPY", "2022-06-30") # Downloaded
+    >>> holdings = etfs.portfolio_holdings("SPY", "2022-06-30") # Read from the cache
+    >>> etfs.warm_portfolio_holdings("SPY") # Every past date, concurrently
+    """
+    __slots__ = "path", "settle_days", "_connection", "_lock"
+
+    def __init__(self, path: str | None = None, settle_days: int = DEFAULT_SETTLE_DAYS):
+        """
+        Parameters
+        ----------
+        path : default = None
+            SQLite database file. Defaults to '~/.cache/fi_pye/fmp_dated.sqlite'.
+        settle_days : default = 90
+            Days after which the responses of a report date are final.
+        """
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".cache", "fi_pye", "fmp_dated.sqlite")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.path = path
+        self.settle_days = settle_days
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS requests "
+                "(key TEXT PRIMARY KEY, path TEXT, date TEXT, created REAL, digest TEXT)"
+            )
+            self._connection.execute("CREATE TABLE IF NOT EXISTS bodies (digest TEXT PRIMARY KEY, body BLOB)")
+
+    def is_final(self, date: str) -> bool:
+        """Whether the responses of report 'date' can be cached permanently."""
+        try:
+            date = pd.Timestamp(date)
+        except (TypeError, ValueError):
+            return False
+
+        return date.normalize() + pd.Timedelta(days=self.settle_days) < pd.Timestamp.today().normalize()
+
+    def get(self, url: str, params: dict[str, Union[str, int]]) -> pd.DataFrame | None:
+        """
+        Return the cached response of a request (an empty DataFrame if it
+        returned no data), or None if it's missing.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT bodies.body FROM requests JOIN bodies USING (digest) WHERE key = ?",
+                (_request_key(url, params),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return pd.DataFrame(json.loads(zlib.decompress(row[0])))
+
+    def set(self, url: str, params: dict[str, Union[str, int]], response: pd.DataFrame | None):
+        """Store the response of a request (None if it returned no data)."""
+        records = [] if response is None else response.to_dict("records")
+        body = json.dumps(records, default=str).encode()
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO bodies (digest, body) VALUES (?, ?)", (digest, zlib.compress(body))
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO requests (key, path, date, created, digest) VALUES (?, ?, ?, ?, ?)",
+                (_request_key(url, params), url.split("/api/", 1)[-1], str(params.get("date")), time.time(), digest),
+            )
+
+    def stats(self) -> pd.DataFrame:
+        """
+        Return the number of cached requests, distinct bodies and their
+        compressed size, by endpoint.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT path, COUNT(*), COUNT(DISTINCT digest), "
+                "(SELECT SUM(LENGTH(body)) FROM bodies WHERE digest IN "
+                "(SELECT digest FROM requests AS r WHERE r.path = requests.path)) "
+                "FROM requests GROUP BY path ORDER BY path"
+            ).fetchall()
+
+        return pd.DataFrame(rows, columns=["path", "requests", "bodies", "compressed_bytes"])
+
+    def close(self):
+        """Close the SQLite connection."""
+        self._connection.close()
@@ -1,3 +1,5 @@
+from fi_pye.readers.rate_limit import RateLimiter
+
 from .reader import FmpReader
 
 
@@ -14,6 +16,7 @@ class ExchangeTradedFunds(FmpReader):
     ----
     - Available dates (by symbol or CIK number)
     - Portfolio holdings (by symbol or CIK number)
+    - Warming the dated cache with the holdings of every available date
     - ETF specific data(expense ratio & country/sector weightings)
 
     Examples
@@ -157,7 +160,8 @@ class ExchangeTradedFunds(FmpReader):
             params={
                 "symbol": symbol.upper(),
                 "date": date
-            }
+            },
+            cache_date=date,
         )
 
     def portfolio_holdings_by_cik(self, cik: str, date: str):
@@ -191,7 +195,46 @@ class ExchangeTradedFunds(FmpReader):
             params={
                 "cik": cik,
                 "date": date,
-            }
+            },
+            cache_date=date,
+        )
+
+    def warm_portfolio_holdings(self, symbol: str, rate_limiter: RateLimiter | None = None, max_workers: int = 4):
+        """Query FMP / etf-holdings / API.
+
+        Download the portfolio holdings of a specified ETF (by symbol)
+        on every one of its available dates that is final into the
+        reader's dated cache (only the dates missing from it are
+        requested), so later 'portfolio_holdings' queries of those dates
+        are served from disk.
+
+        Parameters
+        ----------
+        symbol :
+            Exchange Traded Fund (ETF) ticker symbol
+        rate_limiter : default = None
+            Limiter every request waits on.
+        max_workers : default = 4
+            Number of dates fetched concurrently.
+
+        Return
+        -------
+        object : list[str]
+            Cached dates.
+
+        Example
+        -------
+        >>> etfs = ExchangeTradedFunds(apikey="abc123", dated_cache=FmpDatedCache())
+        >>> etfs.warm_portfolio_holdings("SPY")
+        ['2019-09-30', '2019-12-31', ...]
+        """
+        return self._warm_dated_cache(
+            url_version="v4",
+            path="etf-holdings",
+            params={"symbol": symbol.upper()},
+            available_dates=self.available_dates(symbol),
+            rate_limiter=rate_limiter,
+            max_workers=max_workers,
         )
 
     def expense_ratio(self, symbol: str):
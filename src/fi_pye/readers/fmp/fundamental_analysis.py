@@ -1,3 +1,4 @@
+from fi_pye.readers.fmp.utils import _collect_bulk_chunks, _validate_bulk_params
 from .reader import FmpReader
 
 
@@ -20,6 +21,7 @@ class FundamentalAnalysis(FmpReader):
     - Historical DCF (daily/quarterly/annual) valuation
     - Advanced DCF valuation
     - Advanced levered DCF valuation
+    - Bulk ratios, key metrics and growth (every company, one year per request)
 
     Examples
     --------
@@ -437,3 +439,117 @@ class FundamentalAnalysis(FmpReader):
             path="advanced_levered_discounted_cash_flow",
             params={"symbol": symbol.upper()}
         )
+
+    def financial_ratios_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / ratios-bulk / API.
+
+        Obtain financial ratios for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamental_analysis = FundamentalAnalysis(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamental_analysis.financial_ratios_bulk(year=2022, period="quarter", output="ratios")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="ratios-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
+
+    def key_metrics_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / key-metrics-bulk / API.
+
+        Obtain key metrics for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamental_analysis = FundamentalAnalysis(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamental_analysis.key_metrics_bulk(year=2022, period="quarter", output="key-metrics")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="key-metrics-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
+
+    def financial_growth_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / financial-growth-bulk / API.
+
+        Obtain financial growth for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamental_analysis = FundamentalAnalysis(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamental_analysis.financial_growth_bulk(year=2022, period="quarter", output="financial-growth")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="financial-growth-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
@@ -1,3 +1,4 @@
+from fi_pye.readers.fmp.utils import _collect_bulk_chunks, _validate_bulk_params
 from .reader import FmpReader
 
 
@@ -17,6 +18,7 @@ class Fundamentals(FmpReader):
     - Cash flow
     - Cash flow growth
     - Cash flow as reported
+    - Bulk statements (every company, one year per request)
 
     Examples
     --------
@@ -354,3 +356,231 @@ class Fundamentals(FmpReader):
                 "period": period,
             },
         )
+
+    def income_statement_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / income-statement-bulk / API.
+
+        Obtain income statements for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamentals = Fundamentals(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamentals.income_statement_bulk(year=2022, period="quarter", output="income-statement")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="income-statement-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
+
+    def income_statement_growth_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / income-statement-growth-bulk / API.
+
+        Obtain income statement growth for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamentals = Fundamentals(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamentals.income_statement_growth_bulk(year=2022, period="quarter", output="income-statement-growth")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="income-statement-growth-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
+
+    def balance_sheet_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / balance-sheet-statement-bulk / API.
+
+        Obtain balance sheets for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamentals = Fundamentals(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamentals.balance_sheet_bulk(year=2022, period="quarter", output="balance-sheet-statement")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="balance-sheet-statement-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
+
+    def balance_sheet_growth_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / balance-sheet-statement-growth-bulk / API.
+
+        Obtain balance sheet growth for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamentals = Fundamentals(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamentals.balance_sheet_growth_bulk(year=2022, period="quarter", output="balance-sheet-statement-growth")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="balance-sheet-statement-growth-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
+
+    def cash_flow_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / cash-flow-statement-bulk / API.
+
+        Obtain cash flow statements for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamentals = Fundamentals(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamentals.cash_flow_bulk(year=2022, period="quarter", output="cash-flow-statement")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="cash-flow-statement-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
+
+    def cash_flow_growth_bulk(self, year: int, period: str = "annual", output: str | None = None, chunksize: int = 50_000):
+        """Query FMP / cash-flow-statement-growth-bulk / API.
+
+        Obtain cash flow statement growth for every company FMP covers for a given year,
+        in a single request.
+
+        Parameters
+        ----------
+        year :
+            Fiscal year (Ex. 2022)
+        period : default = 'annual'
+            'quarter' or 'annual'
+        output : default = None
+            Directory of a Parquet dataset, partitioned by symbol, to write
+            the rows to as they are parsed. If None, return a DataFrame.
+        chunksize : default = 50_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : pandas.DataFrame | str
+            pandas.Dataframe, or the 'output' path
+
+        Examples
+        --------
+        >>> fundamentals = Fundamentals(apikey="abc123") # Initialize data source
+        >>>
+        >>> fundamentals.cash_flow_growth_bulk(year=2022, period="quarter", output="cash-flow-statement-growth")
+        """
+        return _collect_bulk_chunks(
+            self.bulk_data(
+                path="cash-flow-statement-growth-bulk",
+                params=_validate_bulk_params(year, period),
+                chunksize=chunksize,
+            ),
+            output=output,
+        )
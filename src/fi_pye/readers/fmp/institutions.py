@@ -1,3 +1,7 @@
+import pandas as pd
+
+from fi_pye.readers.rate_limit import RateLimiter
+
 from .reader import FmpReader
 
 
@@ -14,6 +18,9 @@ class Institutions(FmpReader):
     - Portfolio summary
     - Portfolio composition
     - Portfolio industry summary
+    - Portfolio holdings
+    - Portfolio (holdings, summary or industry summary) history over every available date
+    - Warming the dated cache with the portfolios of every available date
 
     Examples
     --------
@@ -175,7 +182,8 @@ class Institutions(FmpReader):
             params={
                 "cik": cik,
                 "date": date
-            }
+            },
+            cache_date=date,
         )
 
     def portfolio_composition(self, cik: str, date: str):
@@ -203,7 +211,8 @@ class Institutions(FmpReader):
             params={
                 "cik": cik,
                 "date": date,
-            }
+            },
+            cache_date=date,
         )
 
     def portfolio_industry_summary(self, cik: str, date: str):
@@ -229,5 +238,162 @@ class Institutions(FmpReader):
             params={
                 "cik": cik,
                 "date": date,
-            }
-        )
\ No newline at end of file
+            },
+            cache_date=date,
+        )
+
+    def warm_portfolios(self, cik: str, rate_limiter: RateLimiter | None = None, max_workers: int = 4):
+        """Query FMP / institutional-ownership/portfolio-holdings-summary / API.
+
+        Download the portfolio summary and industry summary of an
+        institution on every one of its available dates that is final into
+        the reader's dated cache (only the dates missing from it are
+        requested), so later 'portfolio_summary' and
+        'portfolio_industry_summary' queries of those dates (and
+        'portfolio_composition' ones, which use the same endpoint as
+        'portfolio_summary') are served from disk.
+
+        Parameters
+        ----------
+        cik :
+            Institution CIK number
+        rate_limiter : default = None
+            Limiter every request waits on.
+        max_workers : default = 4
+            Number of dates fetched concurrently.
+
+        Return
+        -------
+        object : list[str]
+            Dates of which the portfolio summary was cached.
+
+        Example
+        -------
+        >>> institutions = Institutions(apikey="abc123", dated_cache=FmpDatedCache())
+        >>> institutions.warm_portfolios("0001067983") # Berkshire Hathaway Inc.
+        """
+        dates = self.available_dates(cik)
+        self._warm_dated_cache(
+            url_version="v4",
+            path="institutional-ownership/industry/portfolio-holdings-summary",
+            params={"cik": cik},
+            available_dates=dates,
+            rate_limiter=rate_limiter,
+            max_workers=max_workers,
+        )
+
+        return self._warm_dated_cache(
+            url_version="v4",
+            path="institutional-ownership/portfolio-holdings-summary",
+            params={"cik": cik},
+            available_dates=dates,
+            rate_limiter=rate_limiter,
+            max_workers=max_workers,
+        )
+
+    def portfolio_holdings(self, cik: str, date: str, page: int = 0):
+        """Query FMP / institutional-ownership/portfolio-holdings / API.
+
+        Returns every position (one row per holding) of an
+        institutions' portfolio, one page at a time.
+
+        Parameters
+        ----------
+        cik :
+            Institution CIK number
+        date :
+            Date to get portfolio holdings from in 'YYYY-MM-DD' format
+        page : default = 0
+            Response page number
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        return self.data(
+            url_version="v4",
+            path="institutional-ownership/portfolio-holdings",
+            params={
+                "cik": cik,
+                "date": date,
+                "page": page,
+            },
+            cache_date=date,
+        )
+
+    def portfolio_history(
+            self,
+            cik: str,
+            level: str = "holdings",
+            rate_limiter: RateLimiter | None = None,
+            max_workers: int = 4,
+    ):
+        """Query FMP / institutional-ownership/portfolio-holdings / API.
+
+        Returns the 13F portfolio of an institution on every one of its
+        available dates, as one panel: by default its holdings, indexed by
+        (date, symbol); with level='summary' or 'industry', its portfolio
+        summaries (indexed by date) or industry summaries (indexed by
+        (date, industryTitle)).
+
+        The dates are fetched concurrently (the pages of a date's holdings
+        in turn), each request waiting on 'rate_limiter' if given. With a
+        dated cache, quarters that are final are stored permanently, so
+        later calls only download the new (and still changing) quarters.
+
+        Parameters
+        ----------
+        cik :
+            Institution CIK number
+        level : default = 'holdings'
+            'holdings' ('portfolio_holdings'), 'summary' ('portfolio_summary')
+            or 'industry' ('portfolio_industry_summary').
+        rate_limiter : default = None
+            Limiter every request waits on.
+        max_workers : default = 4
+            Number of dates fetched concurrently.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+
+        Example
+        -------
+        >>> institutions = Institutions(apikey="abc123", dated_cache=FmpDatedCache())
+        >>>
+        >>> brk_holdings = institutions.portfolio_history(
+        ...     "0001067983", rate_limiter=RateLimiter(calls=300, period=60)
+        ... )
+        >>> brk_shares = brk_holdings["sharesNumber"].unstack("symbol")
+        """
+        levels = {
+            "holdings": ("institutional-ownership/portfolio-holdings", ["date", "symbol"]),
+            "summary": ("institutional-ownership/portfolio-holdings-summary", ["date"]),
+            "industry": ("institutional-ownership/industry/portfolio-holdings-summary", ["date", "industryTitle"]),
+        }
+        if level not in levels:
+            raise ValueError(f"Invalid level: {level}. Valid levels include: {list(levels)}. ")
+
+        path, index = levels[level]
+        responses = self.dated_data(
+            url_version="v4",
+            path=path,
+            params={"cik": cik},
+            dates=[str(date) for date in self.available_dates(cik)["date"]],
+            rate_limiter=rate_limiter,
+            max_workers=max_workers,
+            paged=level == "holdings",
+        )
+        frames = [response.assign(date=date) for date, response in sorted(responses.items()) if response is not None]
+        if not frames:
+            raise IOError(
+                f"Request from: {self.__class__.__name__} returned no data; check if cik is invalid. "
+                f"Request cik: {cik} ."
+            )
+
+        panel = pd.concat(frames, ignore_index=True)
+        panel["date"] = pd.to_datetime(panel["date"])
+
+        return panel.set_index([column for column in index if column in panel])
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import pandas as pd
+
+from typing import Callable
+
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class FmpListCache:
+    """
+    Persistent cache of FMP list endpoints (Ex. Symbols.all_stock_symbols,
+    Institutions.institution_list).
+
+    Lists are stored (zlib compressed) in a SQLite database with the time
+    they were fetched and a digest of their content, so indexes built on
+    them survive between processes and only rebuild what changed.
+
+    Examples
+    --------
+    >>> cache = FmpListCache()
+    >>> symbols = Symbols(apikey="abc123")
+    >>> stocks, digest = cache.load("all_stock_symbols", lambda: symbols.all_stock_symbols)
+    """
+    __slots__ = "path", "ttl", "_connection", "_lock"
+
+    def __init__(self, path: str | None = None, ttl: int = DEFAULT_TTL):
+        """
+        Parameters
+        ----------
+        path : default = None
+            SQLite database file. Defaults to '~/.cache/fi_pye/fmp.sqlite'.
+        ttl : default = 86400
+            Seconds a list stays fresh.
+        """
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".cache", "fi_pye", "fmp.sqlite")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS lists "
+                "(name TEXT PRIMARY KEY, fetched REAL, digest TEXT, body BLOB)"
+            )
+
+    def get(self, name: str, ttl: int | None = None) -> tuple[pd.DataFrame, str] | None:
+        """Return the cached (list, digest) of 'name', or None if it's missing or stale."""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fetched, digest, body FROM lists WHERE name = ?", (name,)
+            ).fetchone()
+
+        if row is None or time.time() - row[0] >= ttl:
+            return None
+
+        return pd.DataFrame(json.loads(zlib.decompress(row[2]))), row[1]
+
+    def set(self, name: str, records: pd.DataFrame) -> str:
+        """Store the list 'name', returning the digest of its content."""
+        body = json.dumps(records.to_dict("records"), default=str).encode()
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO lists (name, fetched, digest, body) VALUES (?, ?, ?, ?)",
+                (name, time.time(), digest, zlib.compress(body)),
+            )
+
+        return digest
+
+    def load(self, name: str, fetch: Callable[[], pd.DataFrame], ttl: int | None = None) -> tuple[pd.DataFrame, str]:
+        """
+        Return the (list, digest) of 'name', from the cache if it's fresh,
+        else from 'fetch' (a callable without arguments returning the list),
+        which is stored for next time.
+        """
+        cached = self.get(name, ttl)
+        if cached is not None:
+            return cached
+
+        records = fetch()
+        return records, self.set(name, records)
+
+    def fetched(self) -> pd.DataFrame:
+        """
+        Return the name, fetch time and digest of every cached list.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT name, fetched, digest FROM lists ORDER BY name").fetchall()
+
+        out = pd.DataFrame(rows, columns=["name", "fetched", "digest"])
+        out["fetched"] = pd.to_datetime(out["fetched"], unit="s")
+
+        return out
+
+    def close(self):
+        """Close the SQLite connection."""
+        self._connection.close()
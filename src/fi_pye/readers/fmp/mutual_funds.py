@@ -1,3 +1,5 @@
+from fi_pye.readers.rate_limit import RateLimiter
+
 from .reader import FmpReader
 
 
@@ -10,6 +12,7 @@ class MutualFunds(FmpReader):
     ------------
     - Available dates, by symbol or CIK number
     - Portfolio holdings, by symbol or CIK number
+    - Warming the dated cache with the holdings of every available date
 
     Example
     -------
@@ -85,7 +88,8 @@ class MutualFunds(FmpReader):
             params={
                 "symbol": symbol.upper(),
                 "date": date,
-            }
+            },
+            cache_date=date,
         )
 
     def portfolio_holdings_by_cik(self, cik: str, date: str):
@@ -113,5 +117,43 @@ class MutualFunds(FmpReader):
             params={
                 "cik": cik,
                 "date": date,
-            }
+            },
+            cache_date=date,
+        )
+
+    def warm_portfolio_holdings(self, symbol: str, rate_limiter: RateLimiter | None = None, max_workers: int = 4):
+        """Query FMP / mutual-fund-holdings / API.
+
+        Download the portfolio holdings of a specified Mutual fund (by symbol)
+        on every one of its available dates that is final into the
+        reader's dated cache (only the dates missing from it are
+        requested), so later 'portfolio_holdings' queries of those dates
+        are served from disk.
+
+        Parameters
+        ----------
+        symbol :
+            Mutual fund ticker symbol
+        rate_limiter : default = None
+            Limiter every request waits on.
+        max_workers : default = 4
+            Number of dates fetched concurrently.
+
+        Return
+        -------
+        object : list[str]
+            Cached dates.
+
+        Example
+        -------
+        >>> mutual_funds = MutualFunds(apikey="abc123", dated_cache=FmpDatedCache())
+        >>> mutual_funds.warm_portfolio_holdings("VTSAX")
+        """
+        return self._warm_dated_cache(
+            url_version="v4",
+            path="mutual-fund-holdings",
+            params={"symbol": symbol.upper()},
+            available_dates=self.available_dates(symbol),
+            rate_limiter=rate_limiter,
+            max_workers=max_workers,
         )
@@ -98,7 +98,8 @@ class Ownership(FmpReader):
                 "symbol": symbol.upper(),
                 "date": report_date,
                 "page": page,
-            }
+            },
+            cache_date=report_date,
         )
 
     def ownership_by_portfolio_weight(self, symbol: str, report_date: str, page: int = 0):
@@ -143,5 +144,6 @@ class Ownership(FmpReader):
                 "symbol": symbol.upper(),
                 "date": report_date,
                 "page": page,
-            }
+            },
+            cache_date=report_date,
         )
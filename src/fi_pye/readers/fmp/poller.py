@@ -0,0 +1,191 @@
+import logging
+import threading
+import time
+import numpy as np
+import pandas as pd
+
+from typing import Callable
+
+
+class QuoteDelta:
+    """
+    Change between two quote snapshots: the rows of new symbols, the rows
+    of symbols whose (compared) values changed, and the previous rows of
+    symbols no longer quoted. Each frame is indexed by symbol.
+    """
+    __slots__ = "new", "changed", "removed", "polled_at"
+
+    def __init__(self, new: pd.DataFrame, changed: pd.DataFrame, removed: pd.DataFrame, polled_at: float):
+        self.new = new
+        self.changed = changed
+        self.removed = removed
+        self.polled_at = polled_at
+
+    def __bool__(self):
+        return not (self.new.empty and self.changed.empty and self.removed.empty)
+
+    def __len__(self):
+        return len(self.new) + len(self.changed) + len(self.removed)
+
+    def __repr__(self):
+        return (
+            f"QuoteDelta(new={len(self.new)}, changed={len(self.changed)}, "
+            f"removed={len(self.removed)}, polled_at={self.polled_at})"
+        )
+
+
+class QuotePoller:
+    """
+    Poll a quote snapshot (Ex. Quotes.nyse, Quotes.cryptos, Price.multiple_prices)
+    and hand subscribers only what changed since the previous poll.
+
+    The previous snapshot is kept indexed by symbol; each poll is aligned
+    with it and compared column-wise in one vectorized pass, so subscribers
+    process the tens of rows that moved instead of the whole snapshot.
+    Subscribers are called with a QuoteDelta, and only when it isn't empty.
+
+    Examples
+    --------
+    >>> quotes = Quotes(apikey="abc123")
+    >>> poller = QuotePoller(lambda: quotes.cryptos, interval=5)
+    >>> poller.subscribe(lambda delta: print(delta.changed[["price", "volume"]]))
+    >>> poller.start()
+    >>> ...
+    >>> poller.stop()
+    """
+    __slots__ = "fetch", "interval", "key", "columns", "ignore", "snapshot", "_subscribers", "_stop", "_thread"
+
+    def __init__(
+            self,
+            fetch: Callable[[], pd.DataFrame],
+            interval: float = 5.0,
+            key: str = "symbol",
+            columns: list[str] | None = None,
+            ignore: list[str] | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        fetch :
+            Callable without arguments returning a quote snapshot.
+        interval : default = 5.0
+            Seconds between the starts of two polls.
+        key : default = 'symbol'
+            Column identifying a row between snapshots.
+        columns : default = None
+            Columns compared to detect changed rows; defaults to every column
+            except the 'ignore' ones.
+        ignore : default = None
+            Columns not compared; defaults to ['timestamp'], which changes on
+            every poll.
+        """
+        if interval <= 0:
+            raise ValueError(f"Invalid interval: {interval}. interval must be positive. ")
+
+        self.fetch = fetch
+        self.interval = interval
+        self.key = key
+        self.columns = columns
+        self.ignore = ["timestamp"] if ignore is None else ignore
+        self.snapshot: pd.DataFrame | None = None
+        self._subscribers = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback: Callable[[QuoteDelta], None]):
+        """Call 'callback' with every non-empty delta; returns the callback (usable as a decorator)."""
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[QuoteDelta], None]):
+        """Stop calling 'callback'."""
+        self._subscribers.remove(callback)
+
+    def poll(self) -> QuoteDelta:
+        """
+        Fetch a snapshot, diff it with the previous one, publish the delta
+        to the subscribers and return it. The first poll reports every row
+        as new.
+
+        Return
+        -------
+        object : QuoteDelta
+            QuoteDelta
+        """
+        polled_at = time.time()
+        current = self.fetch()
+        if self.key not in current.columns:
+            raise ValueError(f"Invalid key: {self.key}. Snapshot columns are: {list(current.columns)}. ")
+
+        current = current.drop_duplicates(self.key, keep="last").set_index(self.key)
+        delta = _diff_snapshots(self.snapshot, current, self._compared_columns(current), polled_at)
+        self.snapshot = current
+
+        if delta:
+            for callback in list(self._subscribers):
+                callback(delta)
+
+        return delta
+
+    def start(self):
+        """Poll every 'interval' seconds in a background (daemon) thread until 'stop'."""
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("QuotePoller is already running.")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="QuotePoller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        """Stop polling, waiting up to 'timeout' seconds for the current poll to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run(self, ticks: int | None = None):
+        """
+        Poll every 'interval' seconds in the calling thread, 'ticks' times
+        (or until 'stop'). A failing poll is logged and retried next tick.
+        """
+        tick = 0
+        while ticks is None or tick < ticks:
+            start = time.monotonic()
+            try:
+                self.poll()
+            except Exception as e:
+                logging.error(f"Quote poll failed: {e}")
+
+            tick += 1
+            if ticks is not None and tick >= ticks:
+                break
+
+            if self._stop.wait(max(self.interval - (time.monotonic() - start), 0)):
+                break
+
+    def _compared_columns(self, current):
+        """ """
+        columns = current.columns if self.columns is None else self.columns
+        return [column for column in columns if column in current.columns and column not in self.ignore]
+
+
+def _diff_snapshots(previous, current, columns, polled_at) -> QuoteDelta:
+    """ """
+    if previous is None:
+        return QuoteDelta(current, current.iloc[:0], current.iloc[:0], polled_at)
+
+    new = current.loc[current.index.difference(previous.index, sort=False)]
+    removed = previous.loc[previous.index.difference(current.index, sort=False)]
+
+    common = current.index.intersection(previous.index, sort=False)
+    columns = [column for column in columns if column in previous.columns]
+    after = current.loc[common, columns]
+    before = previous.loc[common, columns]
+
+    differs = np.zeros(len(common), dtype=bool)
+    for column in columns:
+        a = after[column].to_numpy()
+        b = before[column].to_numpy()
+        differs |= ~((a == b) | (pd.isna(a) & pd.isna(b)))
+
+    return QuoteDelta(new, current.loc[common[differs]], removed, polled_at)
@@ -1,18 +1,45 @@
-from typing import List
+import logging
+import requests
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Union
 
 from fi_pye.readers.fmp.utils import (
+    INTRADAY_WINDOW_DAYS,
+    _completed_windows,
+    _construct_url,
     _format_multiple_symbols,
     _clean_historical_daily_price,
+    _intraday_windows,
+    _resample_intraday,
+    _validate_intraday_timeframe,
     _validate_price_dates,
+    _validate_resample_from,
+    _write_intraday_window,
 )
+from fi_pye.readers.circuit_breaker import CircuitOpenError
+from fi_pye.readers.rate_limit import RateLimiter
 from .reader import FmpReader
 
+INTRADAY_CACHE_TTL = 60  # Seconds the bars fetched to resample from are reused.
+INTRADAY_CACHE_SIZE = 32  # (symbol, timeframe) bars kept per reader, least recently used evicted first.
+
 
 class Price(FmpReader):
     """
     Query Financial Modeling Prep API endpoints related to
     price.
     """
+    __slots__ = "_intraday_cache", "_intraday_lock"
+
+    def __init__(self, *args, **kwargs):
+        """See FmpReader."""
+        super().__init__(*args, **kwargs)
+        self._intraday_cache = OrderedDict()
+        self._intraday_lock = threading.Lock()
 
     def single_price(self, symbol: str):
         """Query FMP / quote /  API.
@@ -35,6 +62,7 @@ class Price(FmpReader):
             url_version="v3",
             path=f"quote/{symbol.upper()}",
             params=None,
+            hedge=True,
         )
 
     def multiple_prices(self, symbols: List[str]):
@@ -47,7 +75,8 @@ class Price(FmpReader):
         *If you get a 'DataFrame conversion exception: If using all scalar
         values, you must pass an index' logging error, it means one of the symbols
         in your symbols list was invalid. To get lists of available symbols, use
-        the Symbols class.
+        the Symbols class. Pass the reader a 'universe' (SymbolUniverse) to drop
+        invalid symbols before the request is sent.
 
         Parameters
         ----------
@@ -63,37 +92,230 @@ class Price(FmpReader):
             url_version="v3",
             path=f"quote/{_format_multiple_symbols(symbols)}",
             params=None,
+            hedge=True,
         )
 
-    def historical_price(self, symbol: str, timeframe: str):
+    def historical_price(
+            self,
+            symbol: str,
+            timeframe: str,
+            resample_from: str | None = None,
+            session_open: str = "09:30",
+    ):
         """Query FMP / quote /  API.
 
         Return historical price data for a given symbol.
         The 'symbol' parameter can be for any equity type,
         meaning it can be a stock, crypto, fx, etf, etc.
 
+        With 'resample_from', the bars are derived locally from the (cached)
+        bars of that finer timeframe instead of downloaded, so several
+        timeframes of a symbol cost a single request. Resampled bars start
+        at the session open and don't span two sessions, so they can differ
+        from the bars FMP returns for 'timeframe' (see _resample_intraday).
+
         Parameters
         ----------
         symbol :
             Equity ticker symbol.
         timeframe :
             Time frame for price history (1m, 5m, 15m, 30m, 1h, 4h).
+        resample_from : default = None
+            Finer time frame to derive the bars from (Ex. '1m').
+        session_open : default = '09:30'
+            Time the bars of each day are aligned to when resampling
+            (Ex. '00:00' for cryptos and forex).
 
         Return
         -------
         object : pandas.DataFrame
             pandas.Dataframe
         """
-        valid_timeframes = ["1m", "5m", "15m", "30m", "1h", "4h"]
-        if timeframe not in valid_timeframes:
-            raise ValueError(f"Invalid timeframe: {timeframe}. Valid timeframes are as follow: {valid_timeframes}. ")
+        _validate_intraday_timeframe(timeframe)
+        if resample_from is None:
+            return self._intraday_bars(symbol, timeframe)
+
+        _validate_resample_from(resample_from, timeframe)
+        bars = self._cached_intraday_bars(symbol, resample_from)
+        if resample_from == timeframe:
+            return bars
+
+        return _resample_intraday(bars, timeframe, session_open)
+
+    def historical_prices(
+            self,
+            symbol: str,
+            timeframes: list[str],
+            resample_from: str = "1m",
+            session_open: str = "09:30",
+    ):
+        """Query FMP / quote /  API.
+
+        Return historical price data of several time frames for a given
+        symbol, all derived from one request of 'resample_from' bars
+        (see historical_price).
+
+        Parameters
+        ----------
+        symbol :
+            Equity ticker symbol.
+        timeframes :
+            Time frames for price history (Ex. ['5m', '1h', '4h']).
+        resample_from : default = '1m'
+            Finer time frame to derive the bars from.
+        session_open : default = '09:30'
+            Time the bars of each day are aligned to.
+
+        Return
+        -------
+        object : dict[str, pandas.DataFrame]
+            pandas.Dataframe of each time frame.
+        """
+        for timeframe in timeframes:
+            _validate_intraday_timeframe(timeframe)
+            _validate_resample_from(resample_from, timeframe)
 
+        return {
+            timeframe: self.historical_price(symbol, timeframe, resample_from, session_open)
+            for timeframe in timeframes
+        }
+
+    def backfill_intraday(
+            self,
+            symbols: Union[str, list[str]],
+            timeframe: str,
+            from_date: str,
+            to_date: str,
+            output: str,
+            window_days: int | None = None,
+            rate_limiter: RateLimiter | None = None,
+            max_workers: int = 4,
+    ) -> str:
+        """Query FMP / historical-chart / API.
+
+        Backfill long intraday price histories into a local store.
+
+        The [from_date, to_date] range of each symbol is covered by windows
+        of 'window_days' days, fixed calendar blocks of each month (so the
+        range is rounded out to whole windows, and backfills of different
+        ranges share their windows), and the windows are fetched
+        concurrently, each request waiting on 'rate_limiter' if given. Each
+        window is written as soon as it arrives to a zstd compressed Parquet
+        dataset at 'output', partitioned by symbol and month. Windows that
+        ended before today are recorded as completed, so re-running a
+        backfill only fetches the missing (or still open) ones (a failed
+        window is raised after the other windows are written).
+        Writing Parquet requires the optional 'pyarrow' dependency.
+
+        Parameters
+        ----------
+        symbols :
+            Equity ticker symbol, or list of them.
+        timeframe :
+            Time frame of the bars (1m, 5m, 15m, 30m, 1h, 4h).
+        from_date :
+            Starting date in 'YYYY-MM-DD' format.
+        to_date :
+            Ending date in 'YYYY-MM-DD' format.
+        output :
+            Directory of the Parquet dataset.
+        window_days : default = None
+            Days per request; defaults to INTRADAY_WINDOW_DAYS[timeframe].
+        rate_limiter : default = None
+            Limiter every request waits on.
+        max_workers : default = 4
+            Number of windows fetched concurrently.
+
+        Return
+        -------
+        object : str
+            Path of the Parquet dataset (output).
+
+        Example
+        -------
+        >>> price = Price(apikey="abc123")
+        >>> price.backfill_intraday(["AAPL", "MSFT"], "1m", "2022-01-01", "2022-12-31", "bars",
+        ...                         rate_limiter=RateLimiter(calls=300, period=60))
+        >>> aapl = pd.read_parquet("bars", filters=[("symbol", "=", "AAPL")])
+        """
+        _validate_intraday_timeframe(timeframe)
+        start, end = _validate_price_dates(from_date, to_date)
+        symbols = [symbols.upper()] if isinstance(symbols, str) else _format_multiple_symbols(symbols).split(",")
+        window_days = window_days or INTRADAY_WINDOW_DAYS[timeframe]
+        if not isinstance(window_days, int) or window_days < 1:
+            raise ValueError(f"Invalid window_days: {window_days}. window_days must be a positive int. ")
+
+        windows = _intraday_windows(start, end, window_days)
+        pending = []
+        for symbol in symbols:
+            completed = _completed_windows(output, symbol)
+            pending += [(symbol, window) for window in windows if f"{window[0]}_{window[1]}" not in completed]
+
+        def fetch(symbol, window):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+
+            try:
+                return self._get_data(
+                    url=_construct_url("v3", f"historical-chart/{timeframe}/{symbol}"),
+                    params={"from": window[0], "to": window[1], "apikey": self.apikey},
+                )
+            except (requests.RequestException, CircuitOpenError):
+                raise
+
+            except IOError:
+                return None  # No bars in the window (Ex. a holiday).
+
+        errors = []
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(fetch, *item): item for item in pending}
+                for future in as_completed(futures):
+                    symbol, window = futures[future]
+                    try:
+                        bars = future.result()
+                    except Exception as e:
+                        # Keep writing the other windows; a re-run only fetches the failed ones.
+                        logging.error(f"Backfill of {symbol} {timeframe} bars from {window[0]} to {window[1]} failed: {e}")
+                        errors.append(e)
+                        continue
+
+                    _write_intraday_window(output, symbol, window, bars)
+                    logging.info(f"Backfilled {symbol} {timeframe} bars from {window[0]} to {window[1]}.")
+        finally:
+            self.close()
+
+        if errors:
+            raise errors[0]
+
+        return output
+
+    def _intraday_bars(self, symbol, timeframe):
+        """ """
         return self.data(
             url_version="v3",
             path=f"historical-chart/{timeframe}/{symbol.upper()}",
             params=None,
         )
 
+    def _cached_intraday_bars(self, symbol, timeframe):
+        """ """
+        key = symbol.upper(), timeframe
+        with self._intraday_lock:
+            cached = self._intraday_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] <= INTRADAY_CACHE_TTL:
+                self._intraday_cache.move_to_end(key)
+                return cached[1].copy()
+
+        cached = time.monotonic(), self._intraday_bars(symbol, timeframe)  # Not fetched under the lock.
+        with self._intraday_lock:
+            self._intraday_cache[key] = cached
+            self._intraday_cache.move_to_end(key)
+            while len(self._intraday_cache) > INTRADAY_CACHE_SIZE:
+                self._intraday_cache.popitem(last=False)
+
+        return cached[1].copy()
+
     def historical_daily_price(self, symbol: str, limit: int = 100):
         """Query FMP / quote /  API.
 
@@ -45,6 +45,7 @@ class Quotes(FmpReader):
             url_version="v3",
             path="quotes/index",
             params=None,
+            hedge=True,
         )
 
     @property
@@ -78,6 +79,7 @@ class Quotes(FmpReader):
             url_version="v3",
             path="quotes/commodity",
             params=None,
+            hedge=True,
         )
 
     @property
@@ -110,6 +112,7 @@ class Quotes(FmpReader):
             url_version="v3",
             path="quotes/forex",
             params=None,
+            hedge=True,
         )
 
     @property
@@ -143,6 +146,7 @@ class Quotes(FmpReader):
             url_version="v3",
             path="fx",
             params=None,
+            hedge=True,
         )
 
     @property
@@ -176,6 +180,7 @@ class Quotes(FmpReader):
             url_version="v3",
             path="quotes/crypto",
             params=None,
+            hedge=True,
         )
 
     @property
@@ -209,6 +214,7 @@ class Quotes(FmpReader):
             url_version="v3",
             path="quotes/nyse",
             params=None,
+            hedge=True,
         )
 
     @property
@@ -242,6 +248,7 @@ class Quotes(FmpReader):
             url_version="v3",
             path="quotes/tsx",
             params=None,
+            hedge=True,
         )
 
     @property
@@ -275,4 +282,5 @@ class Quotes(FmpReader):
             url_version="v3",
             path="quotes/euronext",
             params=None,
+            hedge=True,
         )
@@ -1,22 +1,40 @@
+import functools
+import inspect
 import logging
 import pandas as pd
 import requests
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from fi_pye.readers.fmp.utils import (
-    CONNECTION_TIMEOUT,
-    READ_TIMEOUT,
     _construct_url,
     _init_session,
 )
+from pandas.errors import EmptyDataError
 from typing import Union
 
 from fi_pye.readers.base import BaseReader
+from fi_pye.readers.circuit_breaker import CircuitBreaker, CircuitOpenError
+from fi_pye.readers.hedging import HedgePolicy
+from fi_pye.readers.rate_limit import RateLimiter
+from fi_pye.readers.fmp.dated_cache import FmpDatedCache
+from fi_pye.readers.fmp.universe import SymbolUniverse
+from fi_pye.readers.timeouts import TimeoutPolicy
 
 
 class FmpReader(BaseReader):
-    __slots__ = "apikey", "session", "headers"
+    __slots__ = "apikey", "session", "headers", "circuit_breaker", "timeouts", "hedging", "universe", "dated_cache"
+    provider = "fmp"
 
-    def __init__(self, apikey: str, session: requests.Session | None = None):
+    def __init__(
+            self,
+            apikey: str,
+            session: requests.Session | None = None,
+            circuit_breaker: CircuitBreaker | None = None,
+            timeouts: TimeoutPolicy | None = None,
+            hedging: HedgePolicy | None = None,
+            universe: SymbolUniverse | None = None,
+            dated_cache: FmpDatedCache | None = None,
+    ):
         """
         Create instantiation of reader, which is used to obtain data
         from FMP without needing to input an API key with each request.
@@ -27,6 +45,21 @@ class FmpReader(BaseReader):
             FMP API token.
         session : default = None
             requests Session.
+        circuit_breaker : default = None
+            Circuit breaker (usually shared between readers) that makes
+            requests to failing endpoints fail fast.
+        timeouts : default = None
+            Per endpoint (and optionally adaptive) request timeouts; defaults
+            to (CONNECTION_TIMEOUT, READ_TIMEOUT) for every endpoint.
+        hedging : default = None
+            Hedging policy of the latency sensitive (quote) requests; without
+            one, requests are never hedged.
+        universe : default = None
+            Known symbols; when given, the 'symbol' / 'symbols' args of the
+            reader's methods are validated before any request is sent.
+        dated_cache : default = None
+            Permanent cache of the responses of date-keyed endpoints (Ex.
+            portfolio holdings) for past report dates.
         """
         if not apikey or not isinstance(apikey, str):
             raise ValueError("FMP api key needed.")
@@ -34,12 +67,37 @@ class FmpReader(BaseReader):
         self.apikey = apikey
         self.session = _init_session(session)  # Initialize session.
         self.headers = None
+        self.circuit_breaker = circuit_breaker
+        self.timeouts = timeouts
+        self.hedging = hedging
+        self.universe = universe
+        self.dated_cache = dated_cache
+
+    def __init_subclass__(cls, **kwargs):
+        """Validate the symbols passed to the public methods of readers (see 'universe')."""
+        super().__init_subclass__(**kwargs)
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(method):
+                continue
+
+            parameters = inspect.signature(method).parameters
+            for arg in ("symbol", "symbols"):
+                if arg in parameters:
+                    setattr(cls, name, _validates_symbols(method, arg))
+                    break
 
     def close(self):
         """Close requests session."""
         self.session.close()
 
-    def data(self, url_version: str, path: str, params: dict[str, Union[str, int]] | None):
+    def data(
+            self,
+            url_version: str,
+            path: str,
+            params: dict[str, Union[str, int]] | None,
+            hedge: bool = False,
+            cache_date: str | None = None,
+    ):
         """
         Function to obtain data from the FMP API endpoint, given the FMP
         base url version used by the endpoint, the specific endpoint path,
@@ -53,6 +111,13 @@ class FmpReader(BaseReader):
             Endpoint path (after base url but before parameters)
         params :
             Dictionary of parameters used for request.
+        hedge : default = False
+            Hedge the request with the reader's hedging policy (only for
+            latency sensitive endpoints, as hedges cost quota).
+        cache_date : default = None
+            Report date of a date-keyed endpoint; once the date is final
+            (see FmpDatedCache), the response is read from / stored in the
+            reader's dated cache.
 
         Return
         -------
@@ -64,15 +129,150 @@ class FmpReader(BaseReader):
         else:
             params.update({"apikey": self.apikey})
 
+        url = _construct_url(url_version, path)
+        try:
+            if cache_date is not None and self.dated_cache is not None:
+                out = self._get_dated_data(url=url, params=params, date=cache_date)
+                if out is None:
+                    raise self._no_data_error(url)
+
+                return out
+
+            return self._get_data(url=url, params=params, hedge=hedge)
+        finally:
+            self.close()
+
+    def dated_data(
+            self,
+            url_version: str,
+            path: str,
+            params: dict[str, Union[str, int]] | None,
+            dates: list[str],
+            rate_limiter: RateLimiter | None = None,
+            max_workers: int = 4,
+            paged: bool = False,
+    ) -> dict[str, pd.DataFrame | None]:
+        """
+        Obtain the responses of a date-keyed endpoint for many report dates
+        concurrently, each request waiting on 'rate_limiter' if given.
+        Responses of final dates are read from / stored in the reader's
+        dated cache, so only the dates missing from it are downloaded.
+
+        Parameters
+        ----------
+        url_version :
+            Base url used in endpoint, either 'v3' or 'v4'
+        path :
+            Endpoint path (after base url but before parameters)
+        params :
+            Dictionary of parameters used for request, without the date.
+        dates :
+            Report dates in 'YYYY-MM-DD' format.
+        rate_limiter : default = None
+            Limiter every request waits on.
+        max_workers : default = 4
+            Number of dates fetched concurrently.
+        paged : default = False
+            The endpoint is paged ('page' param): the pages of each date are
+            requested in turn until one returns no data, and concatenated.
+
+        Return
+        -------
+        object : dict[str, pandas.DataFrame | None]
+            Response of every date (None if it returned no data), by date.
+        """
+        url = _construct_url(url_version, path)
+        params = {**(params or {}), "apikey": self.apikey}
+
+        def fetch(date):
+            if not paged:
+                return self._get_dated_data(url=url, params={**params, "date": date}, date=date, rate_limiter=rate_limiter)
+
+            pages = []
+            while True:
+                page = self._get_dated_data(
+                    url=url, params={**params, "date": date, "page": len(pages)}, date=date, rate_limiter=rate_limiter
+                )
+                if page is None:
+                    break
+
+                pages.append(page)
+
+            return pd.concat(pages, ignore_index=True) if pages else None
+
+        out, errors = {}, []
         try:
-            return self._get_data(url=_construct_url(url_version, path), params=params)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(fetch, date): date for date in dict.fromkeys(dates)}
+                for future in as_completed(futures):
+                    try:
+                        out[futures[future]] = future.result()
+                    except Exception as e:
+                        # Keep the other dates (and their cache entries); a re-run only fetches the failed ones.
+                        logging.error(f"Request of {path} on {futures[future]} failed: {e}")
+                        errors.append(e)
         finally:
             self.close()
 
-    def _get_data(self, url, params):
+        if errors:
+            raise errors[0]
+
+        return out
+
+    def _warm_dated_cache(self, url_version, path, params, available_dates, rate_limiter, max_workers):
+        """Fetch (into the dated cache) the responses of every final date of 'available_dates'."""
+        if self.dated_cache is None:
+            raise ValueError(f"{self.__class__.__name__} has no dated_cache to warm. ")
+
+        dates = [str(date) for date in available_dates["date"] if self.dated_cache.is_final(date)]
+        responses = self.dated_data(url_version, path, params, dates, rate_limiter, max_workers)
+
+        return sorted(date for date, response in responses.items() if response is not None)
+
+    def _get_dated_data(self, url, params, date, rate_limiter=None):
+        """
+        Response of a date-keyed request, or None if it returned no data.
+        For final dates, both are read from / stored in the dated cache.
+        """
+        final = self.dated_cache is not None and self.dated_cache.is_final(date)
+        if final:
+            cached = self.dated_cache.get(url, params)
+            if cached is not None:
+                return None if cached.empty else cached
+
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        try:
+            out = self._get_data(url=url, params=params)
+        except (requests.RequestException, CircuitOpenError):
+            raise
+
+        except IOError:
+            out = None  # Nothing reported on the date.
+
+        if final:
+            self.dated_cache.set(url, params, out)
+
+        return out
+
+    def _no_data_error(self, url):
+        """ """
+        return IOError(
+            f"Request from: {self.__class__.__name__} returned no data; check if URL is invalid. "
+            f"Request url: {url} ."
+        )
+
+    def _endpoint_prefix(self, url, params):
+        """Endpoints are tracked by the first segment of their path (Ex. 'quote', 'income-statement')."""
+        return url.split("/api/", 1)[-1].split("/")[1]
+
+    def _get_data(self, url, params, hedge=False):
         """ """
         with self.session as s:
-            r = s.get(url=url, params=params, timeout=(CONNECTION_TIMEOUT, READ_TIMEOUT))
+            r = self._send(url, params, lambda timeout: s.get(
+                url=url, params=params, timeout=timeout, stream=hedge
+            ), hedge=hedge)
 
             if r.status_code == requests.codes.ok:
                 out = r.json()
@@ -84,10 +284,75 @@ class FmpReader(BaseReader):
                 logging.error(f"Response error: {r} occurred during http request. ")
 
             if len(out) == 0:
+                raise self._no_data_error(url)
+
+        return pd.DataFrame(out)
+
+    def bulk_data(self, path: str, params: dict[str, Union[str, int]] | None, chunksize: int = 50_000):
+        """
+        Generator used to obtain data from the FMP bulk (csv) endpoints.
+
+        The response body is streamed straight into pandas' C parser, so
+        the csv text is never held in memory as a whole; instead, the
+        parsed rows are yielded as DataFrames of at most 'chunksize' rows.
+
+        Parameters
+        ----------
+        path :
+            Bulk endpoint path (Ex. 'income-statement-bulk')
+        params :
+            Dictionary of parameters used for request.
+        chunksize : default = 50_000
+            Maximum number of rows in each yielded DataFrame.
+
+        Yields
+        ------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        if params is None:
+            params = {"apikey": self.apikey}
+        else:
+            params.update({"apikey": self.apikey})
+
+        try:
+            yield from self._get_csv_chunks(url=_construct_url("v4", path), params=params, chunksize=chunksize)
+        finally:
+            self.close()
+
+    def _get_csv_chunks(self, url, params, chunksize):
+        """ """
+        with self._send(url, params, lambda timeout: self.session.get(
+            url=url, params=params, stream=True, timeout=timeout
+        )) as r:
+            if r.status_code == 403:
+                raise ValueError(f"The url: {url} is not available to free api keys.")
+
+            elif r.status_code != requests.codes.ok:
+                raise IOError(f"Response error: {r} occurred during http request. Request url: {url} .")
+
+            r.raw.decode_content = True  # Let urllib3 undo any gzip transfer encoding.
+            try:
+                yield from pd.read_csv(r.raw, engine="c", chunksize=chunksize)
+            except EmptyDataError:
                 service = self.__class__.__name__
                 raise IOError(
                     f"Request from: {service} returned no data; check if URL is invalid. "
                     f"Request url: {url} ."
                 )
 
-        return pd.DataFrame(out)
+
+def _validates_symbols(method, arg):
+    """Wrap a reader method so its 'arg' is validated by the reader's universe first."""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.universe is None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.arguments[arg] = self.universe.validate(bound.arguments[arg])
+        return method(*bound.args, **bound.kwargs)
+
+    return wrapper
@@ -0,0 +1,291 @@
+import difflib
+import re
+import numpy as np
+import pandas as pd
+
+from fi_pye.readers.fmp.list_cache import FmpListCache
+from fi_pye.readers.fmp.utils import SYMBOL_LISTS
+from fi_pye.readers.fmp.symbols import Symbols
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _symbol_part(records: pd.DataFrame, list_type: str) -> pd.DataFrame:
+    """Normalize a Symbols list to (symbol, name, exchange, type) rows."""
+    part = pd.DataFrame({
+        "symbol": records["symbol"].astype(str).str.upper(),
+        "name": records["name"].fillna("").astype(str) if "name" in records else "",
+        "exchange": (
+            records["exchangeShortName"].fillna("").astype(str).str.upper()
+            if "exchangeShortName" in records else ""
+        ),
+        "type": records["type"].fillna(list_type).astype(str) if "type" in records else list_type,
+    })
+
+    return part.drop_duplicates("symbol", ignore_index=True)
+
+
+def _tokenize(part: pd.DataFrame) -> pd.DataFrame:
+    """(token, row) pairs of the lowercase words of the names and symbols of a part."""
+    words = (part["name"] + " " + part["symbol"]).str.casefold().str.findall(_TOKEN).explode().dropna()
+    tokens = pd.DataFrame({"token": words.to_numpy(dtype=str), "row": words.index.to_numpy(dtype=np.int64)})
+
+    return tokens.drop_duplicates(ignore_index=True)
+
+
+class SymbolIndex:
+    """
+    Offline search index over the FMP Symbols lists (stocks, ETFs, TSX,
+    Euronext, indexes, commodities, cryptos and forex pairs).
+
+    The lists are kept in a FmpListCache, so the index persists between
+    processes and only refetches lists older than the cache's TTL; a list
+    is re-tokenized only when its content changed. Lookups use sorted
+    NumPy arrays: symbol prefixes and name tokens are found by binary
+    search, then candidate rows are scored by how many query tokens they
+    match (with fuzzy matching of misspelled tokens), and filtered by
+    exchange and type.
+
+    Examples
+    --------
+    >>> index = SymbolIndex(Symbols(apikey="abc123"))
+    >>> index.search("advanced micro")
+    >>> index.search("nvidea", type="stock", exchange="NASDAQ")
+    >>> index.prefix("MSF")
+    """
+    __slots__ = (
+        "reader", "cache", "lists", "table", "_parts", "_symbol_values", "_names", "_exchanges",
+        "_types", "_name_lengths", "_symbols", "_symbol_order", "_rows_by_symbol", "_tokens",
+        "_token_starts", "_token_rows", "_token_lengths",
+    )
+
+    def __init__(
+            self,
+            reader: Symbols | None = None,
+            cache: FmpListCache | None = None,
+            lists: dict[str, str] | None = None,
+            refresh: bool = True,
+    ):
+        """
+        Parameters
+        ----------
+        reader : default = None
+            Symbols reader used to fetch missing or stale lists; without
+            one, the index is built from the cached lists only.
+        cache : default = None
+            Cache of the lists; defaults to FmpListCache().
+        lists : default = None
+            Symbols lists (property name -> type) to index; defaults to SYMBOL_LISTS.
+        refresh : default = True
+            Build the index right away.
+        """
+        self.reader = reader
+        self.cache = cache or FmpListCache()
+        self.lists = SYMBOL_LISTS if lists is None else lists
+        for name in self.lists:
+            if not isinstance(getattr(Symbols, name, None), property):
+                raise ValueError(f"Invalid list: {name}. Lists must be Symbols properties: {list(SYMBOL_LISTS)}. ")
+
+        self._parts: dict[str, tuple[str, pd.DataFrame, pd.DataFrame]] = {}
+        self._build()
+        if refresh:
+            self.refresh()
+
+    def __len__(self):
+        return len(self.table)
+
+    def __contains__(self, symbol):
+        return isinstance(symbol, str) and symbol.upper() in self._rows_by_symbol
+
+    @property
+    def symbols(self) -> frozenset[str]:
+        """Every indexed symbol."""
+        return frozenset(self._rows_by_symbol)
+
+    def refresh(self, force: bool = False) -> list[str]:
+        """
+        Reload the lists (fetching the missing or stale ones, or all with
+        'force') and re-index the ones that changed, which are returned.
+        """
+        changed = []
+        for name in self.lists:
+            if force and self.reader is not None:
+                records = getattr(self.reader, name)
+                digest = self.cache.set(name, records)
+            elif self.reader is not None:
+                records, digest = self.cache.load(name, lambda: getattr(self.reader, name))
+            else:
+                cached = self.cache.get(name, ttl=float("inf"))
+                if cached is None:
+                    continue
+
+                records, digest = cached
+
+            if name not in self._parts or self._parts[name][0] != digest:
+                part = _symbol_part(records, self.lists[name])
+                self._parts[name] = digest, part, _tokenize(part)
+                changed.append(name)
+
+        if changed:
+            self._build()
+
+        return changed
+
+    def lookup(self, symbol: str) -> dict | None:
+        """Return the (symbol, name, exchange, type) of 'symbol', or None if it isn't indexed."""
+        row = self._rows_by_symbol.get(symbol.upper())
+        return None if row is None else self.table.iloc[row].to_dict()
+
+    def prefix(self, prefix: str, limit: int = 10, exchange: str | None = None, type: str | None = None) -> pd.DataFrame:
+        """
+        Return the symbols starting with 'prefix' (case-insensitive).
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        prefix = prefix.upper()
+        start, end = np.searchsorted(self._symbols, [prefix, prefix + "\uffff"])
+        rows = self._symbol_order[start:end]
+
+        return self._frame(rows[self._mask(rows, exchange, type)][:limit])
+
+    def search(
+            self,
+            query: str,
+            limit: int = 10,
+            exchange: str | None = None,
+            type: str | None = None,
+            fuzzy: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Search symbols by (partial) company name or symbol.
+
+        Every word of the query matches the name / symbol words it is a
+        prefix of; with 'fuzzy', a word matching none is matched to the
+        closest spelled words instead. Rows are ranked by the number of
+        (exact > prefix > fuzzy) word matches, then by shorter names.
+
+        Parameters
+        ----------
+        query :
+            Words of the company name or symbol (Ex. 'advanced micro').
+        limit : default = 10
+            Maximum number of results.
+        exchange : default = None
+            Only return symbols of this exchange (Ex. 'NASDAQ', 'TSX').
+        type : default = None
+            Only return symbols of this type (Ex. 'stock', 'etf', 'crypto').
+        fuzzy : default = True
+            Match misspelled words.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        rows, weights = [], []
+        for word in dict.fromkeys(_TOKEN.findall(query.casefold())):
+            word_rows, word_weights = self._match_word(word, fuzzy)
+            order = np.lexsort((-word_weights, word_rows))  # Best match of the word per row first.
+            word_rows, word_weights = word_rows[order], word_weights[order]
+            first = np.flatnonzero(np.diff(word_rows, prepend=-1))
+            rows.append(word_rows[first])
+            weights.append(word_weights[first])
+
+        candidates, inverse = np.unique(np.concatenate(rows or [np.empty(0, dtype=np.int64)]), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(weights or [np.empty(0)]))
+        exact = self._rows_by_symbol.get(query.strip().upper())
+        if exact is not None:
+            scores[candidates == exact] += 2
+
+        keep = self._mask(candidates, exchange, type)
+        candidates, scores = candidates[keep], scores[keep]
+        best = np.lexsort((self._name_lengths[candidates], -scores))[:limit]
+
+        out = self._frame(candidates[best])
+        out["score"] = scores[best]
+
+        return out
+
+    def _match_word(self, word, fuzzy):
+        """Rows a query word matches, with the weight of each match."""
+        start, end = np.searchsorted(self._tokens, [word, word + "\uffff"])
+        rows = self._token_rows[self._token_starts[start]:self._token_starts[end]]
+        weights = np.full(len(rows), 0.8)
+        if start < end and self._tokens[start] == word:
+            weights[:self._token_starts[start + 1] - self._token_starts[start]] = 1.0
+
+        if start == end and fuzzy and len(word) > 2:
+            # Misspellings rarely hit the first letter; only compare tokens sharing it (and about as long).
+            lo, hi = np.searchsorted(self._tokens, [word[0], word[0] + "\uffff"])
+            close = lo + np.flatnonzero(np.abs(self._token_lengths[lo:hi] - len(word)) <= 2)
+            tokens = dict(zip(self._tokens[close].tolist(), close.tolist()))
+            matches = difflib.get_close_matches(word, tokens, n=3, cutoff=0.75)
+            postings = [self._token_rows[self._token_starts[tokens[t]]:self._token_starts[tokens[t] + 1]] for t in matches]
+            rows = np.concatenate([rows, *postings])
+            weights = np.concatenate([weights, *(
+                np.full(len(p), 0.6 * difflib.SequenceMatcher(None, word, t).ratio()) for t, p in zip(matches, postings)
+            )])
+
+        return rows, weights
+
+    def _mask(self, rows, exchange, type):
+        """ """
+        mask = np.ones(len(rows), dtype=bool)
+        if exchange is not None:
+            mask &= self._exchanges[rows] == exchange.upper()
+
+        if type is not None:
+            mask &= self._types[rows] == type
+
+        return mask
+
+    def _frame(self, rows):
+        """ """
+        return pd.DataFrame({
+            "symbol": self._symbol_values[rows],
+            "name": self._names[rows],
+            "exchange": self._exchanges[rows],
+            "type": self._types[rows],
+        })
+
+    def _build(self):
+        """Merge the parts (in list order) into the table and its sorted arrays."""
+        parts, tokens, offset = [], [], 0
+        for name in self.lists:
+            if name in self._parts:
+                _, part, part_tokens = self._parts[name]
+                parts.append(part)
+                tokens.append(part_tokens.assign(row=part_tokens["row"] + offset))
+                offset += len(part)
+
+        table = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(
+            columns=["symbol", "name", "exchange", "type"]
+        )
+        unique = ~table["symbol"].duplicated().to_numpy()  # Earlier lists win.
+        renumber = np.where(unique, np.cumsum(unique) - 1, -1)
+
+        tokens = pd.concat(tokens, ignore_index=True) if tokens else pd.DataFrame({"token": [], "row": []})
+        token_values = tokens["token"].to_numpy(dtype=str)
+        token_rows = renumber[tokens["row"].to_numpy(dtype=np.int64)]
+        order = np.lexsort((token_rows, token_values))
+        order = order[token_rows[order] >= 0]
+
+        self.table = table[unique].reset_index(drop=True)
+        self._symbol_values = self.table["symbol"].to_numpy(dtype=object)
+        self._names = self.table["name"].to_numpy(dtype=object)
+        self._exchanges = self.table["exchange"].to_numpy(dtype=object)
+        self._types = self.table["type"].to_numpy(dtype=object)
+        self._name_lengths = self.table["name"].str.len().to_numpy(dtype=np.int64)
+
+        symbols = self._symbol_values.astype(str)
+        self._symbol_order = np.argsort(symbols, kind="stable")
+        self._symbols = symbols[self._symbol_order]
+        self._rows_by_symbol = dict(zip(self._symbol_values, range(len(symbols))))
+
+        self._tokens, self._token_starts = np.unique(token_values[order], return_index=True)
+        self._token_starts = np.append(self._token_starts, len(order))
+        self._token_rows = token_rows[order]
+        self._token_lengths = np.char.str_len(self._tokens)
@@ -0,0 +1,141 @@
+import logging
+import threading
+import time
+
+from fi_pye.readers.fmp.list_cache import DEFAULT_TTL, FmpListCache
+from fi_pye.readers.fmp.utils import SYMBOL_LISTS
+
+VALID_ON_UNKNOWN = ["drop", "raise"]
+
+
+class SymbolUniverse:
+    """
+    Set of every symbol FMP quotes, used to validate symbols before a
+    request is sent.
+
+    The set is built from the cached Symbols lists (see FmpListCache) and
+    rebuilt once it is older than 'ttl'. Pass it to any FMP reader as
+    'universe' and the symbol(s) of its methods are checked first: a
+    request for an unknown symbol fails without spending quota, and
+    unknown symbols are dropped from (or, with on_unknown='raise', fail) a
+    list of symbols, instead of breaking the whole batch.
+
+    Examples
+    --------
+    >>> universe = SymbolUniverse(Symbols(apikey="abc123"))
+    >>> price = Price(apikey="abc123", universe=universe)
+    >>> quotes = price.multiple_prices(["AAPL", "MSFT", "NOT-A-SYMBOL"]) # Quotes AAPL and MSFT
+    """
+    __slots__ = "reader", "cache", "lists", "ttl", "on_unknown", "_symbols", "_loaded", "_lock"
+
+    def __init__(
+            self,
+            reader=None,
+            cache: FmpListCache | None = None,
+            lists: list[str] | None = None,
+            ttl: int = DEFAULT_TTL,
+            on_unknown: str = "drop",
+    ):
+        """
+        Parameters
+        ----------
+        reader : default = None
+            Symbols reader used to fetch missing or stale lists; without
+            one, the set is built from the cached lists only.
+        cache : default = None
+            Cache of the lists; defaults to FmpListCache().
+        lists : default = None
+            Symbols lists (property names) in the set; defaults to SYMBOL_LISTS.
+        ttl : default = 86400
+            Seconds before the set (and the lists it is built from) is refreshed.
+        on_unknown : default = 'drop'
+            What to do with unknown symbols in a list of symbols, 'drop'
+            (and log them) or 'raise'. An unknown single symbol always raises.
+        """
+        if on_unknown not in VALID_ON_UNKNOWN:
+            raise ValueError(f"Invalid on_unknown: {on_unknown}. Valid values include: {VALID_ON_UNKNOWN}. ")
+
+        self.reader = reader
+        self.cache = cache or FmpListCache()
+        self.lists = list(SYMBOL_LISTS) if lists is None else lists
+        self.ttl = ttl
+        self.on_unknown = on_unknown
+        self._symbols: frozenset[str] = frozenset()
+        self._loaded = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, symbol):
+        return isinstance(symbol, str) and symbol.upper() in self.symbols
+
+    def __len__(self):
+        return len(self.symbols)
+
+    @property
+    def symbols(self) -> frozenset[str]:
+        """Every known symbol (refreshed once older than 'ttl')."""
+        if self._stale():
+            with self._lock:
+                if self._stale():  # Another thread may have refreshed it while this one waited.
+                    self._refresh()
+
+        return self._symbols
+
+    def refresh(self):
+        """Rebuild the set from the lists, fetching the missing or stale ones."""
+        with self._lock:
+            self._refresh()
+
+    def check(self, symbols: list[str]) -> tuple[list[str], list[str]]:
+        """Split 'symbols' into the (known, unknown) ones."""
+        universe = self.symbols
+        known = [symbol for symbol in symbols if isinstance(symbol, str) and symbol.upper() in universe]
+        unknown = [symbol for symbol in symbols if not isinstance(symbol, str) or symbol.upper() not in universe]
+
+        return known, unknown
+
+    def validate(self, symbols: str | list[str]) -> str | list[str]:
+        """
+        Return 'symbols' (a symbol or a list of them) without the unknown
+        ones, or raise a ValueError for them (see on_unknown). An empty
+        universe (no lists cached nor fetched) validates nothing.
+        """
+        if not isinstance(symbols, (str, list)) or not all(isinstance(symbol, str) for symbol in symbols):
+            return symbols  # Leave type errors to the method.
+
+        if not self.symbols:
+            return symbols
+
+        known, unknown = self.check([symbols] if isinstance(symbols, str) else symbols)
+        if not unknown:
+            return symbols
+
+        if isinstance(symbols, str) or self.on_unknown == "raise" or not known:
+            raise ValueError(
+                f"Invalid symbols: {unknown}. FMP has no such symbols; "
+                "to get lists of available symbols, use the Symbols class. "
+            )
+
+        logging.warning(f"Dropped unknown symbols: {unknown} from request.")
+        return known
+
+    def _stale(self):
+        """ """
+        return self._loaded is None or time.monotonic() - self._loaded >= self.ttl
+
+    def _refresh(self):
+        """ """
+        symbols = set()
+        for name in self.lists:
+            if self.reader is not None:
+                records, _ = self.cache.load(name, lambda: getattr(self.reader, name), ttl=self.ttl)
+            else:
+                cached = self.cache.get(name, ttl=float("inf"))
+                if cached is None:
+                    continue
+
+                records, _ = cached
+
+            symbols.update(records["symbol"].astype(str).str.upper())
+
+        self._symbols = frozenset(symbols)
+        self._loaded = time.monotonic()
@@ -1,9 +1,14 @@
+import os
 import requests
+import shutil
+import tempfile
 import pandas as pd
+from typing import Union
 
-
-CONNECTION_TIMEOUT = 5
-READ_TIMEOUT = 30
+from fi_pye.readers.timeouts import (  # noqa: F401 (kept importable from here)
+    CONNECTION_TIMEOUT,
+    READ_TIMEOUT,
+)
 
 VALID_SEC_FILING_TYPES = [
     "10-Q", "8-K", "4", "13F-HR", "3", "SD", "PX14A6G", "DEFA14A",
@@ -13,6 +18,23 @@ VALID_SEC_FILING_TYPES = [
     "8-K/A", "CT ORDER", "NO ACT", "ARS"
 ]
 
+# Symbols lists (properties) the symbol index and universe are built from, with
+# the type of their symbols (used when a list has no 'type' column). Earlier
+# lists win duplicates.
+SYMBOL_LISTS = {
+    "all_stock_symbols": "stock",
+    "etf_symbols": "etf",
+    "tsx_symbols": "stock",
+    "euronext_symbols": "stock",
+    "index_symbols": "index",
+    "commodities_symbols": "commodity",
+    "crypto_symbols": "crypto",
+    "fx_currency_pairs": "forex",
+}
+
+INTRADAY_TIMEFRAMES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60, "4h": 240}  # Minutes per bar.
+INTRADAY_WINDOW_DAYS = {"1m": 5, "5m": 15, "15m": 31, "30m": 31, "1h": 31, "4h": 31}  # Days per backfill request.
+
 
 def _init_session(session=None):
     """Initialize requests session. """
@@ -66,6 +88,108 @@ def _format_multiple_symbols(symbols: list[str]) -> str:
     return ",".join([symbol.upper() for symbol in symbols])
 
 
+def _validate_bulk_params(year: int, period: str) -> dict[str, Union[int, str]]:
+    """Validates 'year' and 'period' args passed to a bulk reader method."""
+    if not isinstance(year, int):
+        raise TypeError(f"Invalid year: {year} with type: {type(year)}. year must be of type: int. ")
+
+    _valid_values = ["annual", "quarter"]
+    if period not in _valid_values:
+        raise ValueError(f"Invalid period: {period}. Valid periods include: {_valid_values}. ")
+
+    return {"year": year, "period": period}
+
+
+def _collect_bulk_chunks(chunks, output: str | None = None, partition_cols: list[str] | None = None):
+    """
+    Consume the DataFrame chunks yielded by 'FmpReader.bulk_data'.
+
+    When 'output' is None the chunks are concatenated and returned as a
+    single DataFrame. Otherwise, each chunk is written to a Parquet
+    dataset (partitioned by 'partition_cols', which defaults to
+    ['symbol']) as soon as it is parsed, and 'output' is returned. The
+    dataset is written next to 'output' and only swapped in once every
+    chunk was written, so it replaces any dataset already at 'output'
+    (and is left untouched if the download fails).
+    Writing Parquet requires the optional 'pyarrow' dependency.
+    """
+    if output is None:
+        return pd.concat(chunks, ignore_index=True)
+
+    staging = _staging_directory(output)
+    try:
+        _write_bulk_chunks(chunks, staging, partition_cols or ["symbol"])
+        _replace_directory(staging, output)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    return output
+
+
+def _write_bulk_chunks(chunks, output: str, partition_cols: list[str]):
+    """
+    Append each chunk to the Parquet dataset at 'output'.
+
+    The dtypes pandas infers for a column can change between chunks (Ex. a
+    column left empty in the first chunk is float, and string in the next
+    one), so the schema of the dataset is fixed by the first chunk and every
+    chunk is cast to it. Columns that are empty in the first chunk are
+    stored as strings.
+    """
+    schema = None
+    for chunk in chunks:
+        if schema is None:
+            schema = _bulk_schema(chunk)
+        chunk = _conform_bulk_chunk(chunk, schema)
+        chunk.to_parquet(output, partition_cols=partition_cols, index=False, schema=schema)
+
+
+def _bulk_schema(chunk: pd.DataFrame):
+    """ """
+    import pyarrow as pa
+
+    empty = [column for column in chunk.columns if chunk[column].isna().all()]
+    schema = pa.Schema.from_pandas(chunk.drop(columns=empty), preserve_index=False)
+    fields = {field.name: field for field in schema}
+    fields.update({column: pa.field(column, pa.string()) for column in empty})
+
+    return pa.schema([fields[column] for column in chunk.columns])
+
+
+def _conform_bulk_chunk(chunk: pd.DataFrame, schema) -> pd.DataFrame:
+    """ """
+    import pyarrow as pa
+
+    chunk = chunk.copy()
+    for field in schema:
+        column = chunk[field.name]
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            chunk[field.name] = column.astype(object).where(column.isna(), column.astype(str))
+        elif pa.types.is_integer(field.type) or pa.types.is_floating(field.type):
+            chunk[field.name] = pd.to_numeric(column)
+
+    return chunk
+
+
+def _staging_directory(output: str) -> str:
+    """Create a hidden, empty directory next to 'output' (so it can be renamed over it)."""
+    parent, name = os.path.split(os.path.abspath(output))
+    os.makedirs(parent, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f".{name}.", dir=parent)
+
+
+def _replace_directory(source: str, destination: str):
+    """Move the 'source' directory to 'destination', replacing (and deleting) any directory already there."""
+    previous = None
+    if os.path.exists(destination):
+        previous = _staging_directory(destination)
+        os.replace(destination, os.path.join(previous, "old"))
+
+    os.replace(source, destination)
+    if previous is not None:
+        shutil.rmtree(previous, ignore_errors=True)
+
+
 def _validate_sec_filing_type(value):
     """
     Validates that the SEC form passed to a SEC reader is a
@@ -130,6 +254,132 @@ def _validate_price_dates(start: str, end: str):
     return start, end
 
 
+def _validate_intraday_timeframe(timeframe: str) -> str:
+    """Validates the 'timeframe' arg passed to a Price reader method."""
+    valid_timeframes = list(INTRADAY_TIMEFRAMES)
+    if timeframe not in valid_timeframes:
+        raise ValueError(f"Invalid timeframe: {timeframe}. Valid timeframes are as follow: {valid_timeframes}. ")
+
+    return timeframe
+
+
+def _validate_resample_from(resample_from: str, timeframe: str) -> str:
+    """Validates that intraday bars of 'timeframe' can be derived from bars of 'resample_from'."""
+    _validate_intraday_timeframe(resample_from)
+    if INTRADAY_TIMEFRAMES[resample_from] > INTRADAY_TIMEFRAMES[timeframe]:
+        raise ValueError(
+            f"Invalid resample_from: {resample_from}. "
+            f"Bars of timeframe: {timeframe} can only be derived from finer (or equal) timeframes. "
+        )
+
+    return resample_from
+
+
+def _resample_intraday(bars: pd.DataFrame, timeframe: str, session_open: str = "09:30") -> pd.DataFrame:
+    """
+    Aggregate intraday OHLCV bars (as returned by the historical chart
+    endpoint) into coarser 'timeframe' bars.
+
+    Bars are labeled by their start, and binned from each day's session
+    open (Ex. 1h bars start at 9:30, 10:30, ..., 15:30), so no bar spans
+    two sessions: the last bar of a session can be partial (Ex. the 15:30
+    1h bar and the 13:30 4h bar). Each bar has the first open, highest
+    high, lowest low, last close and total volume of the bars it covers.
+    The rows are returned newest first, like the endpoint does.
+
+    The result is not checked against FMP's own bars of 'timeframe', and
+    can differ from them where FMP labels or anchors its bars otherwise
+    (Ex. 1h / 4h bars on the clock hour, or bars including extended hours
+    trading); only the bars given are aggregated.
+    """
+    dates = pd.to_datetime(bars["date"])
+    opens = dates.dt.normalize() + pd.Timedelta(f"{session_open}:00")
+    step = pd.Timedelta(minutes=INTRADAY_TIMEFRAMES[timeframe])
+    starts = opens + ((dates - opens) // step) * step
+
+    out = (
+        bars.assign(date=dates, start=starts)
+        .sort_values("date", kind="stable")
+        .groupby("start", sort=True)
+        .agg(open=("open", "first"), low=("low", "min"), high=("high", "max"),
+             close=("close", "last"), volume=("volume", "sum"))
+        .iloc[::-1]
+        .reset_index()
+    )
+    out["date"] = out.pop("start").dt.strftime("%Y-%m-%d %H:%M:%S")
+    return out[[column for column in bars.columns if column in out.columns]]
+
+
+def _intraday_windows(start: pd.Timestamp, end: pd.Timestamp, window_days: int) -> list[tuple[str, str]]:
+    """
+    Return the ('from', 'to') windows (both inclusive, in 'YYYY-MM-DD'
+    format) covering [start, end]. Windows are fixed calendar blocks: each
+    month is cut into blocks of 'window_days' days from its 1st (the last
+    block ending with the month), so the windows of backfills of different
+    ranges always line up, and each window belongs to a single store
+    partition.
+    """
+    windows = []
+    day = start.normalize()
+    while day <= end:
+        month = day - pd.Timedelta(days=day.day - 1)
+        first = month + pd.Timedelta(days=(day.day - 1) // window_days * window_days)
+        last = min(first + pd.Timedelta(days=window_days - 1), month + pd.offsets.MonthEnd(0))
+        windows.append((first.strftime("%Y-%m-%d"), last.strftime("%Y-%m-%d")))
+        day = last + pd.Timedelta(days=1)
+
+    return windows
+
+
+def _intraday_store_dir(output: str, symbol: str) -> str:
+    """ """
+    return os.path.join(output, f"symbol={symbol}")
+
+
+def _completed_windows(output: str, symbol: str) -> set[str]:
+    """Windows of 'symbol' already backfilled into the store at 'output'."""
+    path = os.path.join(_intraday_store_dir(output, symbol), "_backfill.txt")
+    if not os.path.exists(path):
+        return set()
+
+    with open(path) as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+def _write_intraday_window(output: str, symbol: str, window: tuple[str, str], bars: pd.DataFrame | None):
+    """
+    Write the bars of a backfill window to the store at 'output', as
+    '<output>/symbol=<symbol>/month=<YYYY-MM>/<from>_<to>.parquet' (zstd
+    compressed), replacing any file of the partition that overlaps the
+    window, then record the window as completed if it ended before today
+    (a window that ends today or later is fetched again by the next
+    backfill). The file is written under a temporary name first, so an
+    interrupted backfill never leaves a partial file behind; windows
+    without bars are only recorded.
+    """
+    directory = _intraday_store_dir(output, symbol)
+    name = f"{window[0]}_{window[1]}"
+    partition = os.path.join(directory, f"month={window[0][:7]}")
+    if bars is not None and not bars.empty:
+        os.makedirs(partition, exist_ok=True)
+        bars = bars.assign(date=pd.to_datetime(bars["date"])).sort_values("date", ignore_index=True)
+        temporary = os.path.join(partition, f".{name}.parquet.tmp")  # Hidden from dataset readers.
+        bars.to_parquet(temporary, compression="zstd", index=False)
+        os.replace(temporary, os.path.join(partition, f"{name}.parquet"))
+
+    if os.path.isdir(partition):
+        for file in os.listdir(partition):
+            bounds = file[:-len(".parquet")].split("_") if file.endswith(".parquet") else []
+            overlaps = len(bounds) == 2 and bounds[0] <= window[1] and window[0] <= bounds[1]
+            if overlaps and file != f"{name}.parquet":
+                os.remove(os.path.join(partition, file))  # Left by a backfill with other windows.
+
+    if pd.Timestamp(window[1]) < pd.Timestamp.today().normalize():
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "_backfill.txt"), "a") as f:
+            f.write(f"{name}\n")
+
+
 def _clean_historical_daily_price(data):
     """
     The historical daily price response from FMP is not the normal
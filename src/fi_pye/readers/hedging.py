@@ -0,0 +1,166 @@
+import threading
+import time
+import numpy as np
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class HedgePolicy:
+    """
+    Opt-in hedging of idempotent, latency sensitive GET requests.
+
+    When a request has not completed within the 'percentile' of the
+    endpoint's recent latencies, the same request is sent again (on another
+    pooled connection of the reader's session) and the first response wins;
+    the other one is cancelled if it hasn't started yet, or closed as soon
+    as it arrives. Every request adds 'budget' to a bucket of at most
+    'burst' hedges and every hedge takes one from it, so hedges cost at
+    most about 'budget' times the requests in extra quota.
+
+    Examples
+    --------
+    >>> hedging = HedgePolicy(percentile=95, budget=0.05)
+    >>> price = Price(apikey="abc123", hedging=hedging)
+    >>> quote = price.single_price("AAPL")
+    >>> hedging.stats()
+    """
+    __slots__ = (
+        "percentile", "default_delay", "min_delay", "max_delay", "budget", "burst",
+        "min_samples", "window", "_samples", "_tokens", "_counts", "_executor", "_lock",
+    )
+
+    def __init__(
+            self,
+            percentile: float = 95,
+            default_delay: float = 0.5,
+            min_delay: float = 0.05,
+            max_delay: float = 2.0,
+            budget: float = 0.05,
+            burst: int = 10,
+            min_samples: int = 20,
+            window: int = 200,
+            max_workers: int = 8,
+    ):
+        """
+        Parameters
+        ----------
+        percentile : default = 95
+            Latency percentile (0-100) after which a request is hedged.
+        default_delay : default = 0.5
+            Hedge delay, in seconds, of endpoints with under 'min_samples' latencies.
+        min_delay, max_delay : default = 0.05, 2.0
+            Bounds of the hedge delay, in seconds.
+        budget : default = 0.05
+            Hedges allowed per request (Ex. 0.05 = at most ~5% extra requests).
+        burst : default = 10
+            Maximum number of hedges saved up in the budget.
+        min_samples : default = 20
+            Number of latencies observed before an endpoint's delay adapts.
+        window : default = 200
+            Number of most recent latencies kept per endpoint.
+        max_workers : default = 8
+            Number of threads sending (primary and hedge) requests.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError(f"Invalid percentile: {percentile}. percentile must be in (0, 100). ")
+
+        if not 0 < min_delay <= max_delay:
+            raise ValueError(f"Invalid bounds: min_delay={min_delay}, max_delay={max_delay}. Need 0 < min_delay <= max_delay. ")
+
+        if not 0 <= budget <= 1:
+            raise ValueError(f"Invalid budget: {budget}. budget must be in [0, 1]. ")
+
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.burst = burst
+        self.min_samples = min_samples
+        self.window = window
+        self._samples: dict[tuple[str, str], deque] = {}
+        self._tokens = float(burst)
+        self._counts = {"requests": 0, "hedges": 0, "hedge_wins": 0, "over_budget": 0}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._lock = threading.Lock()
+
+    def delay(self, provider: str, prefix: str) -> float:
+        """Seconds a request to (provider, prefix) is given before it is hedged."""
+        with self._lock:
+            samples = self._samples.get((provider, prefix))
+            if samples is None or len(samples) < self.min_samples:
+                latency = self.default_delay
+            else:
+                latency = float(np.percentile(samples, self.percentile))
+
+        return min(max(latency, self.min_delay), self.max_delay)
+
+    def send(self, provider: str, prefix: str, request):
+        """
+        Send a request (a callable without arguments returning a response),
+        hedging it once it is slower than the delay of (provider, prefix).
+        """
+        delay = self.delay(provider, prefix)
+        with self._lock:
+            self._counts["requests"] += 1
+            self._tokens = min(self._tokens + self.budget, self.burst)
+
+        primary = self._executor.submit(self._timed, provider, prefix, request)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_token():
+            return primary.result()
+
+        hedge = self._executor.submit(self._timed, provider, prefix, request)
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = primary if primary in done and primary.exception() is None else hedge
+        if winner.exception() is not None:
+            # The first one to complete failed; the other one is the only hope left.
+            winner = primary if winner is hedge else hedge
+
+        loser = hedge if winner is primary else primary
+        if not loser.cancel():
+            loser.add_done_callback(_close_response)
+
+        if winner is hedge and hedge.exception() is None:
+            with self._lock:
+                self._counts["hedge_wins"] += 1
+
+        return winner.result()
+
+    def stats(self) -> dict[str, int]:
+        """Number of requests, hedges sent, hedges that won, and hedges skipped for lack of budget."""
+        with self._lock:
+            return dict(self._counts)
+
+    def close(self):
+        """Shut down the request threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _take_token(self) -> bool:
+        """ """
+        with self._lock:
+            if self._tokens < 1:
+                self._counts["over_budget"] += 1
+                return False
+
+            self._tokens -= 1
+            self._counts["hedges"] += 1
+            return True
+
+    def _timed(self, provider, prefix, request):
+        """ """
+        start = time.perf_counter()
+        response = request()
+        with self._lock:
+            self._samples.setdefault((provider, prefix), deque(maxlen=self.window)).append(
+                time.perf_counter() - start
+            )
+
+        return response
+
+
+def _close_response(future):
+    """Release the connection of a response that lost the race."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
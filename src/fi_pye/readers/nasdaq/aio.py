@@ -0,0 +1,270 @@
+import asyncio
+import io
+import json
+import pandas as pd
+import aiohttp
+
+from typing import Union
+
+from fi_pye.readers.aio import AsyncReaderMixin, _init_async_session
+from fi_pye.readers.circuit_breaker import CircuitBreaker
+from fi_pye.readers.timeouts import TimeoutPolicy
+from .reader import NasdaqReader, _METADATA_CACHE
+from .blockchain import Blockchain
+from .corporate_bonds import CorporateBonds
+from .lbma import LBMA
+from .opec import OPEC
+from .sp500_ratios import SP500Ratios
+from .us_treasury import USTreasury
+from .utils import (
+    _format_datatable_filters,
+    _label_columns,
+    _merge_on_date,
+    _resolve_column_indexes,
+    _validate_dataset_options,
+    _validate_format,
+    _validate_limit,
+    _validate_series,
+)
+
+
+class _BlockingOnly:
+    """
+    Hide an attribute of the blocking readers from the async readers:
+    accessing it raises AttributeError (so hasattr() is False).
+    """
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        raise AttributeError(
+            f"{(owner or type(instance)).__name__} has no attribute '{self.name}'; the local store "
+            "and bulk downloads are only available to the blocking readers (see NasdaqReader.bulk_download). "
+        )
+
+
+class AsyncNasdaqReader(AsyncReaderMixin, NasdaqReader):
+    """
+    asyncio version of NasdaqReader.
+
+    The dataset methods of the async readers (Ex. AsyncUSTreasury.yield_curve)
+    have the same names and arguments as the blocking ones, but return
+    coroutines. Pass the same session (see fi_pye.readers.aio.create_session)
+    to several readers to share one connection pool and concurrency limit.
+    Async readers have no local store: 'store', 'bulk_download' and the
+    helpers reading the store raise AttributeError.
+
+    Examples
+    --------
+    >>> async with create_session(max_connections=10) as session:
+    ...     us_treasury = AsyncUSTreasury(apikey="abc123", session=session)
+    ...     lbma = AsyncLBMA(apikey="abc123", session=session)
+    ...     curve, gold = await asyncio.gather(us_treasury.yield_curve(), lbma.gold_price())
+    """
+    __slots__ = ()
+
+    # The local store is only read and filled by the blocking readers.
+    store = _BlockingOnly()
+    bulk_download = _BlockingOnly()
+    _download_to_file = _BlockingOnly()
+    _read_store = _BlockingOnly()
+    _stored_column_names = _BlockingOnly()
+
+    def __init__(
+            self,
+            apikey: str,
+            session: aiohttp.ClientSession | None = None,
+            format: str = "json",
+            circuit_breaker: CircuitBreaker | None = None,
+            timeouts: TimeoutPolicy | None = None,
+    ):
+        """Create instantiation of async reader used to obtain data from Nasdaq API.
+
+        Parameters
+        ----------
+        apikey :
+            Nasdaq API token.
+        session : default = None
+            aiohttp ClientSession, shared with other async readers.
+        format : default = 'json'
+            Wire format used for dataset requests, either 'json' or 'csv'.
+        circuit_breaker : default = None
+            Circuit breaker (usually shared between readers) that makes
+            requests to failing endpoints fail fast.
+        timeouts : default = None
+            Per endpoint (and optionally adaptive) request timeouts; defaults
+            to (CONNECTION_TIMEOUT, READ_TIMEOUT) for every endpoint.
+        """
+        if not apikey or not isinstance(apikey, str):
+            raise ValueError("Nasdaq api key needed.")
+
+        self.apikey = apikey
+        self.session = _init_async_session(session)  # Initialize session.
+        self.headers = None
+        self.format = _validate_format(format)
+        self.circuit_breaker = circuit_breaker
+        self.timeouts = timeouts
+
+    async def data(
+            self,
+            base: str,
+            path: str,
+            params: dict[str, Union[str, int]],
+            columns: list[str] | None = None,
+            **options,
+    ):
+        """Coroutine to obtain data from the Nasdaq API endpoints (see NasdaqReader.data)."""
+        valid_bases = ["datatables", "datasets"]
+        if base not in valid_bases:
+            raise ValueError(f"Invalid base: {base}. Valid bases include: {valid_bases}. ")
+
+        if options:
+            if base == "datatables":
+                raise ValueError(f"Dataset options: {list(options)} are not available for datatables. ")
+
+            params = {**params, **_validate_dataset_options(options)}
+
+        url = f"https://data.nasdaq.com/api/v3/{base}/{path}"
+        if base == "datatables":
+            if columns is not None:
+                params = {**params, "qopts.columns": ",".join(columns)}
+
+            pages = [page async for page in self.datatable_pages(url=url, params=params)]
+            out = pd.concat(pages, ignore_index=True)
+            self._check_empty(out, url)
+            return out
+
+        if columns is not None:
+            column_indexes = _resolve_column_indexes(columns, (await self.metadata(path))["column_names"])
+            frames = await asyncio.gather(*[
+                self._get_data(url=url, params={**params, "column_index": column_index})
+                for column_index in column_indexes
+            ])
+            return frames[0] if len(frames) == 1 else _merge_on_date(list(frames))
+
+        return await self._get_data(url=url, params=params)
+
+    async def metadata(self, path: str):
+        """Obtain (and cache) the metadata of a Nasdaq dataset (see NasdaqReader.metadata)."""
+        path = path.upper()
+        if path not in _METADATA_CACHE:
+            _METADATA_CACHE[path] = json.loads(await self._fetch(
+                url=f"https://data.nasdaq.com/api/v3/datasets/{path}/metadata.json",
+                params={"api_key": self.apikey},
+            ))["dataset"]
+
+        return _METADATA_CACHE[path]
+
+    async def multi_series(self, series: Union[list, dict], limit: int | None = 25, max_workers: int = 8, **options):
+        """
+        Fetch several datasets concurrently and join them on date (see NasdaqReader.multi_series).
+        At most 'max_workers' series are fetched at a time.
+        """
+        labels, series = _validate_series(series)
+        limit = _validate_limit(limit)
+        options = _validate_dataset_options(options)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(item):
+            async with semaphore:
+                if isinstance(item, str):
+                    return await self._get_data(
+                        url=f"https://data.nasdaq.com/api/v3/datasets/{item.upper()}",
+                        params={"rows": limit, "api_key": self.apikey, **options},
+                    )
+
+                return await item(limit=limit, **options)
+
+        frames = await asyncio.gather(*[fetch(item) for item in series])
+        return _merge_on_date([_label_columns(frame, label) for frame, label in zip(frames, labels)])
+
+    async def datatable(
+            self,
+            path: str,
+            columns: list[str] | None = None,
+            filters: dict[str, Union[str, int, list]] | None = None,
+            per_page: int | None = None,
+    ):
+        """Async generator paging through a Nasdaq datatable (see NasdaqReader.datatable)."""
+        params = _format_datatable_filters(filters)
+        params.update({"api_key": self.apikey})
+
+        if columns is not None:
+            params["qopts.columns"] = ",".join(columns)
+
+        if per_page is not None:
+            params["qopts.per_page"] = _validate_limit(per_page)
+
+        async for page in self.datatable_pages(url=f"https://data.nasdaq.com/api/v3/datatables/{path}", params=params):
+            yield page
+
+    async def datatable_pages(self, url, params):
+        """Async generator following 'qopts.cursor_id' through a datatable (see NasdaqReader.datatable)."""
+        params = dict(params)
+        while True:
+            out_json = json.loads(await self._fetch(url=url, params=params))
+            table = out_json["datatable"]
+
+            yield pd.DataFrame(
+                data=table["data"],
+                columns=[column["name"] for column in table["columns"]]
+            )
+
+            cursor_id = out_json.get("meta", {}).get("next_cursor_id")
+            if cursor_id is None:
+                break
+
+            params["qopts.cursor_id"] = cursor_id
+
+    async def _get_data(self, url, params):
+        """ """
+        if self.format == "csv":
+            body = await self._fetch(url=f"{url}.csv", params=params)
+            out = pd.read_csv(io.BytesIO(body), engine="c", index_col=0, parse_dates=True)
+        else:
+            out_json = json.loads(await self._fetch(url=url, params=params))["dataset"]
+            out = pd.DataFrame(data=out_json["data"], columns=out_json["column_names"])
+
+        self._check_empty(out, url)
+        return out
+
+    def _check_empty(self, out, url):
+        """ """
+        if len(out) == 0:
+            service = self.__class__.__name__
+            raise IOError(
+                f"Request from: {service} returned no data; check if URL is invalid. "
+                f"Request url: {url} ."
+            )
+
+
+class AsyncBlockchain(AsyncNasdaqReader, Blockchain):
+    """asyncio version of Blockchain."""
+    __slots__ = ()
+
+
+class AsyncCorporateBonds(AsyncNasdaqReader, CorporateBonds):
+    """asyncio version of CorporateBonds."""
+    __slots__ = ()
+
+
+class AsyncLBMA(AsyncNasdaqReader, LBMA):
+    """asyncio version of LBMA."""
+    __slots__ = ()
+
+
+class AsyncOPEC(AsyncNasdaqReader, OPEC):
+    """asyncio version of OPEC."""
+    __slots__ = ()
+
+
+class AsyncSP500Ratios(AsyncNasdaqReader, SP500Ratios):
+    """asyncio version of SP500Ratios."""
+    __slots__ = ()
+
+
+class AsyncUSTreasury(AsyncNasdaqReader, USTreasury):
+    """asyncio version of USTreasury."""
+    __slots__ = ()
@@ -7,7 +7,7 @@ class Blockchain(NasdaqReader):
     Query Nasdaq Data Link API endpoints related to the
     Blockchain dataset published by Quandl.
     """
-    def difficulty(self, limit: int = 25):
+    def difficulty(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / BCHAIN/DIFF / API.
 
         A relative measure of how difficult it is to find a new block.
@@ -18,6 +18,10 @@ class Blockchain(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -31,9 +35,11 @@ class Blockchain(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def avg_block_size(self, limit: int = 25):
+    def avg_block_size(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / BCHAIN/AVBLS / API.
 
         The average block size in MB.
@@ -42,6 +48,10 @@ class Blockchain(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -55,9 +65,11 @@ class Blockchain(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def network_deficit(self, limit: int = 25):
+    def network_deficit(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / BCHAIN/NETDF / API.
 
         Data showing difference between transaction fees and cost of bitcoin mining.
@@ -66,6 +78,10 @@ class Blockchain(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -79,9 +95,11 @@ class Blockchain(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def hash_rate(self, limit: int = 25):
+    def hash_rate(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / BCHAIN/HRATE / API.
 
         The estimated number of tera hashes per second (trillions of hashes per second)
@@ -91,6 +109,10 @@ class Blockchain(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -104,9 +126,11 @@ class Blockchain(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def miner_operating_margin(self, limit: int = 25):
+    def miner_operating_margin(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / BCHAIN/MIOPM / API.
 
         Data showing miners revenue minus estimated electricity and bandwidth costs.
@@ -115,6 +139,10 @@ class Blockchain(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -128,9 +156,11 @@ class Blockchain(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def miner_revenue(self, limit: int = 25):
+    def miner_revenue(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / BCHAIN/MIREV / API.
 
         Total value of coinbase block rewards and transaction fees paid to miners.
@@ -139,6 +169,10 @@ class Blockchain(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -152,9 +186,11 @@ class Blockchain(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def est_transaction_volume(self, limit: int = 25, as_usd: bool = False):
+    def est_transaction_volume(self, limit: int = 25, as_usd: bool = False, columns: list[str] | None = None, **options):
         """Query Nasdaq / BCHAIN/ETRVU | BCHAIN/ETRAV / API.
 
         The total estimated value of transactions on the Bitcoin
@@ -167,6 +203,10 @@ class Blockchain(NasdaqReader):
             Query Nasdaq / BCHAIN/ETRVU / (ie. Bitcoin Estimated transaction Volume USD).
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -185,4 +225,6 @@ class Blockchain(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
@@ -1,3 +1,5 @@
+from functools import partial
+
 from .reader import NasdaqReader
 from .utils import _validate_limit
 
@@ -9,7 +11,7 @@ class CorporateBonds(NasdaqReader):
     Query Nasdaq Data Link API endpoints related to the
     Corporate Bond Yield Rates dataset published by Quandl.
     """
-    def bond_index_yield(self, grading: str, limit: int = 25):
+    def bond_index_yield(self, grading: str, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         if grading.upper() not in VALID_BOND_GRADING:
             raise ValueError(f"Invalid bond grading: {grading}. Valid 'grading' values include: {VALID_BOND_GRADING}.")
@@ -27,9 +29,20 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
+        )
+
+    def bond_index_yields(self, gradings: list[str] | None = None, limit: int = 25, **options):
+        """Bond index yields of several gradings (all of them by default), joined on date."""
+        gradings = gradings or VALID_BOND_GRADING
+        return self.multi_series(
+            {grading.upper(): partial(self.bond_index_yield, grading) for grading in gradings},
+            limit=limit,
+            **options,
         )
 
-    def total_return_index(self, grading: str, limit: int = 25):
+    def total_return_index(self, grading: str, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         if grading.upper() not in VALID_BOND_GRADING:
             raise ValueError(f"Invalid bond grading: {grading}. Valid 'grading' values include: {VALID_BOND_GRADING}.")
@@ -41,9 +54,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def emerging_markets_index_oas(self, limit: int = 25):
+    def emerging_markets_index_oas(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -52,9 +67,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def emerging_markets_tri(self, limit: int = 25):
+    def emerging_markets_tri(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -63,9 +80,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def emerging_markets_high_grade(self, limit: int = 25):
+    def emerging_markets_high_grade(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -74,9 +93,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def emerging_markets_high_yield(self, limit: int = 25):
+    def emerging_markets_high_yield(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -85,9 +106,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def euro_emerging_markets_index(self, limit: int = 25):
+    def euro_emerging_markets_index(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -96,9 +119,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def us_high_yield_index_oas(self, limit: int = 25):
+    def us_high_yield_index_oas(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -107,9 +132,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def us_high_yield_tri(self, limit: int = 25):
+    def us_high_yield_tri(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -118,9 +145,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def us_total_return_index(self, limit: int = 25):
+    def us_total_return_index(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -129,9 +158,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def us_bond_index(self, limit: int = 25):
+    def us_bond_index(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -140,9 +171,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def emea_total_return_index(self, limit: int = 25):
+    def emea_total_return_index(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -151,9 +184,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def ig_emerging_markets_tri(self, limit: int = 25):
+    def ig_emerging_markets_tri(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -162,9 +197,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def aa_rated_index_oas(self, limit: int = 25):
+    def aa_rated_index_oas(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -173,9 +210,11 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
-    def b_rated_index_oas(self, limit: int = 25):
+    def b_rated_index_oas(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -184,4 +223,6 @@ class CorporateBonds(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
@@ -17,7 +17,7 @@ class LBMA(NasdaqReader):
     - Gold forward offered rates (No longer updated by Quandl)
     - London gold fixings (No longer updated by Quandl)
     """
-    def gold_price(self, limit: int = 25):
+    def gold_price(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / LBMA/GOLD / API.
 
         Gold Price: London Fixings, London Bullion Market Association (LBMA). Fixing levels
@@ -36,6 +36,10 @@ class LBMA(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -49,9 +53,11 @@ class LBMA(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def silver_price(self, limit: int = 25):
+    def silver_price(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / LBMA/SILVER / API.
 
         Silver Price: London Fixing. London Bullion Market Association (LBMA). Fixing levels
@@ -70,6 +76,10 @@ class LBMA(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -83,9 +93,11 @@ class LBMA(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def gold_forward_offered_rates(self, limit: int = 25):
+    def gold_forward_offered_rates(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / LBMA/GOFO / API.
 
         *NO LONGER UPDATED BY QUANDL AS OF 2015-01-30
@@ -99,6 +111,10 @@ class LBMA(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -112,9 +128,11 @@ class LBMA(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def london_gold_fixings(self, limit: int = 25):
+    def london_gold_fixings(self, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / LBMA/DAILY / API.
 
         *NO LONGER UPDATED BY QUANDL AS OF 2000
@@ -130,6 +148,10 @@ class LBMA(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -143,4 +165,6 @@ class LBMA(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
@@ -5,7 +5,7 @@ from .utils import _validate_limit
 class OPEC(NasdaqReader):
     """Organization of the Petroleum Exporting Countries. """
 
-    def crude_oil_price(self, limit: int = 25):
+    def crude_oil_price(self, limit: int = 25, columns: list[str] | None = None, **options):
         """ """
         return self.data(
             base="datasets",
@@ -14,5 +14,7 @@ class OPEC(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey,
             },
+            columns=columns,
+            **options,
         )
 
@@ -1,20 +1,59 @@
+import copy
 import logging
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
 import pandas as pd
 import requests
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from fi_pye.readers.fmp.utils import (
-    CONNECTION_TIMEOUT,
-    READ_TIMEOUT,
     _init_session,
+    _replace_directory,
+    _staging_directory,
+    _write_bulk_chunks,
 )
 from typing import Union
 from fi_pye.readers.base import BaseReader
+from fi_pye.readers.circuit_breaker import CircuitBreaker
+from fi_pye.readers.timeouts import TimeoutPolicy
+from .utils import (
+    _concat_pages,
+    _format_datatable_filters,
+    _label_columns,
+    _merge_on_date,
+    _move_partitions,
+    _read_manifest,
+    _resolve_column_indexes,
+    _validate_dataset_options,
+    _validate_format,
+    _validate_limit,
+    _validate_series,
+    _write_manifest,
+)
+
+# Dataset metadata (column names, frequency, ...) rarely changes,
+# so it is cached for the lifetime of the process.
+_METADATA_CACHE: dict[str, dict] = {}
+_STORE_LOCK = threading.Lock()  # Guards the manifests of stored databases.
 
 
 class NasdaqReader(BaseReader):
-    __slots__ = "apikey", "session", "headers"
+    __slots__ = "apikey", "session", "headers", "store", "format", "circuit_breaker", "timeouts"
+    provider = "nasdaq"
 
-    def __init__(self, apikey: str, session: requests.Session | None = None):
+    def __init__(
+            self,
+            apikey: str,
+            session: requests.Session | None = None,
+            store: str | None = None,
+            format: str = "json",
+            circuit_breaker: CircuitBreaker | None = None,
+            timeouts: TimeoutPolicy | None = None,
+    ):
         """Create instantiation of reader used to obtain data from Nasdaq API.
 
         Parameters
@@ -23,6 +62,19 @@ class NasdaqReader(BaseReader):
             Nasdaq API token.
         session : default = None
             requests Session.
+        store : default = None
+            Directory of a local store filled by 'bulk_download'. Datasets
+            found in the store are read from disk instead of the API.
+        format : default = 'json'
+            Wire format used for dataset requests, either 'json' or 'csv'.
+            'csv' responses are parsed by pandas' C parser into typed columns
+            with a DatetimeIndex, which is faster and lighter on long series.
+        circuit_breaker : default = None
+            Circuit breaker (usually shared between readers) that makes
+            requests to failing endpoints fail fast.
+        timeouts : default = None
+            Per endpoint (and optionally adaptive) request timeouts; defaults
+            to (CONNECTION_TIMEOUT, READ_TIMEOUT) for every endpoint.
         """
         if not apikey or not isinstance(apikey, str):
             raise ValueError("Nasdaq api key needed.")
@@ -30,12 +82,23 @@ class NasdaqReader(BaseReader):
         self.apikey = apikey
         self.session = _init_session(session)  # Initialize session.
         self.headers = None
+        self.store = store
+        self.format = _validate_format(format)
+        self.circuit_breaker = circuit_breaker
+        self.timeouts = timeouts
 
     def close(self):
         """Close requests session."""
         self.session.close()
 
-    def data(self, base: str, path: str, params: dict[str, Union[str, int]]):
+    def data(
+            self,
+            base: str,
+            path: str,
+            params: dict[str, Union[str, int]],
+            columns: list[str] | None = None,
+            **options,
+    ):
         """Function to obtain data from the Nasdaq API endpoints.
 
         Parameters
@@ -46,6 +109,16 @@ class NasdaqReader(BaseReader):
             Endpoint path (after base url but before parameters)
         params :
             Dictionary of parameters used for request.
+        columns : default = None
+            Names of the columns to return (all columns if None). For datasets,
+            each column is requested on its own (through 'column_index') and
+            the responses are merged on date.
+        options :
+            Dataset query options, computed server side to shrink the response:
+            - collapse : 'none', 'daily', 'weekly', 'monthly', 'quarterly' or 'annual'
+            - transform : 'none', 'diff', 'rdiff', 'rdiff_from', 'cumul' or 'normalize'
+            - start_date / end_date : 'YYYY-MM-DD'
+            - order : 'asc' or 'desc'
 
         Return
         -------
@@ -56,13 +129,354 @@ class NasdaqReader(BaseReader):
         if base not in valid_bases:
             raise ValueError(f"Invalid base: {base}. Valid bases include: {valid_bases}. ")
 
+        if options:
+            if base == "datatables":
+                raise ValueError(f"Dataset options: {list(options)} are not available for datatables. ")
+
+            params = {**params, **_validate_dataset_options(options)}
+
+        url = f"https://data.nasdaq.com/api/v3/{base}/{path}"
+        try:
+            if base == "datatables":
+                if columns is not None:
+                    params = {**params, "qopts.columns": ",".join(columns)}
+
+                return _concat_pages(self._iter_datatable(url=url, params=params), url, self.__class__.__name__)
+
+            if columns is not None:
+                return self._get_columns(path=path, params=params, columns=columns)
+
+            return self._get_dataset(path=path, params=params)
+        finally:
+            self.close()
+
+    def multi_series(self, series: Union[list, dict], limit: int | None = 25, max_workers: int = 8, **options):
+        """Fetch several datasets concurrently and join them on date.
+
+        Each series can be a dataset code (Ex. 'LBMA/GOLD') or a reader
+        method (Ex. blockchain.hash_rate, or functools.partial(
+        corporate_bonds.bond_index_yield, "AAA")), which is called with
+        'limit'. Reader methods are resolved to the dataset request they
+        would send, so all series are fetched over this reader's (pooled)
+        session, and outer joined on date in a single pass.
+
+        Parameters
+        ----------
+        series :
+            List of series, or dictionary of {column label: series}.
+        limit : default = 25
+            Number of rows to return for each series
+        max_workers : default = 8
+            Maximum number of concurrent requests.
+        options :
+            Dataset query options passed to every series (see 'data').
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        labels, series = _validate_series(series)
+        limit = _validate_limit(limit)
+        options = _validate_dataset_options(options)
+
+        def fetch(item):
+            if isinstance(item, str):
+                return self._get_dataset(path=item.upper(), params={"rows": limit, "api_key": self.apikey, **options})
+
+            request = _series_request(item, limit, options)
+            if request is None:
+                return item(limit=limit, **options)  # Not a dataset method of a Nasdaq reader.
+
+            path, params, columns = request
+            if columns is not None:
+                return self._get_columns(path=path, params=params, columns=columns)
+
+            return self._get_dataset(path=path, params=params)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(series))) as executor:
+                frames = list(executor.map(fetch, series))
+        finally:
+            self.close()
+
+        return _merge_on_date([_label_columns(frame, label) for frame, label in zip(frames, labels)])
+
+    def _get_dataset(self, path, params):
+        """Read a dataset from the local store if it's there, otherwise from the API."""
+        # The store holds raw daily rows, so collapsed / transformed series come from the API.
+        if self.store is not None and not {"collapse", "transform"} & params.keys():
+            out = self._read_store(path=path, params=params)
+            if out is not None:
+                return out
+
+        return self._get_data(url=f"https://data.nasdaq.com/api/v3/datasets/{path}", params=params)
+
+    def _get_columns(self, path, params, columns):
+        """Request each of the given columns of a dataset concurrently and merge them on date."""
+        column_indexes = _resolve_column_indexes(columns, self.metadata(path)["column_names"])
+
+        if len(column_indexes) == 1:
+            return self._get_dataset(path=path, params={**params, "column_index": column_indexes[0]})
+
+        with ThreadPoolExecutor(max_workers=len(column_indexes)) as executor:
+            frames = list(executor.map(
+                lambda column_index: self._get_dataset(path=path, params={**params, "column_index": column_index}),
+                column_indexes,
+            ))
+
+        return _merge_on_date(frames)
+
+    def datatable(
+            self,
+            path: str,
+            columns: list[str] | None = None,
+            filters: dict[str, Union[str, int, list]] | None = None,
+            per_page: int | None = None,
+    ):
+        """Generator used to page through a Nasdaq datatable.
+
+        Each page of the datatable is yielded as its own DataFrame, and the
+        next page is only requested (by following 'qopts.cursor_id') once
+        the previous one has been consumed, so tables of any size can be
+        processed with bounded memory.
+
+        Parameters
+        ----------
+        path :
+            Datatable code (Ex. 'ZACKS/FC')
+        columns : default = None
+            Columns to return (server side projection through 'qopts.columns')
+        filters : default = None
+            Row filters (Ex. {"ticker": ["AAPL", "MSFT"], "per_end_date.gte": "2020-01-01"})
+        per_page : default = None
+            Number of rows per page (max 10,000)
+
+        Yields
+        ------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        params = _format_datatable_filters(filters)
+        params.update({"api_key": self.apikey})
+
+        if columns is not None:
+            params["qopts.columns"] = ",".join(columns)
+
+        if per_page is not None:
+            params["qopts.per_page"] = _validate_limit(per_page)
+
+        try:
+            yield from self._iter_datatable(url=f"https://data.nasdaq.com/api/v3/datatables/{path}", params=params)
+        finally:
+            self.close()
+
+    def metadata(self, path: str):
+        """Obtain (and cache) the metadata of a Nasdaq dataset.
+
+        Parameters
+        ----------
+        path :
+            Dataset code (Ex. 'USTREASURY/YIELD')
+
+        Return
+        -------
+        object : dict
+            Dataset metadata, including 'column_names'.
+        """
+        path = path.upper()
+        if path not in _METADATA_CACHE:
+            _METADATA_CACHE[path] = self._get_response(
+                url=f"https://data.nasdaq.com/api/v3/datasets/{path}/metadata.json",
+                params={"api_key": self.apikey},
+            ).json()["dataset"]
+
+        return _METADATA_CACHE[path]
+
+    def bulk_download(
+            self,
+            database: str,
+            download_type: str = "full",
+            max_columns: int = 32,
+            chunksize: int = 100_000,
+    ):
+        """Download a whole Nasdaq database into the local store.
+
+        The zipped csv export of the database is spooled to a temporary
+        file, then decompressed and parsed (by pandas' C parser) in chunks
+        into a Parquet dataset, partitioned by dataset code, in a staging
+        directory. Only once every file of the export was parsed is it moved
+        to '<store>/<database>' (replacing it for a 'full' download, adding
+        to it for a 'partial' one), so a failed download never damages the
+        store. Rows are tagged with their download's sequence number, so the
+        latest update of a row wins. Once downloaded, the dataset methods of
+        this reader (Ex. USTreasury.yield_curve) read from the store.
+
+        Writing Parquet requires the optional 'pyarrow' dependency.
+
+        Parameters
+        ----------
+        database :
+            Database code (Ex. 'USTREASURY', 'ML' or 'MULTPL')
+        download_type : default = 'full'
+            'full' replaces the stored database, 'partial' appends the
+            latest day of updates to it.
+        max_columns : default = 32
+            Maximum number of value columns of any dataset in the database.
+        chunksize : default = 100_000
+            Number of csv rows parsed at a time
+
+        Return
+        -------
+        object : str
+            Directory the database was written to.
+        """
+        if self.store is None:
+            raise ValueError("A 'store' directory must be passed to the reader to use bulk downloads.")
+
+        valid_values = ["full", "partial"]
+        if download_type not in valid_values:
+            raise ValueError(f"Invalid download type: {download_type}. Valid download types include: {valid_values}. ")
+
+        database = database.upper()
+        destination = os.path.join(self.store, database)
+        value_columns = [str(i) for i in range(_validate_limit(max_columns))]
+        manifest = _read_manifest(destination)
+        sequence = 0 if download_type == "full" else manifest["sequence"] + 1
+
+        staging = _staging_directory(destination)
         try:
-            return self._get_data(url=f"https://data.nasdaq.com/api/v3/{base}/{path}", params=params)
+            with tempfile.TemporaryFile() as f:
+                self._download_to_file(
+                    url=f"https://data.nasdaq.com/api/v3/databases/{database}/data",
+                    params={"download_type": download_type, "api_key": self.apikey},
+                    file=f,
+                )
+
+                with zipfile.ZipFile(f) as archive:
+                    for name in archive.namelist():
+                        with archive.open(name) as csv:
+                            _write_bulk_chunks(
+                                (chunk.assign(sequence=sequence) for chunk in pd.read_csv(
+                                    csv,
+                                    engine="c",
+                                    header=None,
+                                    names=["code", "date", *value_columns],
+                                    dtype={"code": str, "date": str, **{c: float for c in value_columns}},
+                                    chunksize=chunksize,
+                                )),
+                                staging,
+                                ["code"],
+                            )
+
+            with _STORE_LOCK:
+                # Column names don't change between downloads; keep the ones already known.
+                manifest = _read_manifest(destination)
+                manifest["sequence"] = sequence
+                manifest["column_names"].update({
+                    path.split("/", 1)[1]: metadata["column_names"]
+                    for path, metadata in _METADATA_CACHE.items() if path.startswith(f"{database}/")
+                })
+                if download_type == "full":
+                    _write_manifest(staging, manifest)
+                    _replace_directory(staging, destination)
+                else:
+                    _move_partitions(staging, destination)
+                    _write_manifest(destination, manifest)
         finally:
+            shutil.rmtree(staging, ignore_errors=True)
             self.close()
 
+        return destination
+
+    def _download_to_file(self, url, params, file):
+        """ """
+        with self._send(url, params, lambda timeout: self.session.get(
+            url=url, params=params, stream=True, timeout=timeout
+        )) as r:
+            if r.status_code != requests.codes.ok:
+                raise IOError(f"Response error: {r} occurred during http request. Request url: {url} .")
+
+            for block in r.iter_content(chunk_size=1 << 20):
+                file.write(block)
+
+        file.seek(0)
+
+    def _read_store(self, path, params):
+        """Read a dataset from the local store, or return None if it isn't stored."""
+        database, code = path.upper().split("/", 1)
+        directory = os.path.join(self.store, database, f"code={code}")
+        if not os.path.isdir(directory):
+            return None
+
+        column_names = self._stored_column_names(database, code)
+        out = pd.read_parquet(directory)
+        if "sequence" in out:
+            out = out.sort_values("sequence", kind="stable")  # Later downloads win.
+
+        out = out[["date", *[str(i) for i in range(len(column_names) - 1)]]]
+        out.columns = column_names
+
+        date = column_names[0]
+        out = out.drop_duplicates(subset=date, keep="last").sort_values(
+            date, ascending=params.get("order") == "asc", ignore_index=True
+        )
+
+        if params.get("start_date") is not None:
+            out = out[out[date] >= params["start_date"]]
+
+        if params.get("end_date") is not None:
+            out = out[out[date] <= params["end_date"]]
+
+        column_index = params.get("column_index")
+        if column_index is not None:
+            out = out.iloc[:, [0, column_index]]
+
+        rows = params.get("rows")
+        if rows is not None:
+            out = out.head(rows)
+
+        if self.format == "csv":
+            out = out.set_index(pd.DatetimeIndex(out.pop(date), name=date))
+
+        return out
+
+    def _stored_column_names(self, database, code):
+        """Column names of a stored dataset, from the store's manifest (fetched and saved there once)."""
+        directory = os.path.join(self.store, database)
+        column_names = _read_manifest(directory)["column_names"].get(code)
+        if column_names is None:
+            column_names = self.metadata(f"{database}/{code}")["column_names"]
+            with _STORE_LOCK:
+                manifest = _read_manifest(directory)
+                manifest["column_names"][code] = column_names
+                _write_manifest(directory, manifest)
+
+        return column_names
+
+    def _iter_datatable(self, url, params):
+        """ """
+        params = dict(params)
+        while True:
+            out_json = self._get_response(url=url, params=params).json()
+            table = out_json["datatable"]
+
+            yield pd.DataFrame(
+                data=table["data"],
+                columns=[column["name"] for column in table["columns"]]
+            )
+
+            cursor_id = out_json.get("meta", {}).get("next_cursor_id")
+            if cursor_id is None:
+                break
+
+            params["qopts.cursor_id"] = cursor_id
+
     def _get_data(self, url, params):
         """ """
+        if self.format == "csv":
+            return self._get_csv_data(url=url, params=params)
+
         out_json = self._get_response(url=url, params=params).json()["dataset"]
 
         try:
@@ -84,11 +498,57 @@ class NasdaqReader(BaseReader):
 
             return out
 
-    def _get_response(self, url, params=None, headers=None):
+    def _get_csv_data(self, url, params):
+        """ """
+        response = self._get_response(url=f"{url}.csv", params=params, stream=True)
+        response.raw.decode_content = True  # Let urllib3 undo any gzip transfer encoding.
+
+        with response:
+            out = pd.read_csv(response.raw, engine="c", index_col=0, parse_dates=True)
+
+        if len(out) == 0:
+            service = self.__class__.__name__
+            raise IOError(
+                f"Request from: {service} returned no data; check if URL is invalid. "
+                f"Request url: {url} ."
+            )
+
+        return out
+
+    def _endpoint_prefix(self, url, params):
+        """Endpoints are tracked by base and database (Ex. 'datasets/ML', 'databases/USTREASURY')."""
+        return "/".join(url.split("/api/v3/", 1)[-1].split("/")[:2])
+
+    def _get_response(self, url, params=None, headers=None, stream=False):
         """ """
         headers = headers or self.headers
-        response = self.session.get(
-            url=url, params=params, headers=headers, timeout=(CONNECTION_TIMEOUT, READ_TIMEOUT)
-        )
+        response = self._send(url, params, lambda timeout: self.session.get(
+            url=url, params=params, headers=headers, stream=stream, timeout=timeout
+        ))
         if response.status_code == requests.codes.ok:
             return response
+
+
+def _series_request(item, limit, options):
+    """
+    Resolve a reader method passed to 'NasdaqReader.multi_series' to the
+    (path, params, columns) of the dataset request it would send, without
+    sending it; None if it isn't a dataset method of a Nasdaq reader.
+    """
+    method = item.func if isinstance(item, partial) else item
+    owner = getattr(method, "__self__", None)
+    if not isinstance(owner, NasdaqReader) or not hasattr(owner, "__dict__"):
+        return None
+
+    recorder = copy.copy(owner)  # The owner itself may be in use by other threads.
+    recorder.data = lambda base, path, params, columns=None, **opts: (base, path, params, columns, opts)
+    method = getattr(recorder, method.__name__)
+    if isinstance(item, partial):
+        method = partial(method, *item.args, **item.keywords)
+
+    request = method(limit=limit, **options)
+    if not isinstance(request, tuple) or request[0] != "datasets":
+        return None
+
+    _, path, params, columns, opts = request
+    return path, {**params, **_validate_dataset_options(opts)}, columns
@@ -13,7 +13,7 @@ class SP500Ratios(NasdaqReader):
     Method descriptions are taken from the csv provided by
     Nasdaq under the 'usage' section of this dataset.
     """
-    def shiller_pe(self, timeframe: str, limit: int = 25):
+    def shiller_pe(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SHILLER_PE_RATIO / API.
 
         Shiller PE ratio for the S&P 500. Price earnings ratio is based on average
@@ -27,6 +27,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -40,9 +44,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def dividend(self, timeframe: str, limit: int = 25):
+    def dividend(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_DIV / API.
 
         12-month real dividend per share (inflation adjusted).
@@ -54,6 +60,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -67,9 +77,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def earnings(self, timeframe: str, limit: int = 25):
+    def earnings(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_EARNINGS / API.
 
         S&P 500 Earnings Per Share. 12-month real earnings per share (inflation adjusted).
@@ -82,6 +94,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -95,9 +111,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def inflation_adjusted(self, timeframe: str, limit: int = 25):
+    def inflation_adjusted(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_INFLADJ / API.
 
         Inflation adjusted, constant September, 2022 dollars. Other than the current price,
@@ -110,6 +128,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -123,9 +145,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def dividend_yield(self, timeframe: str, limit: int = 25):
+    def dividend_yield(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_DIV_YIELD / API.
 
         S&P 500 dividend yield (12 month dividend per share)/price. Yields are
@@ -140,6 +164,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -153,9 +181,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def earnings_yield(self, timeframe: str, limit: int = 25):
+    def earnings_yield(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_EARNINGS_YIELD / API.
 
         S&P 500 Earnings Yield. Earnings Yield = trailing 12 month earnings divided
@@ -168,6 +198,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -181,9 +215,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def dividend_growth(self, timeframe: str, limit: int = 25):
+    def dividend_growth(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_DIV_YIELD / API.
 
         S&P 500 dividend growth rate per year. Annual current dollars percentage
@@ -198,6 +234,10 @@ class SP500Ratios(NasdaqReader):
             Either 'quarter' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -211,9 +251,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def earnings_growth(self, timeframe: str, limit: int = 25):
+    def earnings_growth(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_EARNINGS_GROWTH / API.
 
         S&P 500 earnings growth rate per year. Annual current dollars percentage change
@@ -225,6 +267,10 @@ class SP500Ratios(NasdaqReader):
             Either 'quarter' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -238,9 +284,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def book_value_per_share(self, timeframe: str, limit: int = 25):
+    def book_value_per_share(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_BVPS / API.
 
         S&P 500 book value per share non-inflation adjusted current dollars.
@@ -252,6 +300,10 @@ class SP500Ratios(NasdaqReader):
             Either 'quarter' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -265,9 +317,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def price_to_book_value(self, timeframe: str, limit: int = 25):
+    def price_to_book_value(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_PBV_RATIO / API.
 
         S&P 500 price to book value ratio. Current price to book ratio is estimated
@@ -280,6 +334,10 @@ class SP500Ratios(NasdaqReader):
             Either 'quarter' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -293,9 +351,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def price_to_earnings(self, timeframe: str, limit: int = 25):
+    def price_to_earnings(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_PE_RATIO / API.
 
         Price to earnings ratio, based on trailing twelve month as reported earnings.
@@ -309,6 +369,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -322,9 +386,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def price_to_sales(self, timeframe: str, limit: int = 25):
+    def price_to_sales(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_PSR_RATIO / API.
 
         S&P 500 Price to Sales Ratio (P/S or Price to Revenue). Current price to
@@ -337,6 +403,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -350,9 +420,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def real_earnings_growth(self, timeframe: str, limit: int = 25):
+    def real_earnings_growth(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_REAL_EARNINGS_GROWTH / API.
 
         S&P 500 real earnings growth rate per year. Annual percentage change in 12 month
@@ -364,6 +436,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -377,9 +453,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def sales(self, timeframe: str, limit: int = 25):
+    def sales(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_SALES / API.
 
         Trailing twelve month S&P 500 Sales Per Share (S&P 500 Revenue Per Share)
@@ -391,6 +469,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -404,9 +486,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def real_sales(self, timeframe: str, limit: int = 25):
+    def real_sales(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_REAL_SALES / API.
 
         Trailing twelve month S&P 500 Sales Per Share (S&P 500 Revenue Per Share)
@@ -418,6 +502,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -431,9 +519,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def sales_growth(self, timeframe: str, limit: int = 25):
+    def sales_growth(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_SALES_GROWTH / API.
 
         S&P 500 sales growth rate per year. Annual percentage change in
@@ -445,6 +535,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -458,9 +552,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def real_sales_growth(self, timeframe: str, limit: int = 25):
+    def real_sales_growth(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_REAL_SALES_GROWTH / API.
 
         S&P 500 real sales growth rate per year. Annual percentage change in 12 month
@@ -472,6 +568,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -485,9 +585,11 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
 
-    def real_price(self, timeframe: str, limit: int = 25):
+    def real_price(self, timeframe: str, limit: int = 25, columns: list[str] | None = None, **options):
         """Query Nasdaq / MULTPL/SP500_REAL_PRICE / API.
 
         S&P 500 historical prices. Prices are not inflation-adjusted. For inflation-adjusted
@@ -501,6 +603,10 @@ class SP500Ratios(NasdaqReader):
             Either 'month' or 'year'.
         limit : default = 25
             Number of rows to return
+        columns : default = None
+            Names of the columns to return (all columns if None)
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -514,4 +620,6 @@ class SP500Ratios(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            columns=columns,
+            **options,
         )
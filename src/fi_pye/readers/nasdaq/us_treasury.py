@@ -14,7 +14,7 @@ class USTreasury(NasdaqReader):
     - Treasury Real Yield Curve Rates
 
     """
-    def tbill_rates(self, limit: int = 25):
+    def tbill_rates(self, limit: int = 25, **options):
         """Query Nasdaq / USTREASURY/BILLRATES / API.
 
         Return daily Treasury Bill (TBILL) rates for the last x days.
@@ -23,6 +23,8 @@ class USTreasury(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -36,9 +38,10 @@ class USTreasury(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            **options,
         )
 
-    def yield_curve(self, limit: int = 25):
+    def yield_curve(self, limit: int = 25, **options):
         """Query Nasdaq / USTREASURY/YIELD / API.
 
         Return daily Treasury Yield Curve Rates for the last x days.
@@ -47,6 +50,8 @@ class USTreasury(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -60,9 +65,10 @@ class USTreasury(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            **options,
         )
 
-    def real_yield_curve(self, limit: int = 25):
+    def real_yield_curve(self, limit: int = 25, **options):
         """Query Nasdaq / USTREASURY/REALYIELD / API.
 
         Return daily Treasury Par Real Yield Curve Rates for the last x days.
@@ -79,6 +85,8 @@ class USTreasury(NasdaqReader):
         ----------
         limit : default = 25
             Number of rows to return
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -92,9 +100,10 @@ class USTreasury(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            **options,
         )
 
-    def treasury_yield(self, duration: str, limit: int = 25):
+    def treasury_yield(self, duration: str, limit: int = 25, **options):
         """Query Nasdaq / USTREASURY/YIELD / API.
 
         Return daily Treasury Yield Curve Rates for the last x days (by duration).
@@ -108,6 +117,8 @@ class USTreasury(NasdaqReader):
             )
         limit : default = 25
             Number of rows to return
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -132,9 +143,10 @@ class USTreasury(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            **options,
         )
 
-    def treasury_real_yield(self, duration: str, limit: int = 25):
+    def treasury_real_yield(self, duration: str, limit: int = 25, **options):
         """Query Nasdaq / USTREASURY/REALYIELD / API.
 
         Return daily Treasury Real Yield Curve Rates for the last x days (by duration).
@@ -145,6 +157,8 @@ class USTreasury(NasdaqReader):
             Duration of Treasury ('5yr', '7yr', '10yr', '20yr' or '30yr')
         limit : default = 25
             Number of rows to return
+        options :
+            Optional 'collapse', 'transform', 'start_date', 'end_date' and 'order' query options
 
         Return
         -------
@@ -166,4 +180,5 @@ class USTreasury(NasdaqReader):
                 "rows": _validate_limit(limit),
                 "api_key": self.apikey
             },
+            **options,
         )
@@ -1,4 +1,9 @@
+import json
+import os
 import pandas as pd
+from functools import partial
+
+STORE_MANIFEST = "_store.json"  # Download sequence and dataset column names of a stored database.
 
 
 def _validate_limit(limit):
@@ -9,6 +14,15 @@ def _validate_limit(limit):
     return limit
 
 
+def _validate_format(value: str):
+    """ """
+    valid_values = ["json", "csv"]
+    if value not in valid_values:
+        raise ValueError(f"Invalid format: {value}. Valid formats include: {valid_values}. ")
+
+    return value
+
+
 def _validate_timeframe(value: str, quarterly: bool = False):
     """ """
     if quarterly:
@@ -22,6 +36,48 @@ def _validate_timeframe(value: str, quarterly: bool = False):
     return value
 
 
+VALID_DATASET_OPTIONS = {
+    "collapse": ["none", "daily", "weekly", "monthly", "quarterly", "annual"],
+    "transform": ["none", "diff", "rdiff", "rdiff_from", "cumul", "normalize"],
+    "order": ["asc", "desc"],
+}
+
+
+def _validate_dataset_options(options):
+    """
+    Validates the 'collapse', 'transform', 'start_date', 'end_date' and
+    'order' dataset query options, returning them as request params.
+    """
+    valid_keys = [*VALID_DATASET_OPTIONS, "start_date", "end_date"]
+    for key in options:
+        if key not in valid_keys:
+            raise ValueError(f"Invalid dataset option: {key}. Valid dataset options include: {valid_keys}. ")
+
+    out = {}
+    for key, valid_values in VALID_DATASET_OPTIONS.items():
+        value = options.get(key)
+        if value is None:
+            continue
+
+        if value not in valid_values:
+            raise ValueError(f"Invalid {key}: {value}. Valid {key} values include: {valid_values}. ")
+
+        out[key] = value
+
+    start, end = options.get("start_date"), options.get("end_date")
+    if start is not None or end is not None:
+        # A missing bound is validated against the other one, so it can't fail the order check.
+        start, end = _validate_dates(start or end, end or start)
+
+        if options.get("start_date") is not None:
+            out["start_date"] = start.strftime("%Y-%m-%d")
+
+        if options.get("end_date") is not None:
+            out["end_date"] = end.strftime("%Y-%m-%d")
+
+    return out
+
+
 def _validate_dates(start, end):
     """ """
     try:
@@ -34,3 +90,142 @@ def _validate_dates(start, end):
         raise ValueError("start date must be earlier than end date.")
 
     return start, end
+
+
+def _format_datatable_filters(filters):
+    """
+    Format datatable row filters into request params. List values
+    are joined with commas, which the API treats as 'any of'.
+    """
+    if filters is None:
+        return {}
+
+    if not isinstance(filters, dict):
+        raise TypeError(f"Invalid filters: {filters} with type: {type(filters)}. filters must be of type: dict. ")
+
+    return {
+        key: ",".join(str(v) for v in value) if isinstance(value, (list, tuple)) else value
+        for key, value in filters.items()
+    }
+
+
+def _concat_pages(pages, url, service):
+    """Concatenate DataFrame pages, raising an IOError if they contain no rows."""
+    out = pd.concat(list(pages), ignore_index=True)
+
+    if len(out) == 0:
+        raise IOError(
+            f"Request from: {service} returned no data; check if URL is invalid. "
+            f"Request url: {url} ."
+        )
+
+    return out
+
+
+def _resolve_column_indexes(columns, column_names):
+    """
+    Map column names to the 'column_index' values used by the API, given
+    the dataset's 'column_names' (the first of which is always the date).
+    Names are matched case-insensitively.
+    """
+    if not isinstance(columns, list) or len(columns) == 0:
+        raise TypeError(f"Invalid columns: {columns}. columns must be a non-empty list of column names. ")
+
+    lookup = {name.lower(): i for i, name in enumerate(column_names) if i > 0}
+    column_indexes = []
+    for column in columns:
+        if not isinstance(column, str) or column.lower() not in lookup:
+            raise ValueError(f"Invalid column: {column}. Valid columns include: {column_names[1:]}. ")
+
+        column_indexes.append(lookup[column.lower()])
+
+    return column_indexes
+
+
+def _merge_on_date(frames):
+    """
+    Outer join DataFrames whose first column (or index) is the date into a single
+    DataFrame, sorted by date (newest first) like the API responses.
+    """
+    if isinstance(frames[0].index, pd.DatetimeIndex):  # 'csv' format frames are indexed by date.
+        return pd.concat(frames, axis=1, join="outer").sort_index(ascending=False)
+
+    date = frames[0].columns[0]
+    out = pd.concat([frame.set_index(frame.columns[0]) for frame in frames], axis=1, join="outer")
+    out.index.name = date
+
+    return out.sort_index(ascending=False).reset_index()
+
+
+def _series_label(series):
+    """Label used for the columns of a series passed to 'NasdaqReader.multi_series'."""
+    if isinstance(series, str):
+        return series.upper()
+
+    if isinstance(series, partial):
+        return "_".join([series.func.__name__, *[str(arg) for arg in series.args]])
+
+    if callable(series):
+        return series.__name__
+
+    raise TypeError(
+        f"Invalid series: {series} with type: {type(series)}. "
+        "series must be a dataset code (str) or a reader method. "
+    )
+
+
+def _validate_series(series):
+    """Split the 'series' passed to 'NasdaqReader.multi_series' into (labels, series)."""
+    if isinstance(series, dict):
+        labels, series = list(series.keys()), list(series.values())
+    elif isinstance(series, list):
+        labels = [_series_label(item) for item in series]
+    else:
+        raise TypeError(f"Invalid series: {series} with type: {type(series)}. series must be of type list or dict. ")
+
+    if len(series) == 0:
+        raise ValueError("At least one series is needed.")
+
+    return labels, series
+
+
+def _label_columns(frame, label):
+    """
+    Rename the value columns of a series DataFrame so they stay unique once
+    joined with other series; single column series take the label as name.
+    """
+    value_columns = list(frame.columns if isinstance(frame.index, pd.DatetimeIndex) else frame.columns[1:])
+
+    if len(value_columns) == 1:
+        mapping = {value_columns[0]: label}
+    else:
+        mapping = {column: f"{label} - {column}" for column in value_columns}
+
+    return frame.rename(columns=mapping)
+
+
+def _read_manifest(directory):
+    """ """
+    try:
+        with open(os.path.join(directory, STORE_MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"sequence": -1, "column_names": {}}
+
+
+def _write_manifest(directory, manifest):
+    """Write the manifest of a stored database (atomically, so readers never see half of it)."""
+    path = os.path.join(directory, STORE_MANIFEST)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(manifest, f)
+
+    os.replace(f"{path}.tmp", path)
+
+
+def _move_partitions(source, destination):
+    """Move the files of the Parquet dataset 'source' into the dataset 'destination'."""
+    for root, _, files in os.walk(source):
+        directory = os.path.join(destination, os.path.relpath(root, source))
+        os.makedirs(directory, exist_ok=True)
+        for name in files:
+            os.replace(os.path.join(root, name), os.path.join(directory, name))
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import time
+
+from collections import deque
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter allowing at most 'calls' requests per 'period' seconds.
+
+    Each request reserves the earliest slot that keeps every sliding window
+    of 'period' seconds under 'calls' requests, then waits for it; readers
+    sharing a limiter (across threads, or coroutines with 'aacquire') share
+    the provider's quota.
+
+    Examples
+    --------
+    >>> limiter = RateLimiter(calls=1000, period=60 * 60) # SerpApi hourly throughput
+    >>> maps = GMaps(apikey="abc123", rate_limiter=limiter)
+    """
+    __slots__ = "calls", "period", "_slots", "_lock"
+
+    def __init__(self, calls: int, period: float = 1.0):
+        """
+        Parameters
+        ----------
+        calls :
+            Maximum number of requests per period.
+        period : default = 1.0
+            Length of the period in seconds.
+        """
+        if not isinstance(calls, int) or calls < 1:
+            raise ValueError(f"Invalid calls: {calls}. calls must be a positive int. ")
+
+        if period <= 0:
+            raise ValueError(f"Invalid period: {period}. period must be positive. ")
+
+        self.calls = calls
+        self.period = period
+        self._slots = deque(maxlen=calls)
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve the next request slot, returning the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = now
+            if len(self._slots) == self.calls:
+                slot = max(now, self._slots[0] + self.period)
+
+            self._slots.append(slot)
+
+        return slot - now
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        """Wait (without blocking the event loop) until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import logging
+import pandas as pd
+import aiohttp
+
+from typing import Union
+
+from fi_pye.readers.aio import AsyncReaderMixin, _init_async_session
+from fi_pye.readers.circuit_breaker import CircuitBreaker
+from fi_pye.readers.timeouts import TimeoutPolicy
+from fi_pye.readers.rate_limit import RateLimiter
+from .cache import SerpApiCache
+from .reader import SerpApiReader
+from .google.jobs import GJobs
+from .google.maps import GMaps
+from .google.trends import GTrends
+from .utils import (
+    _RegionScan,
+    _batch_trends_keywords,
+    _normalize_trends_batches,
+    validate_google_map_zoom,
+)
+
+
+class AsyncSerpApiReader(AsyncReaderMixin, SerpApiReader):
+    """
+    asyncio version of SerpApiReader.
+
+    The methods of the async readers (Ex. AsyncGTrends.interest_over_time)
+    have the same names and arguments as the blocking ones, but return
+    coroutines. Pass the same session (see fi_pye.readers.aio.create_session)
+    to several readers to share one connection pool and concurrency limit.
+    """
+    __slots__ = ()
+
+    def __init__(
+            self,
+            apikey: str,
+            session: aiohttp.ClientSession | None = None,
+            cache: SerpApiCache | None = None,
+            rate_limiter: RateLimiter | None = None,
+            circuit_breaker: CircuitBreaker | None = None,
+            timeouts: TimeoutPolicy | None = None,
+    ):
+        """Create instantiation of async reader used to obtain data from SerpApi API.
+
+        Parameters
+        ----------
+        apikey :
+            SerpApi API token.
+        session : default = None
+            aiohttp ClientSession, shared with other async readers.
+        cache : default = None
+            Persistent response cache (see SerpApiReader).
+        rate_limiter : default = None
+            Limiter every search (that misses the cache) waits on.
+        circuit_breaker : default = None
+            Circuit breaker (usually shared between readers) that makes
+            searches of failing engines fail fast.
+        timeouts : default = None
+            Per endpoint (and optionally adaptive) request timeouts; defaults
+            to (CONNECTION_TIMEOUT, READ_TIMEOUT) for every endpoint.
+        """
+        if not apikey or not isinstance(apikey, str):
+            raise ValueError("SerpApi api key needed.")
+
+        self.apikey = apikey
+        self.session = _init_async_session(session)  # Initialize session.
+        self.headers = None
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.timeouts = timeouts
+
+    async def data(self, params: dict[str, Union[str, int]], key: str):
+        """Coroutine to obtain data from the SerpApi API endpoints (see SerpApiReader.data)."""
+        r = await self._search(params)
+        try:
+            d = r[key]
+        except KeyError as key_error:
+            logging.error(f"Key error: {key_error}. ")
+        else:
+            return pd.DataFrame(d)
+
+    async def paginate(
+            self,
+            params: dict[str, Union[str, int]],
+            key: str,
+            page_size: int,
+            offset_param: str | None = None,
+            max_results: int | None = None,
+            prefetch: int = 2,
+    ):
+        """Async generator following the pages of a SerpApi search (see SerpApiReader.paginate)."""
+        if max_results is not None and (not isinstance(max_results, int) or max_results < 1):
+            raise ValueError(f"Invalid max_results: {max_results}. max_results must be a positive int. ")
+
+        remaining = max_results
+        pages = self._offset_pages if offset_param is not None else self._token_pages
+        async for rows in pages(params, key, page_size, offset_param, max_results, prefetch):
+            if remaining is not None:
+                rows = rows[:remaining]
+                remaining -= len(rows)
+
+            yield pd.DataFrame(rows)
+
+            if remaining == 0:
+                break
+
+    async def _offset_pages(self, params, key, page_size, offset_param, max_results, prefetch):
+        """ """
+        last_page = None if max_results is None else -(-max_results // page_size)
+        page = 0
+        while last_page is None or page < last_page:
+            count = prefetch if last_page is None else min(prefetch, last_page - page)
+            responses = await asyncio.gather(*[
+                self._search({**params, offset_param: (page + i) * page_size}) for i in range(count)
+            ])
+            page += count
+
+            for r in responses:
+                rows = r.get(key, [])
+                if len(rows) > 0:
+                    yield rows
+
+                if len(rows) < page_size:
+                    return
+
+    async def _token_pages(self, params, key, page_size, offset_param, max_results, prefetch):
+        """ """
+        fetched = 0
+        task = asyncio.ensure_future(self._search(params))
+        while task is not None:
+            r = await task
+            rows = r.get(key, [])
+            fetched += len(rows)
+
+            token = r.get("serpapi_pagination", {}).get("next_page_token")
+            if len(rows) == 0 or token is None or (max_results is not None and fetched >= max_results):
+                task = None
+            else:
+                task = asyncio.ensure_future(self._search({**params, "next_page_token": token}))
+
+            if len(rows) > 0:
+                yield rows
+
+    async def _search(self, params):
+        """Return the json response of a search, from the cache when possible."""
+        if self.cache is not None:
+            out = self.cache.get(params)
+            if out is not None:
+                return out
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+
+        out = json.loads(await self._fetch(url="https://serpapi.com/search.json", params=params))
+
+        if self.cache is not None and "error" not in out:
+            self.cache.set(params, out)
+
+        return out
+
+
+class AsyncGJobs(AsyncSerpApiReader, GJobs):
+    """asyncio version of GJobs."""
+    __slots__ = ()
+
+
+class AsyncGMaps(AsyncSerpApiReader, GMaps):
+    """asyncio version of GMaps."""
+    __slots__ = ()
+
+    async def scan_region(
+            self,
+            query: str,
+            south: float,
+            west: float,
+            north: float,
+            east: float,
+            zoom: int = 14,
+            max_zoom: int = 18,
+            max_workers: int = 4,
+            viewport_px: int = 1024,
+    ):
+        """Local results of a whole bounding box, at most 'max_workers' searches at a time (see GMaps.scan_region)."""
+        scan = _RegionScan(
+            south, west, north, east,
+            max_zoom=validate_google_map_zoom(max_zoom),
+            page_size=20,
+            viewport_px=viewport_px,
+        )
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def search(tile):
+            async with semaphore:
+                return tile, await self._search(self._tile_params(query, tile))
+
+        pending = {asyncio.ensure_future(search(tile)) for tile in scan.tiles(validate_google_map_zoom(zoom))}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                tile, r = task.result()
+                for child in scan.add(tile, r):
+                    pending.add(asyncio.ensure_future(search(child)))
+
+        return scan.to_frame()
+
+
+class AsyncGTrends(AsyncSerpApiReader, GTrends):
+    """asyncio version of GTrends."""
+    __slots__ = ()
+
+    async def interest_over_time_batch(
+            self,
+            keywords: list[str],
+            anchor: str,
+            date: str | None = None,
+            geo: str | None = None,
+    ):
+        """Interest over time of many keywords, on one comparable scale (see GTrends.interest_over_time_batch)."""
+        batches = _batch_trends_keywords(keywords, anchor)
+        responses = await asyncio.gather(*[self._search(params) for params in self._trends_batch_params(batches, date, geo)])
+
+        return _normalize_trends_batches(responses, batches, anchor)
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import pandas as pd
+
+from typing import Union
+
+# Seconds a cached response stays fresh, by SerpApi engine.
+DEFAULT_TTLS = {
+    "google_trends": 12 * 60 * 60,
+    "google_jobs": 6 * 60 * 60,
+    "google_maps": 24 * 60 * 60,
+    "google_maps_reviews": 24 * 60 * 60,
+    "google_maps_photos": 7 * 24 * 60 * 60,
+}
+DEFAULT_TTL = 60 * 60
+
+
+def _cache_key(params: dict[str, Union[str, int]]) -> str:
+    """Key a search by its params, without the 'api_key' (so keys can be rotated)."""
+    params = {k: v for k, v in params.items() if k != "api_key"}
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class SerpApiCache:
+    """
+    Persistent cache of SerpApi search responses.
+
+    Every SerpApi search spends a paid credit, so responses are stored
+    (zlib compressed) in a SQLite database and identical searches are
+    answered from it until their engine's TTL runs out. The cache counts
+    hits and misses per engine; each hit is a credit saved.
+
+    Examples
+    --------
+    >>> cache = SerpApiCache(ttls={"google_trends": 24 * 60 * 60})
+    >>> trends = GTrends(apikey="abc123", cache=cache)
+    >>>
+    >>> data = trends.interest_over_time("coffee") # Spends a credit
+    >>> data = trends.interest_over_time("coffee") # Read from the cache
+    >>> cache.stats()
+    """
+    __slots__ = "path", "ttls", "default_ttl", "_connection", "_lock"
+
+    def __init__(
+            self,
+            path: str | None = None,
+            ttls: dict[str, int] | None = None,
+            default_ttl: int = DEFAULT_TTL,
+    ):
+        """
+        Parameters
+        ----------
+        path : default = None
+            SQLite database file. Defaults to '~/.cache/fi_pye/serpapi.sqlite'.
+        ttls : default = None
+            Seconds a response stays fresh, by engine (merged over DEFAULT_TTLS).
+        default_ttl : default = 3600
+            Seconds a response stays fresh for engines missing from 'ttls'.
+        """
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".cache", "fi_pye", "serpapi.sqlite")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, engine TEXT, created REAL, body BLOB)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS stats "
+                "(engine TEXT PRIMARY KEY, hits INTEGER DEFAULT 0, misses INTEGER DEFAULT 0)"
+            )
+
+    def get(self, params: dict[str, Union[str, int]]) -> dict | None:
+        """Return the cached response of a search, or None if it's missing or stale."""
+        engine = params.get("engine")
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT created, body FROM responses WHERE key = ?", (_cache_key(params),)
+            ).fetchone()
+
+            fresh = row is not None and time.time() - row[0] < self.ttls.get(engine, self.default_ttl)
+            self._count(engine, "hits" if fresh else "misses")
+
+        if fresh:
+            return json.loads(zlib.decompress(row[1]))
+
+        return None
+
+    def set(self, params: dict[str, Union[str, int]], response: dict):
+        """Store the response of a search."""
+        body = zlib.compress(json.dumps(response).encode())
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, engine, created, body) VALUES (?, ?, ?, ?)",
+                (_cache_key(params), params.get("engine"), time.time(), body),
+            )
+
+    def purge(self):
+        """Delete stale responses."""
+        with self._lock, self._connection:
+            for engine, in self._connection.execute("SELECT DISTINCT engine FROM responses").fetchall():
+                self._connection.execute(
+                    "DELETE FROM responses WHERE engine IS ? AND created < ?",
+                    (engine, time.time() - self.ttls.get(engine, self.default_ttl)),
+                )
+
+    def stats(self) -> pd.DataFrame:
+        """
+        Return the hits, misses and credits saved by the cache, by engine.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT engine, hits, misses FROM stats ORDER BY engine").fetchall()
+
+        out = pd.DataFrame(rows, columns=["engine", "hits", "misses"])
+        out["credits_saved"] = out["hits"]
+
+        return out
+
+    def close(self):
+        """Close the SQLite connection."""
+        self._connection.close()
+
+    def _count(self, engine, column):
+        """ """
+        with self._connection:
+            self._connection.execute("INSERT OR IGNORE INTO stats (engine) VALUES (?)", (engine,))
+            self._connection.execute(f"UPDATE stats SET {column} = {column} + 1 WHERE engine IS ?", (engine,))
@@ -14,3 +14,16 @@ class GJobs(SerpApiReader):
             },
             key='jobs_results',
         )
+
+    def job_listing_pages(self, query: str, max_results: int | None = None):
+        """Generator of job listings (DataFrame per page), following 'next_page_token'."""
+        return self.paginate(
+            params={
+                "engine": "google_jobs",
+                "q": query,
+                "api_key": self.apikey,
+            },
+            key='jobs_results',
+            page_size=10,
+            max_results=max_results,
+        )
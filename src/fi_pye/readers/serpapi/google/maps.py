@@ -1,4 +1,7 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 from fi_pye.readers.serpapi.reader import SerpApiReader
+from fi_pye.readers.serpapi.utils import _RegionScan, validate_google_map_zoom
 
 
 class GMaps(SerpApiReader):
@@ -42,3 +45,116 @@ class GMaps(SerpApiReader):
             key='reviews',
         )
 
+    def local_result_pages(self, query: str, lat: float, lon: float, zoom: int = 14,
+                           max_results: int | None = None, prefetch: int = 2):
+        """Generator of local results (DataFrame per page), following 'start' offsets.
+
+        zoom :
+            Map zoom value. This can be any value between 3 (fully zoomed out) and 21 (fully zoomed in).
+        prefetch :
+            Number of pages requested concurrently.
+        """
+        return self.paginate(
+            params={
+                "engine": "google_maps",
+                "q": query,
+                "ll": f"@{lat},{lon},{zoom}z",
+                "type": "search",
+                "api_key": self.apikey,
+            },
+            key='local_results',
+            page_size=20,
+            offset_param="start",
+            max_results=max_results,
+            prefetch=prefetch,
+        )
+
+    def review_pages(self, data_id: str, max_results: int | None = None):
+        """Generator of reviews (DataFrame per page), following 'next_page_token'."""
+        return self.paginate(
+            params={
+                "engine": "google_maps_reviews",
+                "data_id": data_id,
+                "api_key": self.apikey,
+            },
+            key='reviews',
+            page_size=20,
+            max_results=max_results,
+        )
+
+    def scan_region(
+            self,
+            query: str,
+            south: float,
+            west: float,
+            north: float,
+            east: float,
+            zoom: int = 14,
+            max_zoom: int = 18,
+            max_workers: int = 4,
+            viewport_px: int = 1024,
+    ):
+        """Local results of a whole bounding box.
+
+        The box is tiled into a grid of viewports sized for 'zoom', which are
+        queried concurrently. A tile whose results fill a page (so places may
+        be missing) is refined into four tiles one zoom level deeper, down to
+        'max_zoom'. Places are de-duplicated by 'place_id' / 'data_id', and
+        places outside the box are dropped.
+
+        Tiles whose search returns an error (Ex. an exhausted plan) are
+        logged and skipped; their (lat, lon, zoom) centers are listed in
+        the 'failed_tiles' entry of the returned frame's 'attrs', so they
+        can be searched again (Ex. with GMaps.local_results).
+
+        Parameters
+        ----------
+        query :
+            Search query (Ex. 'coffee').
+        south, west, north, east :
+            Bounding box, in degrees.
+        zoom : default = 14
+            Map zoom value of the initial grid (3-21).
+        max_zoom : default = 18
+            Deepest zoom value tiles are refined to (3-21).
+        max_workers : default = 4
+            Maximum number of concurrent requests.
+        viewport_px : default = 1024
+            Side of the (square) map viewport, in pixels.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        scan = _RegionScan(
+            south, west, north, east,
+            max_zoom=validate_google_map_zoom(max_zoom),
+            page_size=20,
+            viewport_px=viewport_px,
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self._search, self._tile_params(query, tile)): tile
+                           for tile in scan.tiles(validate_google_map_zoom(zoom))}
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        tile = futures.pop(future)
+                        for child in scan.add(tile, future.result()):
+                            futures[executor.submit(self._search, self._tile_params(query, child))] = child
+        finally:
+            self.close()
+
+        return scan.to_frame()
+
+    def _tile_params(self, query, tile):
+        """ """
+        lat, lon, zoom = tile
+        return {
+            "engine": "google_maps",
+            "q": query,
+            "ll": f"@{lat:.6f},{lon:.6f},{zoom}z",
+            "type": "search",
+            "api_key": self.apikey,
+        }
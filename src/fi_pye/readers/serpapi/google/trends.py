@@ -1,4 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from fi_pye.readers.serpapi.reader import SerpApiReader
+from fi_pye.readers.serpapi.utils import _batch_trends_keywords, _normalize_trends_batches
 
 
 class GTrends(SerpApiReader):
@@ -14,3 +17,59 @@ class GTrends(SerpApiReader):
             },
             key='interest_over_time',
         )
+
+    def interest_over_time_batch(
+            self,
+            keywords: list[str],
+            anchor: str,
+            date: str | None = None,
+            geo: str | None = None,
+            max_workers: int = 4,
+    ):
+        """Interest over time of many keywords, on one comparable scale.
+
+        Keywords are packed 4 at a time into 5 term requests that all include
+        the 'anchor' term; the requests run concurrently and each batch is
+        rescaled through the anchor, so every column shares one 0-100 scale.
+        Pick an anchor with steady, moderate interest.
+
+        Parameters
+        ----------
+        keywords :
+            List of search terms.
+        anchor :
+            Search term included in every request.
+        date : default = None
+            Google Trends date range (Ex. 'today 12-m').
+        geo : default = None
+            Google Trends location (Ex. 'US').
+        max_workers : default = 4
+            Maximum number of concurrent requests.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            Interest by date (index) and keyword (columns).
+        """
+        batches = _batch_trends_keywords(keywords, anchor)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(self._search, self._trends_batch_params(batches, date, geo)))
+        finally:
+            self.close()
+
+        return _normalize_trends_batches(responses, batches, anchor)
+
+    def _trends_batch_params(self, batches, date, geo):
+        """ """
+        return [
+            {
+                "engine": "google_trends",
+                "q": ",".join(batch),
+                "data_type": "TIMESERIES",
+                "date": date,
+                "geo": geo,
+                "api_key": self.apikey,
+            }
+            for batch in batches
+        ]
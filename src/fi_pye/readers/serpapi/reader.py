@@ -1,20 +1,33 @@
 import requests
 import logging
 import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 from fi_pye.readers.fmp.utils import (
-    CONNECTION_TIMEOUT,
-    READ_TIMEOUT,
     _init_session,
 )
 from fi_pye.readers.base import BaseReader
+from fi_pye.readers.circuit_breaker import CircuitBreaker
+from fi_pye.readers.timeouts import TimeoutPolicy
+from fi_pye.readers.rate_limit import RateLimiter
+from .cache import SerpApiCache
 
 
 class SerpApiReader(BaseReader):
-    __slots__ = "apikey", "session", "headers"
+    __slots__ = "apikey", "session", "headers", "cache", "rate_limiter", "circuit_breaker", "timeouts"
+    provider = "serpapi"
 
-    def __init__(self, apikey: str, session: requests.Session | None = None):
+    def __init__(
+            self,
+            apikey: str,
+            session: requests.Session | None = None,
+            cache: SerpApiCache | None = None,
+            rate_limiter: RateLimiter | None = None,
+            circuit_breaker: CircuitBreaker | None = None,
+            timeouts: TimeoutPolicy | None = None,
+    ):
         """Create instantiation of reader used to obtain data from SerpApi API.
 
         Parameters
@@ -23,6 +36,17 @@ class SerpApiReader(BaseReader):
             SerpApi API token.
         session : default = None
             requests Session.
+        cache : default = None
+            Persistent response cache; identical searches are answered
+            from it (without spending credits) until they go stale.
+        rate_limiter : default = None
+            Limiter every search (that misses the cache) waits on.
+        circuit_breaker : default = None
+            Circuit breaker (usually shared between readers) that makes
+            searches of failing engines fail fast.
+        timeouts : default = None
+            Per endpoint (and optionally adaptive) request timeouts; defaults
+            to (CONNECTION_TIMEOUT, READ_TIMEOUT) for every endpoint.
         """
         if not apikey or not isinstance(apikey, str):
             raise ValueError("SerpApi api key needed.")
@@ -30,6 +54,10 @@ class SerpApiReader(BaseReader):
         self.apikey = apikey
         self.session = _init_session(session)  # Initialize session.
         self.headers = None
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.timeouts = timeouts
 
     def close(self):
         """Close requests session."""
@@ -49,7 +77,7 @@ class SerpApiReader(BaseReader):
             pandas.Dataframe
         """
         try:
-            r = self._get_data(url="https://serpapi.com/search.json", params=params).json()
+            r = self._search(params)
             d = r[key]
         except KeyError as key_error:
             logging.error(f"Key error: {key_error}. ")
@@ -58,12 +86,135 @@ class SerpApiReader(BaseReader):
         finally:
             self.close()
 
+    def paginate(
+            self,
+            params: dict[str, Union[str, int]],
+            key: str,
+            page_size: int,
+            offset_param: str | None = None,
+            max_results: int | None = None,
+            prefetch: int = 2,
+    ):
+        """Generator following the pages of a SerpApi search.
+
+        Offset paged searches (Ex. 'start' for Google Maps) request up to
+        'prefetch' pages concurrently; token paged searches (Ex. Google Jobs
+        'next_page_token') request the next page while the current one is
+        being consumed. Each page is yielded as a DataFrame as soon as it
+        arrives, until the results run out or 'max_results' is reached.
+
+        Parameters
+        ----------
+        params :
+            Dictionary of parameters used for the first request.
+        key :
+            Key of the results in the response (Ex. 'local_results').
+        page_size :
+            Number of results in a full page.
+        offset_param : default = None
+            Name of the offset param, or None to follow 'next_page_token'.
+        max_results : default = None
+            Maximum number of results to yield.
+        prefetch : default = 2
+            Number of offset pages requested concurrently. Pages requested
+            past the last one spend credits, so keep this small.
+
+        Yields
+        ------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        if max_results is not None and (not isinstance(max_results, int) or max_results < 1):
+            raise ValueError(f"Invalid max_results: {max_results}. max_results must be a positive int. ")
+
+        pages = self._offset_pages if offset_param is not None else self._token_pages
+        try:
+            remaining = max_results
+            for rows in pages(params, key, page_size, offset_param, max_results, prefetch):
+                if remaining is not None:
+                    rows = rows[:remaining]
+                    remaining -= len(rows)
+
+                yield pd.DataFrame(rows)
+
+                if remaining == 0:
+                    break
+        finally:
+            self.close()
+
+    def _offset_pages(self, params, key, page_size, offset_param, max_results, prefetch):
+        """ """
+        last_page = None if max_results is None else -(-max_results // page_size)
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            futures, page = deque(), 0
+
+            def submit():
+                nonlocal page
+                if last_page is None or page < last_page:
+                    futures.append(executor.submit(self._search, {**params, offset_param: page * page_size}))
+                    page += 1
+
+            for _ in range(prefetch):
+                submit()
+
+            while futures:
+                rows = futures.popleft().result().get(key, [])
+                if len(rows) > 0:
+                    yield rows
+
+                if len(rows) < page_size:
+                    for future in futures:
+                        future.cancel()
+                    break
+
+                submit()
+
+    def _token_pages(self, params, key, page_size, offset_param, max_results, prefetch):
+        """ """
+        fetched = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._search, params)
+            while future is not None:
+                r = future.result()
+                rows = r.get(key, [])
+                fetched += len(rows)
+
+                token = r.get("serpapi_pagination", {}).get("next_page_token")
+                if len(rows) == 0 or token is None or (max_results is not None and fetched >= max_results):
+                    future = None
+                else:
+                    future = executor.submit(self._search, {**params, "next_page_token": token})
+
+                if len(rows) > 0:
+                    yield rows
+
+    def _search(self, params):
+        """Return the json response of a search, from the cache when possible."""
+        if self.cache is not None:
+            out = self.cache.get(params)
+            if out is not None:
+                return out
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        out = self._get_data(url="https://serpapi.com/search.json", params=params).json()
+
+        if self.cache is not None and "error" not in out:
+            self.cache.set(params, out)
+
+        return out
+
+    def _endpoint_prefix(self, url, params):
+        """Searches are tracked by engine (Ex. 'google_maps')."""
+        return (params or {}).get("engine", "search")
+
     def _get_data(self, url, params=None, headers=None):
         """ """
         headers = headers or self.headers
-        response = self.session.get(
-            url=url, params=params, headers=headers, timeout=(CONNECTION_TIMEOUT, READ_TIMEOUT)
-        )
+        response = self._send(url, params, lambda timeout: self.session.get(
+            url=url, params=params, headers=headers, timeout=timeout
+        ))
 
         if response.status_code == requests.codes.ok:
             return response
@@ -1,3 +1,11 @@
+import logging
+import math
+import pandas as pd
+
+# Google Trends compares at most 5 terms per request.
+MAX_TRENDS_TERMS = 5
+# Error SerpApi returns for a search without results (which isn't a failure).
+NO_RESULTS_ERROR = "hasn't returned any results"
 
 
 def validate_google_map_zoom(value: int) -> int | None:
@@ -9,3 +17,169 @@ def validate_google_map_zoom(value: int) -> int | None:
         raise ValueError(f"Invalid zoom: {value}. Zoom value must be between 3-21.")
 
     return value
+
+
+def _batch_trends_keywords(keywords: list[str], anchor: str) -> list[list[str]]:
+    """
+    Pack keywords into Google Trends queries of at most 5 terms, each of
+    which starts with the shared anchor term.
+    """
+    if not isinstance(keywords, list) or len(keywords) == 0:
+        raise TypeError(f"Invalid keywords: {keywords}. keywords must be a non-empty list of strings. ")
+
+    for keyword in [anchor, *keywords]:
+        if not isinstance(keyword, str) or "," in keyword:
+            raise ValueError(f"Invalid keyword: {keyword}. Keywords must be strings without commas. ")
+
+    keywords = [k for k in dict.fromkeys(keywords) if k != anchor]
+    size = MAX_TRENDS_TERMS - 1
+
+    return [[anchor, *keywords[i:i + size]] for i in range(0, len(keywords), size)] or [[anchor]]
+
+
+def _parse_trends_timeline(response: dict) -> pd.DataFrame:
+    """Parse a Google Trends 'interest_over_time' response into a wide DataFrame indexed by date."""
+    timeline = response.get("interest_over_time", {}).get("timeline_data", [])
+
+    return pd.DataFrame(
+        [{v["query"]: v.get("extracted_value") for v in point["values"]} for point in timeline],
+        index=pd.to_datetime([int(point["timestamp"]) for point in timeline], unit="s"),
+    ).rename_axis("date")
+
+
+def _normalize_trends_batches(responses, batches, anchor: str) -> pd.DataFrame:
+    """
+    Rescale Google Trends batches so they're comparable with each other.
+
+    Scores are only relative within a request, so every batch is scaled by
+    the ratio of the anchor's total interest in the first batch to its total
+    in that batch. The joined frame is then rescaled so its maximum is 100.
+    """
+    frames = [_parse_trends_timeline(r).reindex(columns=batch) for r, batch in zip(responses, batches)]
+    reference = frames[0][anchor].sum()
+
+    scaled = []
+    for frame, batch in zip(frames, batches):
+        total = frame[anchor].sum()
+        if total == 0 or pd.isna(total):
+            logging.error(f"Anchor: {anchor} has no interest in batch: {batch}; it can't be rescaled. ")
+            frame = frame.astype(float) * float("nan")
+        else:
+            frame = frame.astype(float) * (reference / total)
+
+        scaled.append(frame if not scaled else frame.drop(columns=anchor))
+
+    out = pd.concat(scaled, axis=1)
+    peak = out.max().max()
+
+    return out * (100 / peak) if peak > 0 else out
+
+
+def _viewport_span(lat: float, zoom: int, viewport_px: int) -> tuple[float, float]:
+    """(latitude, longitude) degrees covered by a square Google Maps viewport (web mercator)."""
+    lon_span = viewport_px * 360 / (256 * 2 ** zoom)
+    return lon_span * math.cos(math.radians(lat)), lon_span
+
+
+def _place_key(place):
+    """
+    Key a GMaps place is de-duplicated by: its 'place_id' / 'data_id', else
+    its title and coordinates; None (never de-duplicated) without either.
+    """
+    key = place.get("place_id") or place.get("data_id")
+    if key is not None:
+        return key
+
+    gps = place.get("gps_coordinates") or {}
+    if place.get("title") is None and not gps:
+        return None
+
+    return place.get("title"), place.get("address"), gps.get("latitude"), gps.get("longitude")
+
+
+class _RegionScan:
+    """
+    Book-keeping of a GMaps region scan: the tiles covering the region,
+    the places found so far (de-duplicated by '_place_key'), the finer
+    tiles that replace a tile whose results hit the page cap and the tiles
+    whose search failed.
+    """
+    __slots__ = (
+        "south", "west", "north", "east", "max_zoom", "page_size", "viewport_px", "seen", "places", "failed"
+    )
+
+    def __init__(self, south, west, north, east, max_zoom, page_size, viewport_px):
+        if not (-90 <= south < north <= 90) or not (-180 <= west < east <= 180):
+            raise ValueError(
+                f"Invalid bounding box: south={south}, west={west}, north={north}, east={east}. "
+                "south / west must be smaller than north / east. "
+            )
+
+        self.south, self.west, self.north, self.east = south, west, north, east
+        self.max_zoom = max_zoom
+        self.page_size = page_size
+        self.viewport_px = viewport_px
+        self.seen = set()
+        self.places = []
+        self.failed = []
+
+    def tiles(self, zoom: int) -> list[tuple[float, float, int]]:
+        """(lat, lon, zoom) centers of a grid of viewports covering the region."""
+        tiles = []
+        lat = self.south
+        while lat < self.north:
+            lat_span, lon_span = _viewport_span(lat, zoom, self.viewport_px)
+            lon = self.west
+            while lon < self.east:
+                tiles.append((lat + lat_span / 2, lon + lon_span / 2, zoom))
+                lon += lon_span
+            lat += lat_span
+
+        return tiles
+
+    def add(self, tile, response: dict) -> list[tuple[float, float, int]]:
+        """
+        Record the search response of a tile, returning the tiles to refine
+        it into (if it saturated). A tile whose search returned an error
+        (other than finding no results) is logged and kept in 'failed'.
+        """
+        error = response.get("error")
+        if error is not None and NO_RESULTS_ERROR not in error:
+            logging.error(f"Tile: {tile} of the region scan failed with error: '{error}'. ")
+            self.failed.append(tile)
+            return []
+
+        results = response.get("local_results", [])
+        for place in results:
+            key = _place_key(place)
+            if key in self.seen or not self._inside(place):
+                continue
+
+            if key is not None:
+                self.seen.add(key)
+
+            self.places.append(place)
+
+        lat, lon, zoom = tile
+        if len(results) < self.page_size or zoom >= self.max_zoom:
+            return []
+
+        lat_span, lon_span = _viewport_span(lat, zoom, self.viewport_px)
+        return [
+            (lat + d_lat * lat_span / 4, lon + d_lon * lon_span / 4, zoom + 1)
+            for d_lat in (-1, 1) for d_lon in (-1, 1)
+        ]
+
+    def to_frame(self) -> pd.DataFrame:
+        """ """
+        out = pd.DataFrame(self.places)
+        out.attrs["failed_tiles"] = list(self.failed)
+        return out
+
+    def _inside(self, place):
+        """ """
+        gps = place.get("gps_coordinates")
+        if not gps:
+            return True
+
+        return self.south <= gps["latitude"] <= self.north and self.west <= gps["longitude"] <= self.east
@@ -0,0 +1,153 @@
+import threading
+import numpy as np
+import pandas as pd
+
+from collections import deque
+from typing import Union
+
+CONNECTION_TIMEOUT = 5
+READ_TIMEOUT = 30
+
+
+class TimeoutPolicy:
+    """
+    (connect, read) timeouts of reader requests, per endpoint prefix.
+
+    By default every endpoint gets (CONNECTION_TIMEOUT, READ_TIMEOUT).
+    'endpoints' overrides that for given endpoint prefixes (Ex. FMP 'quote'
+    or 'stock', Nasdaq 'datasets/ML', SerpApi 'google_maps'). In adaptive
+    mode, once an endpoint has 'min_samples' observed latencies, its read
+    timeout becomes 'multiplier' times their 'percentile', clamped to
+    [min_read, max_read]; fast endpoints then cut slow outliers quickly,
+    while large downloads keep the time they need.
+
+    Examples
+    --------
+    >>> timeouts = TimeoutPolicy(endpoints={"stock": 120, "quote": 3}, adaptive=True)
+    >>> symbols = Symbols(apikey="abc123", timeouts=timeouts)
+    >>> timeouts.latencies()
+    """
+    __slots__ = (
+        "connect", "read", "endpoints", "adaptive", "percentile", "multiplier",
+        "min_read", "max_read", "min_samples", "window", "_samples", "_lock",
+    )
+
+    def __init__(
+            self,
+            connect: float = CONNECTION_TIMEOUT,
+            read: float = READ_TIMEOUT,
+            endpoints: dict[str, Union[float, tuple[float, float]]] | None = None,
+            adaptive: bool = False,
+            percentile: float = 99,
+            multiplier: float = 3.0,
+            min_read: float = 1.0,
+            max_read: float = 4 * READ_TIMEOUT,
+            min_samples: int = 20,
+            window: int = 200,
+    ):
+        """
+        Parameters
+        ----------
+        connect : default = CONNECTION_TIMEOUT
+            Default connect timeout, in seconds.
+        read : default = READ_TIMEOUT
+            Default read timeout, in seconds.
+        endpoints : default = None
+            Read timeout, or (connect, read) timeouts, by endpoint prefix.
+        adaptive : default = False
+            Derive read timeouts from observed latencies.
+        percentile : default = 99
+            Latency percentile (0-100) adaptive read timeouts are based on.
+        multiplier : default = 3.0
+            Headroom applied to the latency percentile.
+        min_read, max_read : default = 1.0, 4 * READ_TIMEOUT
+            Bounds of adaptive read timeouts, in seconds.
+        min_samples : default = 20
+            Number of latencies observed before an endpoint's timeout adapts.
+        window : default = 200
+            Number of most recent latencies kept per endpoint.
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError(f"Invalid percentile: {percentile}. percentile must be in (0, 100]. ")
+
+        if not 0 < min_read <= max_read:
+            raise ValueError(f"Invalid bounds: min_read={min_read}, max_read={max_read}. Need 0 < min_read <= max_read. ")
+
+        self.connect = connect
+        self.read = read
+        self.endpoints = {
+            prefix: value if isinstance(value, tuple) else (connect, value)
+            for prefix, value in (endpoints or {}).items()
+        }
+        self.adaptive = adaptive
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_read = min_read
+        self.max_read = max_read
+        self.min_samples = min_samples
+        self.window = window
+        self._samples: dict[tuple[str, str], deque] = {}
+        self._lock = threading.Lock()
+
+    def timeout(self, provider: str, prefix: str) -> tuple[float, float]:
+        """(connect, read) timeouts of a request to (provider, prefix)."""
+        connect, read = self.endpoints.get(prefix, (self.connect, self.read))
+        if not self.adaptive:
+            return connect, read
+
+        with self._lock:
+            samples = self._samples.get((provider, prefix))
+            if samples is None or len(samples) < self.min_samples:
+                return connect, read
+
+            latency = np.percentile(samples, self.percentile)
+
+        return connect, float(min(max(self.multiplier * latency, self.min_read), self.max_read))
+
+    def observe(self, provider: str, prefix: str, seconds: float):
+        """Record the latency of a successful request to (provider, prefix)."""
+        if not self.adaptive:
+            return
+
+        with self._lock:
+            self._samples.setdefault((provider, prefix), deque(maxlen=self.window)).append(seconds)
+
+    def latency_percentile(self, provider: str, prefix: str, percentile: float) -> float | None:
+        """Percentile of the observed latencies of (provider, prefix), or None if there are none."""
+        with self._lock:
+            samples = self._samples.get((provider, prefix))
+            if not samples:
+                return None
+
+            return float(np.percentile(samples, percentile))
+
+    def latencies(self) -> pd.DataFrame:
+        """
+        Return the observed latency percentiles and the current read
+        timeout of every endpoint.
+
+        Return
+        -------
+        object : pandas.DataFrame
+            pandas.Dataframe
+        """
+        with self._lock:
+            samples = {key: list(values) for key, values in self._samples.items()}
+
+        rows = [
+            {
+                "provider": provider,
+                "prefix": prefix,
+                "samples": len(values),
+                "p50": np.percentile(values, 50),
+                "p90": np.percentile(values, 90),
+                "p99": np.percentile(values, 99),
+                "read_timeout": self.timeout(provider, prefix)[1],
+            }
+            for (provider, prefix), values in samples.items()
+        ]
+
+        return pd.DataFrame(rows, columns=["provider", "prefix", "samples", "p50", "p90", "p99", "read_timeout"])
+
+
+DEFAULT_TIMEOUTS = TimeoutPolicy()
@@ -0,0 +1,50 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fi_pye.readers.fmp.utils import _collect_bulk_chunks
+
+pytest.importorskip("pyarrow")
+
+CSV = """symbol,date,link,revenue
+AAPL,2022-09-24,,394328000000
+MSFT,2022-06-30,,198270000000
+NVDA,2023-01-29,https://www.sec.gov/nvda.htm,26974000000
+AMZN,2022-12-31,,
+"""
+
+
+def _chunks():
+    """Chunks of a bulk CSV, parsed like 'FmpReader.bulk_data' does."""
+    return pd.read_csv(io.StringIO(CSV), engine="c", chunksize=2)
+
+
+def test_chunks_infer_different_dtypes():
+    first, second = _chunks()
+
+    assert first["link"].dtype == np.float64
+    assert second["link"].dtype != np.float64
+    assert first["revenue"].dtype == np.int64
+    assert second["revenue"].dtype == np.float64
+
+
+def test_chunks_are_written_with_one_schema(tmp_path):
+    output = str(tmp_path / "bulk")
+    assert _collect_bulk_chunks(_chunks(), output=output) == output
+
+    out = pd.read_parquet(output).sort_values("date").reset_index(drop=True)
+
+    assert list(out["symbol"].astype(str)) == ["MSFT", "AAPL", "AMZN", "NVDA"]
+    assert out["link"].iloc[:3].isna().all()
+    assert out["link"].iloc[3] == "https://www.sec.gov/nvda.htm"
+    assert out["revenue"].iloc[:2].tolist() == [198270000000, 394328000000]
+    assert np.isnan(out["revenue"].iloc[2])
+
+
+def test_chunks_are_concatenated_without_output():
+    out = _collect_bulk_chunks(_chunks())
+
+    assert len(out) == 4
+    assert out["link"].notna().sum() == 1
@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from fi_pye.readers.fmp import Price
+from fi_pye.readers.fmp import price as price_module
+from fi_pye.readers.fmp.utils import _resample_intraday
+
+DAYS = ["2022-01-03", "2022-01-04"]
+
+
+def _bars(minutes: int) -> pd.DataFrame:
+    """Bars of 'minutes' of two sessions (9:30 - 16:00), newest first like the historical chart endpoint."""
+    dates = pd.DatetimeIndex(np.concatenate([
+        pd.date_range(f"{day} 09:30", f"{day} 16:00", freq=f"{minutes}min", inclusive="left") for day in DAYS
+    ]))
+    n = np.arange(len(dates), dtype=float)
+    bars = pd.DataFrame({
+        "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+        "open": 100 + n,
+        "low": 99 + n,
+        "high": 102 + n,
+        "close": 101 + n,
+        "volume": np.arange(1, len(dates) + 1) * 10,
+    })
+
+    return bars.iloc[::-1].reset_index(drop=True)
+
+
+def _expected(bars: pd.DataFrame, start: str, end: str) -> dict:
+    """OHLCV of the bars in [start, end)."""
+    dates = pd.to_datetime(bars["date"])
+    rows = bars[(dates >= start) & (dates < end)].assign(date=dates).sort_values("date")
+
+    return {
+        "open": rows["open"].iloc[0],
+        "low": rows["low"].min(),
+        "high": rows["high"].max(),
+        "close": rows["close"].iloc[-1],
+        "volume": rows["volume"].sum(),
+    }
+
+
+@pytest.mark.parametrize("source, timeframe, per_day", [
+    (1, "5m", 78), (1, "15m", 26), (1, "1h", 7), (1, "4h", 2), (5, "15m", 26), (5, "1h", 7), (5, "4h", 2),
+])
+def test_bar_count_and_order(source, timeframe, per_day):
+    out = _resample_intraday(_bars(source), timeframe)
+
+    assert list(out.columns) == ["date", "open", "low", "high", "close", "volume"]
+    assert len(out) == per_day * len(DAYS)
+    dates = pd.to_datetime(out["date"])
+    assert dates.is_monotonic_decreasing  # Newest first.
+
+
+@pytest.mark.parametrize("timeframe, starts", [
+    ("1h", ["09:30", "10:30", "11:30", "12:30", "13:30", "14:30", "15:30"]),
+    ("4h", ["09:30", "13:30"]),
+])
+def test_bars_aligned_to_session_open(timeframe, starts):
+    out = _resample_intraday(_bars(1), timeframe)
+    dates = pd.to_datetime(out["date"])
+
+    for day in DAYS:
+        assert sorted(dates[dates.dt.strftime("%Y-%m-%d") == day].dt.strftime("%H:%M")) == starts
+
+
+def test_session_open_argument():
+    out = _resample_intraday(_bars(1), "1h", session_open="09:00")
+
+    assert set(pd.to_datetime(out["date"]).dt.strftime("%H:%M")) == {f"{h:02d}:00" for h in range(9, 16)}
+
+
+@pytest.mark.parametrize("timeframe", ["5m", "15m", "1h", "4h"])
+def test_no_bar_crosses_a_day(timeframe):
+    bars = _bars(1)
+    out = _resample_intraday(bars, timeframe)
+    step = pd.Timedelta(minutes={"5m": 5, "15m": 15, "1h": 60, "4h": 240}[timeframe])
+
+    for start in pd.to_datetime(out["date"]):
+        members = pd.to_datetime(bars["date"])
+        members = members[(members >= start) & (members < start + step)]
+        assert members.dt.normalize().nunique() == 1
+
+    # The last (short) 4h / 1h bar of a session ends with that session.
+    first_day = pd.to_datetime(out["date"]).dt.strftime("%Y-%m-%d") == DAYS[0]
+    assert out.loc[first_day, "volume"].sum() == bars.iloc[len(bars) // 2:]["volume"].sum()
+
+
+@pytest.mark.parametrize("source, timeframe", [(1, "5m"), (1, "15m"), (1, "1h"), (1, "4h"), (5, "15m"), (5, "4h")])
+def test_ohlcv_aggregation(source, timeframe):
+    bars = _bars(source)
+    out = _resample_intraday(bars, timeframe)
+    step = pd.Timedelta(minutes={"5m": 5, "15m": 15, "1h": 60, "4h": 240}[timeframe])
+
+    for _, row in out.iterrows():
+        start = pd.Timestamp(row["date"])
+        assert row[["open", "low", "high", "close", "volume"]].to_dict() == _expected(bars, start, start + step)
+
+
+@pytest.mark.parametrize("timeframe, start, minutes", [("1h", "15:30", 30), ("4h", "13:30", 150)])
+def test_last_bar_of_a_session_is_partial(timeframe, start, minutes):
+    bars = _bars(1)
+    out = _resample_intraday(bars, timeframe)
+    last = out.iloc[0]
+
+    assert last["date"] == f"{DAYS[-1]} {start}:00"
+    assert last["volume"] == bars["volume"].iloc[:minutes].sum()
+    assert last["open"] == bars["open"].iloc[minutes - 1]
+    assert last["close"] == bars["close"].iloc[0]
+
+
+def test_resampling_from_5m_matches_resampling_from_1m():
+    one_minute = _bars(1)
+    five_minute = _resample_intraday(one_minute, "5m")
+
+    pd.testing.assert_frame_equal(_resample_intraday(five_minute, "1h"), _resample_intraday(one_minute, "1h"))
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class _FakeSession(requests.Session):
+    def __init__(self, bars):
+        super().__init__()
+        self.bars = bars
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return _FakeResponse(self.bars.to_dict("records"))
+
+
+def test_historical_price_resamples_cached_bars():
+    session = _FakeSession(_bars(1))
+    price = Price(apikey="abc123", session=session)
+
+    hourly = price.historical_price("AAPL", "1h", resample_from="1m")
+    quarterly = price.historical_price("AAPL", "15m", resample_from="1m")
+
+    assert session.calls == 1
+    pd.testing.assert_frame_equal(hourly, _resample_intraday(_bars(1), "1h"))
+    assert len(quarterly) == 26 * len(DAYS)
+
+
+def test_intraday_cache_is_per_reader_and_bounded(monkeypatch):
+    monkeypatch.setattr(price_module, "INTRADAY_CACHE_SIZE", 2)
+    first, second = _FakeSession(_bars(5)), _FakeSession(_bars(5))
+    first_price, second_price = Price(apikey="abc123", session=first), Price(apikey="def456", session=second)
+
+    first_price.historical_price("AAPL", "1h", resample_from="5m")
+    second_price.historical_price("AAPL", "1h", resample_from="5m")
+    assert (first.calls, second.calls) == (1, 1)
+
+    for symbol in ["MSFT", "NVDA", "AAPL"]:
+        first_price.historical_price(symbol, "1h", resample_from="5m")
+
+    assert first.calls == 4  # AAPL was evicted by MSFT and NVDA.
+    assert len(first_price._intraday_cache) == 2